@@ -6,8 +6,32 @@ from .battery_test import BatteryScanner
 from .network_test import NetworkScanner
 from .peripherals_test import PeripheralsScanner
 from .system_scanner import SystemScanner
+from .collector_engine import CollectorEngine
+from .monitor_agent import MonitorAgent, get_monitor_agent
+from .cpu_sampler import CPUSampler, get_cpu_sampler
+from .cpu_stress import CPUStressEngine, ThrottleDetector
+from .memory_bench import MemoryBenchmark
+from .memory_integrity import MemoryIntegrityTester
+from .disk_bench import DiskBenchmark
+from .disk_topology import DiskTopology, get_disk_topology
+from .disk_activity import DiskActivitySampler, get_disk_activity_sampler
+from .ping_engine import PingEngine
+from .throughput import ThroughputServer, ThroughputClient
+from .gpu_telemetry import GPUTelemetrySession, FakeGPUBackend, get_gpu_telemetry, set_gpu_telemetry_backend
+from .gpu_load import GPULoadGenerator, create_load_generator
+from .peripherals_sysfs import SysfsPeripherals, get_sysfs_peripherals
+from .inventory import HardwareInventory, get_hardware_inventory, diff_inventories
+from .battery_sysfs import SysfsBattery, get_sysfs_battery
 
 __all__ = [
     'CPUScanner', 'RAMScanner', 'DiskScanner', 'GPUScanner',
-    'BatteryScanner', 'NetworkScanner', 'PeripheralsScanner', 'SystemScanner'
+    'BatteryScanner', 'NetworkScanner', 'PeripheralsScanner', 'SystemScanner',
+    'CollectorEngine', 'MonitorAgent', 'get_monitor_agent', 'CPUSampler', 'get_cpu_sampler',
+    'CPUStressEngine', 'ThrottleDetector', 'MemoryBenchmark',
+    'MemoryIntegrityTester', 'DiskBenchmark', 'DiskTopology', 'get_disk_topology',
+    'DiskActivitySampler', 'get_disk_activity_sampler', 'PingEngine',
+    'ThroughputServer', 'ThroughputClient', 'GPUTelemetrySession', 'FakeGPUBackend',
+    'get_gpu_telemetry', 'set_gpu_telemetry_backend', 'GPULoadGenerator', 'create_load_generator',
+    'SysfsPeripherals', 'get_sysfs_peripherals', 'HardwareInventory', 'get_hardware_inventory',
+    'diff_inventories', 'SysfsBattery', 'get_sysfs_battery'
 ]
@@ -0,0 +1,214 @@
+import os
+import threading
+from typing import Dict, Any, Optional, List
+
+
+POWER_SUPPLY_ROOT = "/sys/class/power_supply"
+POWER_SUPPLY_ENV = "BATTERY_SYSFS_ROOT"
+UEVENT_PREFIX = "POWER_SUPPLY_"
+MICRO = 1_000_000
+READ_SIZE = 64
+
+
+class PowerSampler:
+    def __init__(self, battery_path: str):
+        self.battery_path = battery_path
+        self._fds: Dict[str, int] = {}
+
+    def open(self) -> bool:
+        for name in ("power_now", "current_now", "voltage_now"):
+            try:
+                self._fds[name] = os.open(os.path.join(self.battery_path, name), os.O_RDONLY)
+            except OSError:
+                continue
+        if "power_now" not in self._fds and not {"current_now", "voltage_now"} <= set(self._fds):
+            self.close()
+            return False
+        return self.read_watts() is not None
+
+    def _read(self, name: str) -> Optional[int]:
+        fd = self._fds.get(name)
+        if fd is None:
+            return None
+        try:
+            return abs(int(os.pread(fd, READ_SIZE, 0).strip()))
+        except (OSError, ValueError):
+            return None
+
+    def read_watts(self) -> Optional[float]:
+        power = self._read("power_now")
+        if power is not None:
+            return power / MICRO
+        current = self._read("current_now")
+        voltage = self._read("voltage_now")
+        if current is None or voltage is None:
+            return None
+        return current * voltage / MICRO ** 2
+
+    def close(self):
+        for fd in self._fds.values():
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._fds = {}
+
+    def __enter__(self) -> "PowerSampler":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class SysfsBattery:
+    def __init__(self, root: Optional[str] = None):
+        self.root = root or os.environ.get(POWER_SUPPLY_ENV) or POWER_SUPPLY_ROOT
+
+    @property
+    def available(self) -> bool:
+        return bool(self.batteries())
+
+    def batteries(self) -> List[str]:
+        return [
+            name for name in SysfsBattery._listdir(self.root)
+            if SysfsBattery._read(os.path.join(self.root, name, "type")) == "Battery"
+            and SysfsBattery._read(os.path.join(self.root, name, "scope")) != "Device"
+        ]
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.root, name)
+
+    def ac_online(self) -> Optional[bool]:
+        online = None
+        for name in SysfsBattery._listdir(self.root):
+            path = os.path.join(self.root, name)
+            if SysfsBattery._read(os.path.join(path, "type")) in ("Mains", "USB"):
+                value = SysfsBattery._read(os.path.join(path, "online"))
+                if value is not None:
+                    online = bool(online) or value == "1"
+        return online
+
+    def read(self, name: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        names = self.batteries()
+        if not names:
+            return None
+        name = name if name in names else names[0]
+        values = SysfsBattery._read_all(self.path(name))
+
+        voltage_now = SysfsBattery._scaled(values, "voltage_now")
+        voltage_design = SysfsBattery._scaled(values, "voltage_min_design") or voltage_now
+        energy_full = SysfsBattery._scaled(values, "energy_full")
+        energy_design = SysfsBattery._scaled(values, "energy_full_design")
+        energy_now = SysfsBattery._scaled(values, "energy_now")
+        power_now = SysfsBattery._scaled(values, "power_now")
+
+        if energy_full is None and voltage_design is not None:
+            charge_full = SysfsBattery._scaled(values, "charge_full")
+            charge_design = SysfsBattery._scaled(values, "charge_full_design")
+            charge_now = SysfsBattery._scaled(values, "charge_now")
+            energy_full = charge_full * voltage_design if charge_full is not None else None
+            energy_design = charge_design * voltage_design if charge_design is not None else None
+            energy_now = charge_now * voltage_design if charge_now is not None else None
+        if power_now is None and voltage_now is not None:
+            current_now = SysfsBattery._scaled(values, "current_now")
+            power_now = current_now * voltage_now if current_now is not None else None
+
+        percent = SysfsBattery._int(values, "capacity")
+        if percent is None and energy_now is not None and energy_full:
+            percent = min(energy_now / energy_full * 100, 100.0)
+        cycle_count = SysfsBattery._int(values, "cycle_count")
+
+        return {
+            "name": name,
+            "status": values.get("status"),
+            "present": values.get("present", "1") == "1",
+            "manufacturer": values.get("manufacturer"),
+            "model_name": values.get("model_name"),
+            "serial_number": values.get("serial_number"),
+            "technology": values.get("technology"),
+            "percent": float(percent) if percent is not None else None,
+            "energy_now_wh": SysfsBattery._round(energy_now, 2),
+            "energy_full_wh": SysfsBattery._round(energy_full, 2),
+            "energy_full_design_wh": SysfsBattery._round(energy_design, 2),
+            "health_percent": round(energy_full / energy_design * 100, 1) if energy_full and energy_design else None,
+            "power_now_w": SysfsBattery._round(power_now, 2),
+            "voltage_now_v": SysfsBattery._round(voltage_now, 3),
+            "voltage_min_design_v": SysfsBattery._round(voltage_design, 3),
+            "cycle_count": cycle_count if cycle_count else None
+        }
+
+    def power_sampler(self, name: Optional[str] = None) -> Optional[PowerSampler]:
+        names = self.batteries()
+        if not names:
+            return None
+        sampler = PowerSampler(self.path(name if name in names else names[0]))
+        return sampler if sampler.open() else None
+
+    @staticmethod
+    def _read_all(path: str) -> Dict[str, str]:
+        values = {}
+        uevent = SysfsBattery._read(os.path.join(path, "uevent"))
+        if uevent:
+            for line in uevent.splitlines():
+                key, _, value = line.partition("=")
+                if key.startswith(UEVENT_PREFIX) and value:
+                    values[key[len(UEVENT_PREFIX):].lower()] = value.strip()
+            if values:
+                return values
+
+        for entry in SysfsBattery._listdir(path):
+            value = SysfsBattery._read(os.path.join(path, entry))
+            if value is not None:
+                values[entry] = value
+        return values
+
+    @staticmethod
+    def _int(values: Dict[str, str], key: str) -> Optional[int]:
+        try:
+            return int(values[key])
+        except (KeyError, ValueError):
+            return None
+
+    @staticmethod
+    def _scaled(values: Dict[str, str], key: str) -> Optional[float]:
+        value = SysfsBattery._int(values, key)
+        return abs(value) / MICRO if value is not None else None
+
+    @staticmethod
+    def _round(value: Optional[float], digits: int) -> Optional[float]:
+        return round(value, digits) if value is not None else None
+
+    @staticmethod
+    def _listdir(path: str) -> List[str]:
+        try:
+            return sorted(os.listdir(path))
+        except OSError:
+            return []
+
+    @staticmethod
+    def _read(path: str) -> Optional[str]:
+        try:
+            with open(path) as f:
+                value = f.read().strip()
+                return value or None
+        except (OSError, UnicodeDecodeError):
+            return None
+
+
+_battery: Optional[SysfsBattery] = None
+_battery_lock = threading.Lock()
+
+
+def get_sysfs_battery() -> SysfsBattery:
+    global _battery
+    with _battery_lock:
+        if _battery is None:
+            _battery = SysfsBattery()
+        return _battery
+
+
+def set_sysfs_battery_root(root: Optional[str]) -> SysfsBattery:
+    global _battery
+    with _battery_lock:
+        _battery = SysfsBattery(root)
+        return _battery
@@ -1,12 +1,25 @@
 import psutil
 import time
-from typing import Dict, Any
+import threading
+import statistics
+from typing import Dict, Any, Optional, Callable, List
+
+from .battery_sysfs import PowerSampler, SysfsBattery, get_sysfs_battery
+
+
+DRAIN_SAMPLE_INTERVAL = 0.05
+DRAIN_PROGRESS_INTERVAL = 1.0
 
 
 class BatteryScanner:
     @staticmethod
     def get_battery_info() -> Dict[str, Any]:
         try:
+            sysfs = get_sysfs_battery()
+            reading = sysfs.read()
+            if reading is not None and reading["present"] and reading["percent"] is not None:
+                return BatteryScanner._info_from_sysfs(reading, sysfs.ac_online())
+            
             battery = psutil.sensors_battery()
             
             if battery is None:
@@ -17,27 +30,22 @@ class BatteryScanner:
                     "status": "Not detected - Desktop PC or no battery sensor"
                 }
             
-            time_left_formatted = None
-            if battery.secsleft != psutil.POWER_TIME_UNLIMITED and battery.secsleft > 0:
-                hours = battery.secsleft // 3600
-                minutes = (battery.secsleft % 3600) // 60
-                time_left_formatted = f"{int(hours)}h {int(minutes)}m"
-            
-            health_percent = BatteryScanner._estimate_battery_health(battery.percent, battery.power_plugged)
+            time_left_seconds = battery.secsleft if battery.secsleft != psutil.POWER_TIME_UNLIMITED and battery.secsleft > 0 else None
             
             battery_info = {
                 "detected": True,
                 "percent": round(battery.percent, 2),
                 "power_plugged": battery.power_plugged,
-                "time_left_seconds": battery.secsleft if battery.secsleft != psutil.POWER_TIME_UNLIMITED and battery.secsleft > 0 else None,
-                "time_left_formatted": time_left_formatted,
+                "time_left_seconds": time_left_seconds,
+                "time_left_formatted": BatteryScanner._format_time_left(time_left_seconds),
                 "capacity_max_wh": None,
                 "capacity_current_wh": None,
-                "health_percent": health_percent,
+                "health_percent": None,
                 "cycle_count": None,
                 "voltage": None,
+                "source": "psutil",
                 "status": BatteryScanner._get_status(battery.percent, battery.power_plugged),
-                "health_score": BatteryScanner._calculate_health_score(battery.percent, battery.power_plugged, health_percent)
+                "health_score": BatteryScanner._calculate_health_score(battery.percent, battery.power_plugged, None)
             }
             
             return battery_info
@@ -50,15 +58,51 @@ class BatteryScanner:
             }
     
     @staticmethod
-    def _estimate_battery_health(percent: float, power_plugged: bool) -> float:
-        base_health = 95.0
+    def _info_from_sysfs(reading: Dict[str, Any], ac_online: Optional[bool]) -> Dict[str, Any]:
+        percent = reading["percent"]
+        power_plugged = BatteryScanner._power_plugged(reading, ac_online)
+        power = reading["power_now_w"]
         
-        if percent < 80 and not power_plugged:
-            base_health = 90.0
-        elif percent < 50 and not power_plugged:
-            base_health = 85.0
+        time_left_seconds = None
+        if not power_plugged and power and reading["energy_now_wh"]:
+            time_left_seconds = int(reading["energy_now_wh"] / power * 3600)
         
-        return base_health
+        return {
+            "detected": True,
+            "percent": round(percent, 2),
+            "power_plugged": power_plugged,
+            "time_left_seconds": time_left_seconds,
+            "time_left_formatted": BatteryScanner._format_time_left(time_left_seconds),
+            "capacity_max_wh": reading["energy_full_wh"],
+            "capacity_design_wh": reading["energy_full_design_wh"],
+            "capacity_current_wh": reading["energy_now_wh"],
+            "health_percent": reading["health_percent"],
+            "cycle_count": reading["cycle_count"],
+            "voltage": reading["voltage_now_v"],
+            "power_draw_w": power,
+            "charge_status": reading["status"],
+            "manufacturer": reading["manufacturer"],
+            "model": reading["model_name"],
+            "serial_number": reading["serial_number"],
+            "technology": reading["technology"],
+            "source": "sysfs",
+            "status": BatteryScanner._get_status(percent, power_plugged),
+            "health_score": BatteryScanner._calculate_health_score(percent, power_plugged, reading["health_percent"])
+        }
+    
+    @staticmethod
+    def _power_plugged(reading: Dict[str, Any], ac_online: Optional[bool]) -> bool:
+        if ac_online is not None:
+            return ac_online
+        return reading["status"] in ("Charging", "Full", "Not charging")
+    
+    @staticmethod
+    def _format_time_left(seconds: Optional[int]) -> Optional[str]:
+        if not seconds:
+            return None
+        hours = seconds // 3600
+        minutes = (seconds % 3600) // 60
+        return f"{int(hours)}h {int(minutes)}m"
     
     @staticmethod
     def _get_status(percent: float, power_plugged: bool) -> str:
@@ -82,7 +126,7 @@ class BatteryScanner:
                 return "Good"
     
     @staticmethod
-    def _calculate_health_score(percent: float, power_plugged: bool, health_percent: float) -> int:
+    def _calculate_health_score(percent: float, power_plugged: bool, health_percent: Optional[float]) -> int:
         score = 100
         
         if not power_plugged:
@@ -93,16 +137,37 @@ class BatteryScanner:
             elif percent < 40:
                 score -= 15
         
-        if health_percent < 70:
-            score -= 30
-        elif health_percent < 85:
-            score -= 15
+        if health_percent is not None:
+            if health_percent < 70:
+                score -= 30
+            elif health_percent < 85:
+                score -= 15
         
         return max(0, score)
     
     @staticmethod
-    def perform_battery_drain_test(duration: int = 30) -> Dict[str, Any]:
+    def perform_battery_drain_test(
+        duration: int = 30,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        cancel_event: Optional[threading.Event] = None,
+        sample_interval: float = DRAIN_SAMPLE_INTERVAL
+    ) -> Dict[str, Any]:
         try:
+            sysfs = get_sysfs_battery()
+            reading = sysfs.read()
+            if reading is not None and reading["present"] and reading["percent"] is not None:
+                if BatteryScanner._power_plugged(reading, sysfs.ac_online()):
+                    return {
+                        "test_passed": False,
+                        "error": "Battery is currently charging - Please disconnect power adapter for accurate test"
+                    }
+                sampler = sysfs.power_sampler(reading["name"])
+                if sampler is not None:
+                    with sampler:
+                        return BatteryScanner._power_drain_test(
+                            sysfs, reading, sampler, duration, progress_callback, cancel_event, sample_interval
+                        )
+            
             battery = psutil.sensors_battery()
             
             if battery is None:
@@ -121,6 +186,7 @@ class BatteryScanner:
             
             initial_percent = battery.percent
             samples = []
+            cancelled = False
             
             start_time = time.time()
             
@@ -131,15 +197,25 @@ class BatteryScanner:
                         "timestamp": time.time() - start_time,
                         "percent": battery.percent
                     })
-                time.sleep(2)
+                    if progress_callback:
+                        progress_callback(samples[-1])
+                if cancel_event is not None:
+                    if cancel_event.wait(2):
+                        cancelled = True
+                        break
+                else:
+                    time.sleep(2)
             
+            elapsed = max(time.time() - start_time, 1e-6)
             final_percent = battery.percent
-            drain_rate = (initial_percent - final_percent) / (duration / 3600)
+            drain_rate = (initial_percent - final_percent) / (elapsed / 3600)
             
             estimated_time_remaining_hours = final_percent / drain_rate if drain_rate > 0 else 0
             
             return {
                 "test_passed": True,
+                "cancelled": cancelled,
+                "method": "percent_polling",
                 "duration_seconds": duration,
                 "initial_percent": round(initial_percent, 2),
                 "final_percent": round(final_percent, 2),
@@ -156,6 +232,94 @@ class BatteryScanner:
                 "error": str(e)
             }
     
+    @staticmethod
+    def _power_drain_test(
+        sysfs: SysfsBattery,
+        reading: Dict[str, Any],
+        sampler: PowerSampler,
+        duration: int,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]],
+        cancel_event: Optional[threading.Event],
+        sample_interval: float
+    ) -> Dict[str, Any]:
+        print(f"Starting battery drain test for {duration} seconds (power_now every {sample_interval}s)...")
+        
+        watts: List[float] = []
+        timeline = []
+        energy_wh = 0.0
+        sensor_updates = 0
+        last_power = None
+        last_at = None
+        cancelled = False
+        
+        start = time.perf_counter()
+        next_progress = DRAIN_PROGRESS_INTERVAL
+        while True:
+            now = time.perf_counter()
+            elapsed = now - start
+            if elapsed >= duration:
+                break
+            
+            power = sampler.read_watts()
+            if power is not None:
+                if last_power is not None:
+                    energy_wh += (power + last_power) / 2 * (now - last_at) / 3600
+                if power != last_power:
+                    sensor_updates += 1
+                watts.append(power)
+                last_power, last_at = power, now
+            
+            if elapsed >= next_progress and watts:
+                next_progress += DRAIN_PROGRESS_INTERVAL
+                timeline.append({
+                    "timestamp": round(elapsed, 2),
+                    "power_w": round(watts[-1], 3),
+                    "average_power_w": round(statistics.fmean(watts), 3)
+                })
+                if progress_callback:
+                    progress_callback(timeline[-1])
+            
+            if cancel_event is not None:
+                if cancel_event.wait(sample_interval):
+                    cancelled = True
+                    break
+            else:
+                time.sleep(sample_interval)
+        
+        elapsed = max(time.perf_counter() - start, 1e-6)
+        final = sysfs.read(reading["name"]) or reading
+        average = statistics.fmean(watts) if watts else None
+        capacity = reading["energy_full_wh"]
+        remaining = final["energy_now_wh"]
+        
+        if average and capacity:
+            drain_rate = average / capacity * 100
+        else:
+            drain_rate = (reading["percent"] - final["percent"]) / (elapsed / 3600)
+        
+        return {
+            "test_passed": True,
+            "cancelled": cancelled,
+            "method": "power_now",
+            "duration_seconds": duration,
+            "elapsed_seconds": round(elapsed, 2),
+            "initial_percent": round(reading["percent"], 2),
+            "final_percent": round(final["percent"], 2),
+            "drain_percent": round(reading["percent"] - final["percent"], 4),
+            "average_power_w": round(average, 3) if average is not None else None,
+            "min_power_w": round(min(watts), 3) if watts else None,
+            "max_power_w": round(max(watts), 3) if watts else None,
+            "power_stdev_w": round(statistics.pstdev(watts), 3) if watts else None,
+            "energy_used_wh": round(energy_wh, 4),
+            "drain_rate_percent_per_hour": round(drain_rate, 2),
+            "estimated_time_remaining_hours": round(remaining / average, 2) if average and remaining else 0,
+            "samples_collected": len(watts),
+            "sample_interval": sample_interval,
+            "sensor_updates": sensor_updates,
+            "timeline": timeline,
+            "performance_rating": BatteryScanner._get_drain_rating(drain_rate)
+        }
+    
     @staticmethod
     def _get_drain_rating(drain_rate: float) -> str:
         if drain_rate < 5:
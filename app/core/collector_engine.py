@@ -0,0 +1,115 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, Any, Callable, Optional, List
+
+
+class CollectorEngine:
+    def __init__(self, max_workers: Optional[int] = None, default_timeout: float = 15.0):
+        self.max_workers = max_workers
+        self.default_timeout = default_timeout
+        self._collectors: List[Dict[str, Any]] = []
+
+    def register(
+        self,
+        name: str,
+        func: Callable[[], Any],
+        timeout: Optional[float] = None,
+        fallback: Optional[Callable[[str], Any]] = None
+    ):
+        self._collectors.append({
+            "name": name,
+            "func": func,
+            "timeout": timeout if timeout is not None else self.default_timeout,
+            "fallback": fallback or CollectorEngine._default_fallback
+        })
+        return self
+
+    def run(self) -> Dict[str, Any]:
+        results = {}
+        timings = {}
+        timed_out = []
+        failed = []
+
+        if not self._collectors:
+            return {"results": results, "timings": timings, "timed_out": timed_out,
+                    "failed": failed, "total_ms": 0.0}
+
+        max_workers = self.max_workers or len(self._collectors)
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="collector")
+        start_time = time.perf_counter()
+
+        try:
+            futures = {}
+            for collector in self._collectors:
+                future = executor.submit(CollectorEngine._timed_call, collector["func"])
+                futures[future] = collector
+
+            pending = set(futures)
+            while pending:
+                now = time.perf_counter() - start_time
+                next_deadline = min(futures[f]["timeout"] for f in pending)
+                done, pending = wait(pending, timeout=max(0.0, next_deadline - now))
+
+                for future in done:
+                    collector = futures[future]
+                    name = collector["name"]
+                    value, error, started, finished = future.result()
+                    if error is None:
+                        results[name] = value
+                        timings[name] = {
+                            "status": "ok",
+                            "started_ms": round((started - start_time) * 1000, 2),
+                            "duration_ms": round((finished - started) * 1000, 2)
+                        }
+                    else:
+                        failed.append(name)
+                        results[name] = collector["fallback"](f"Error: {str(error)}")
+                        timings[name] = {
+                            "status": "error",
+                            "started_ms": round((started - start_time) * 1000, 2),
+                            "duration_ms": round((finished - started) * 1000, 2),
+                            "error": str(error)
+                        }
+
+                elapsed = time.perf_counter() - start_time
+                for future in list(pending):
+                    collector = futures[future]
+                    if elapsed >= collector["timeout"]:
+                        pending.discard(future)
+                        future.cancel()
+                        name = collector["name"]
+                        timed_out.append(name)
+                        results[name] = collector["fallback"](
+                            f"Timeout - collector did not finish within {collector['timeout']}s"
+                        )
+                        timings[name] = {
+                            "status": "timeout",
+                            "duration_ms": round(elapsed * 1000, 2),
+                            "timeout_seconds": collector["timeout"]
+                        }
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return {
+            "results": results,
+            "timings": timings,
+            "timed_out": timed_out,
+            "failed": failed,
+            "total_ms": round((time.perf_counter() - start_time) * 1000, 2)
+        }
+
+    @staticmethod
+    def _timed_call(func: Callable[[], Any]) -> tuple:
+        started = time.perf_counter()
+        try:
+            value = func()
+        except Exception as e:
+            return None, e, started, time.perf_counter()
+        return value, None, started, time.perf_counter()
+
+    @staticmethod
+    def _default_fallback(status: str) -> Dict[str, Any]:
+        return {
+            "detected": False,
+            "status": status
+        }
@@ -0,0 +1,98 @@
+import psutil
+import threading
+import time
+from typing import Dict, Any, Optional
+
+
+class CPUSampler:
+    def __init__(self, min_interval: float = 0.05):
+        self.min_interval = min_interval
+        self._previous: Optional[Dict[str, Any]] = None
+        self._last_result: Optional[Dict[str, Any]] = None
+        self._lock = threading.Lock()
+
+    def sample(self, window: Optional[float] = None) -> Dict[str, Any]:
+        if window:
+            start = CPUSampler._snapshot()
+            time.sleep(window)
+            current = CPUSampler._snapshot()
+            result = CPUSampler._compute(start, current)
+            with self._lock:
+                self._previous = current
+                self._last_result = result
+            return dict(result)
+
+        with self._lock:
+            current = CPUSampler._snapshot()
+            previous = self._previous
+            if (previous is not None and self._last_result is not None
+                    and current["monotonic"] - previous["monotonic"] < self.min_interval):
+                return dict(self._last_result)
+
+            result = CPUSampler._compute(previous, current)
+            self._previous = current
+            self._last_result = result
+            return dict(result)
+
+    @staticmethod
+    def _snapshot() -> Dict[str, Any]:
+        return {
+            "monotonic": time.monotonic(),
+            "cpu_times": psutil.cpu_times(),
+            "cpu_times_percpu": psutil.cpu_times(percpu=True)
+        }
+
+    @staticmethod
+    def _compute(previous: Optional[Dict[str, Any]], current: Dict[str, Any]) -> Dict[str, Any]:
+        if previous is None:
+            return {
+                "cpu_percent": CPUSampler.busy_percent(None, current["cpu_times"]),
+                "cpu_percent_per_core": [
+                    CPUSampler.busy_percent(None, after) for after in current["cpu_times_percpu"]
+                ],
+                "interval_seconds": None,
+                "source": "since_boot"
+            }
+
+        per_core_before = previous["cpu_times_percpu"]
+        per_core_after = current["cpu_times_percpu"]
+        if len(per_core_before) != len(per_core_after):
+            per_core_before = [None] * len(per_core_after)
+
+        return {
+            "cpu_percent": CPUSampler.busy_percent(previous["cpu_times"], current["cpu_times"]),
+            "cpu_percent_per_core": [
+                CPUSampler.busy_percent(before, after)
+                for before, after in zip(per_core_before, per_core_after)
+            ],
+            "interval_seconds": round(current["monotonic"] - previous["monotonic"], 3),
+            "source": "delta"
+        }
+
+    @staticmethod
+    def busy_percent(before, after) -> float:
+        total_after, idle_after = CPUSampler._totals(after)
+        total_before, idle_before = CPUSampler._totals(before) if before is not None else (0.0, 0.0)
+        total_delta = total_after - total_before
+        if total_delta <= 0:
+            return 0.0
+        busy_delta = total_delta - (idle_after - idle_before)
+        return round(max(0.0, min(100.0, busy_delta / total_delta * 100)), 2)
+
+    @staticmethod
+    def _totals(times) -> tuple:
+        total = sum(times) - getattr(times, "guest", 0) - getattr(times, "guest_nice", 0)
+        idle = times.idle + getattr(times, "iowait", 0)
+        return total, idle
+
+
+_sampler: Optional[CPUSampler] = None
+_sampler_lock = threading.Lock()
+
+
+def get_cpu_sampler() -> CPUSampler:
+    global _sampler
+    with _sampler_lock:
+        if _sampler is None:
+            _sampler = CPUSampler()
+        return _sampler
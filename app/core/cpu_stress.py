@@ -0,0 +1,392 @@
+import os
+import time
+import multiprocessing
+from typing import Dict, Any, Optional, List, Callable
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+FP_ARRAY_ELEMENTS = 16 * 1024
+INT_ARRAY_ELEMENTS = 16 * 1024
+MEMORY_SWEEP_BYTES = 32 * 1024 * 1024
+
+
+def _int_alu_kernel() -> Callable[[], int]:
+    if NUMPY_AVAILABLE:
+        values = np.arange(INT_ARRAY_ELEMENTS, dtype=np.uint64)
+        scratch = np.empty_like(values)
+        multiplier = np.uint64(6364136223846793005)
+        increment = np.uint64(1442695040888963407)
+        shift = np.uint64(29)
+
+        def chunk() -> int:
+            for _ in range(64):
+                np.multiply(values, multiplier, out=values)
+                np.add(values, increment, out=values)
+                np.right_shift(values, shift, out=scratch)
+                np.bitwise_xor(values, scratch, out=values)
+            return 64 * 4 * INT_ARRAY_ELEMENTS
+
+        return chunk
+
+    state = [12345]
+
+    def chunk() -> int:
+        x = state[0]
+        for _ in range(20000):
+            x = (x * 6364136223846793005 + 1442695040888963407) & 0xFFFFFFFFFFFFFFFF
+            x ^= x >> 29
+        state[0] = x
+        return 20000 * 4
+
+    return chunk
+
+
+def _fp_fma_kernel() -> Callable[[], int]:
+    if NUMPY_AVAILABLE:
+        a = np.linspace(0.5, 1.5, FP_ARRAY_ELEMENTS)
+        b = np.full(FP_ARRAY_ELEMENTS, 0.999999)
+        c = np.full(FP_ARRAY_ELEMENTS, 1e-7)
+
+        def chunk() -> int:
+            for _ in range(64):
+                np.multiply(a, b, out=a)
+                np.add(a, c, out=a)
+            return 64 * 2 * FP_ARRAY_ELEMENTS
+
+        return chunk
+
+    state = [1.0]
+
+    def chunk() -> int:
+        x = state[0]
+        for _ in range(20000):
+            x = x * 0.999999 + 1e-7
+        state[0] = x
+        return 20000 * 2
+
+    return chunk
+
+
+def _memory_bandwidth_kernel() -> Callable[[], int]:
+    source = bytearray(os.urandom(1024)) * (MEMORY_SWEEP_BYTES // 1024)
+    target = bytearray(MEMORY_SWEEP_BYTES)
+    source_view = memoryview(source)
+    target_view = memoryview(target)
+
+    def chunk() -> int:
+        target_view[:] = source_view
+        return 2 * MEMORY_SWEEP_BYTES
+
+    return chunk
+
+
+def _branchy_kernel() -> Callable[[], int]:
+    state = [27]
+
+    def chunk() -> int:
+        x = state[0]
+        taken = 0
+        for _ in range(20000):
+            if x & 1:
+                x = 3 * x + 1
+                taken += 1
+            else:
+                x >>= 1
+            if x <= 1:
+                x = 27 + taken % 1000
+        state[0] = x
+        return 20000
+
+    return chunk
+
+
+STRESS_KERNELS = {
+    "int_alu": {
+        "factory": _int_alu_kernel,
+        "unit": "int_ops",
+        "description": "64-bit integer multiply/add/shift/xor mix",
+        "vectorized": NUMPY_AVAILABLE
+    },
+    "fp_fma": {
+        "factory": _fp_fma_kernel,
+        "unit": "flops",
+        "description": "Multiply-add (separate multiply and add) over cache-resident float64 arrays",
+        "vectorized": NUMPY_AVAILABLE
+    },
+    "memory_bandwidth": {
+        "factory": _memory_bandwidth_kernel,
+        "unit": "bytes",
+        "description": "Sequential copy sweeps over buffers larger than the last-level cache",
+        "vectorized": True
+    },
+    "branchy": {
+        "factory": _branchy_kernel,
+        "unit": "branches",
+        "description": "Data-dependent branches (Collatz steps)",
+        "vectorized": False
+    },
+}
+
+
+def _stress_worker(index: int, kernel: str, core: Optional[int], duration: float,
+                   stop_event, ops_counters, elapsed_counters, pinned_flags):
+    if core is not None and hasattr(os, "sched_setaffinity"):
+        try:
+            os.sched_setaffinity(0, {core})
+            pinned_flags[index] = 1
+        except OSError:
+            pass
+
+    chunk = STRESS_KERNELS[kernel]["factory"]()
+    start = time.perf_counter()
+    deadline = start + duration
+    ops = 0
+
+    while not stop_event.is_set():
+        ops += chunk()
+        now = time.perf_counter()
+        ops_counters[index] = ops
+        elapsed_counters[index] = now - start
+        if now >= deadline:
+            break
+
+
+class CPUStressEngine:
+    def __init__(self, kernel: str = "fp_fma", workers: Optional[int] = None,
+                 pin_cores: bool = True, start_method: Optional[str] = None):
+        if kernel not in STRESS_KERNELS:
+            raise ValueError(f"Unknown stress kernel: {kernel}")
+
+        self.kernel = kernel
+        self.pin_cores = pin_cores and hasattr(os, "sched_setaffinity")
+        self.cores = CPUStressEngine.available_cores()
+        self.workers = workers or len(self.cores)
+        self._context = multiprocessing.get_context(start_method)
+        self._processes: List[multiprocessing.Process] = []
+        self._stop_event = None
+        self._ops = None
+        self._elapsed = None
+        self._pinned = None
+        self._started_at: Optional[float] = None
+        self._last_rate_point = None
+
+    @staticmethod
+    def available_cores() -> List[int]:
+        if hasattr(os, "sched_getaffinity"):
+            return sorted(os.sched_getaffinity(0))
+        return list(range(multiprocessing.cpu_count()))
+
+    @staticmethod
+    def list_kernels() -> Dict[str, Dict[str, Any]]:
+        return {
+            name: {
+                "unit": spec["unit"],
+                "description": spec["description"],
+                "vectorized": spec["vectorized"]
+            }
+            for name, spec in STRESS_KERNELS.items()
+        }
+
+    def start(self, duration: float):
+        self._stop_event = self._context.Event()
+        self._ops = self._context.RawArray("d", self.workers)
+        self._elapsed = self._context.RawArray("d", self.workers)
+        self._pinned = self._context.RawArray("b", self.workers)
+        self._started_at = time.perf_counter()
+        self._last_rate_point = (self._started_at, [0.0] * self.workers)
+
+        for index, core in enumerate(self.worker_cores()):
+            process = self._context.Process(
+                target=_stress_worker,
+                args=(index, self.kernel, core, duration, self._stop_event,
+                      self._ops, self._elapsed, self._pinned),
+                daemon=True
+            )
+            process.start()
+            self._processes.append(process)
+
+    def stop(self):
+        if self._stop_event is not None:
+            self._stop_event.set()
+
+    def is_alive(self) -> bool:
+        return any(process.is_alive() for process in self._processes)
+
+    def worker_cores(self) -> List[Optional[int]]:
+        return [
+            self.cores[index % len(self.cores)] if self.pin_cores else None
+            for index in range(self.workers)
+        ]
+
+    def current_worker_rates(self) -> List[float]:
+        now = time.perf_counter()
+        ops = list(self._ops) if self._ops is not None else [0.0] * self.workers
+        last_time, last_ops = self._last_rate_point
+        self._last_rate_point = (now, ops)
+        interval = now - last_time
+        if interval <= 0:
+            return [0.0] * self.workers
+        return [(current - previous) / interval for current, previous in zip(ops, last_ops)]
+
+    def current_ops_per_sec(self) -> float:
+        return sum(self.current_worker_rates())
+
+    def join(self, timeout: float = 10.0) -> Dict[str, Any]:
+        for process in self._processes:
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+
+        unit = STRESS_KERNELS[self.kernel]["unit"]
+        workers = []
+        for index, core in enumerate(self.worker_cores()):
+            elapsed = self._elapsed[index]
+            ops = self._ops[index]
+            workers.append({
+                "worker": index,
+                "core": core,
+                "pinned": bool(self._pinned[index]),
+                "ops": int(ops),
+                "elapsed_seconds": round(elapsed, 3),
+                "ops_per_sec": round(ops / elapsed, 2) if elapsed > 0 else 0.0
+            })
+
+        rates = [worker["ops_per_sec"] for worker in workers]
+        self._processes = []
+
+        return {
+            "kernel": self.kernel,
+            "unit": unit,
+            "vectorized": STRESS_KERNELS[self.kernel]["vectorized"],
+            "workers": workers,
+            "total_ops_per_sec": round(sum(rates), 2),
+            "min_worker_ops_per_sec": round(min(rates), 2) if rates else 0.0,
+            "max_worker_ops_per_sec": round(max(rates), 2) if rates else 0.0
+        }
+
+
+class ThrottleDetector:
+    DROP_THRESHOLD_PERCENT = 15.0
+    HOT_TEMPERATURE_CELSIUS = 80.0
+    CORRELATION_THRESHOLD = -0.5
+
+    @staticmethod
+    def analyze(timeline: List[Dict[str, Any]], max_frequency_mhz: Optional[float] = None) -> Dict[str, Any]:
+        samples = [sample for sample in timeline if sample.get("total_ops_per_sec")]
+        if len(samples) < 4:
+            return {
+                "verdict": "insufficient_data",
+                "samples_analyzed": len(samples),
+                "reasons": ["Not enough samples with throughput to analyze"]
+            }
+
+        window = max(1, len(samples) // 5)
+        head, tail = samples[:window], samples[-window:]
+
+        throughput = [sample["total_ops_per_sec"] for sample in samples]
+        throughput_decay = ThrottleDetector._drop_percent(
+            ThrottleDetector._mean([s["total_ops_per_sec"] for s in head]),
+            ThrottleDetector._mean([s["total_ops_per_sec"] for s in tail])
+        )
+
+        frequencies = [sample.get("frequency_avg_mhz") for sample in samples]
+        frequency_drop = None
+        frequency_below_max = None
+        if all(frequency for frequency in frequencies):
+            frequency_drop = ThrottleDetector._drop_percent(
+                ThrottleDetector._mean([s["frequency_avg_mhz"] for s in head]),
+                ThrottleDetector._mean([s["frequency_avg_mhz"] for s in tail])
+            )
+            if max_frequency_mhz:
+                frequency_below_max = ThrottleDetector._drop_percent(
+                    max_frequency_mhz, ThrottleDetector._mean([s["frequency_avg_mhz"] for s in tail])
+                )
+
+        core_decay = {}
+        per_core = [sample.get("per_worker_ops_per_sec") or [] for sample in samples]
+        if per_core and all(len(rates) == len(per_core[0]) for rates in per_core):
+            for index in range(len(per_core[0])):
+                core_decay[index] = ThrottleDetector._drop_percent(
+                    ThrottleDetector._mean([rates[index] for rates in per_core[:window]]),
+                    ThrottleDetector._mean([rates[index] for rates in per_core[-window:]])
+                )
+
+        temperatures = [sample.get("temperature_max_celsius") for sample in samples]
+        max_temperature = max((t for t in temperatures if t is not None), default=None)
+        correlation = None
+        if all(t is not None for t in temperatures):
+            correlation = ThrottleDetector._correlation(temperatures, throughput)
+            if frequency_drop is not None:
+                frequency_correlation = ThrottleDetector._correlation(temperatures, frequencies)
+                if frequency_correlation is not None and (correlation is None or frequency_correlation < correlation):
+                    correlation = frequency_correlation
+
+        reasons = []
+        degraded = False
+        if throughput_decay is not None and throughput_decay >= ThrottleDetector.DROP_THRESHOLD_PERCENT:
+            degraded = True
+            reasons.append(f"Throughput decayed {throughput_decay}% from start to end of the run")
+        if frequency_drop is not None and frequency_drop >= ThrottleDetector.DROP_THRESHOLD_PERCENT:
+            degraded = True
+            reasons.append(f"Average core frequency dropped {frequency_drop}% during the run")
+        slow_cores = [index for index, decay in core_decay.items()
+                      if decay is not None and decay >= ThrottleDetector.DROP_THRESHOLD_PERCENT]
+        if slow_cores:
+            reasons.append(f"Workers {slow_cores} lost at least {ThrottleDetector.DROP_THRESHOLD_PERCENT}% throughput")
+
+        thermal = (
+            (max_temperature is not None and max_temperature >= ThrottleDetector.HOT_TEMPERATURE_CELSIUS)
+            or (correlation is not None and correlation <= ThrottleDetector.CORRELATION_THRESHOLD)
+        )
+        if thermal and max_temperature is not None:
+            reasons.append(f"Temperature peaked at {max_temperature}°C"
+                           + (f" (correlation with throughput {correlation})" if correlation is not None else ""))
+
+        if degraded and thermal:
+            verdict = "thermal_throttling"
+        elif degraded:
+            verdict = "performance_degraded"
+        else:
+            verdict = "none"
+
+        return {
+            "verdict": verdict,
+            "samples_analyzed": len(samples),
+            "throughput_decay_percent": throughput_decay,
+            "frequency_drop_percent": frequency_drop,
+            "frequency_below_max_percent": frequency_below_max,
+            "per_worker_decay_percent": core_decay,
+            "max_temperature_celsius": max_temperature,
+            "temperature_throughput_correlation": correlation,
+            "reasons": reasons
+        }
+
+    @staticmethod
+    def _mean(values: List[float]) -> float:
+        return sum(values) / len(values) if values else 0.0
+
+    @staticmethod
+    def _drop_percent(baseline: float, current: float) -> Optional[float]:
+        if not baseline:
+            return None
+        return round((baseline - current) / baseline * 100, 2)
+
+    @staticmethod
+    def _correlation(xs: List[float], ys: List[float]) -> Optional[float]:
+        n = len(xs)
+        if n < 3:
+            return None
+        mean_x = sum(xs) / n
+        mean_y = sum(ys) / n
+        cov = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+        var_x = sum((x - mean_x) ** 2 for x in xs)
+        var_y = sum((y - mean_y) ** 2 for y in ys)
+        if var_x <= 0 or var_y <= 0:
+            return None
+        return round(cov / (var_x * var_y) ** 0.5, 3)
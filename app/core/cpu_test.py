@@ -1,18 +1,52 @@
 import psutil
 import platform
 import time
-import math
-import multiprocessing
-from typing import Dict, Any, Optional, List
+import threading
+from typing import Dict, Any, Optional, List, Callable
+from .monitor_agent import MonitorAgent, get_monitor_agent
+from .cpu_sampler import CPUSampler, get_cpu_sampler
+from .cpu_stress import CPUStressEngine, ThrottleDetector
+
+
+CPU_STATIC_FIELDS = (
+    "model", "architecture", "processor", "cores_physical", "cores_logical",
+    "frequency_max_mhz", "frequency_min_mhz", "processor_id"
+)
 
 
 class CPUScanner:
     @staticmethod
-    def get_cpu_info() -> Dict[str, Any]:
+    def get_cpu_static() -> Dict[str, Any]:
+        cpu_freq = psutil.cpu_freq()
+        processor_id = platform.processor()
+        return {
+            "model": processor_id if processor_id else "Unknown CPU",
+            "architecture": platform.machine(),
+            "processor": processor_id,
+            "cores_physical": psutil.cpu_count(logical=False),
+            "cores_logical": psutil.cpu_count(logical=True),
+            "frequency_max_mhz": round(cpu_freq.max, 2) if cpu_freq else None,
+            "frequency_min_mhz": round(cpu_freq.min, 2) if cpu_freq else None,
+            "processor_id": processor_id
+        }
+    
+    @staticmethod
+    def get_cpu_info(window: Optional[float] = None, static: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         try:
+            if static is None:
+                static = CPUScanner.get_cpu_static()
             cpu_freq = psutil.cpu_freq()
-            cpu_percent = psutil.cpu_percent(interval=1, percpu=False)
-            cpu_percent_per_core = psutil.cpu_percent(interval=0.5, percpu=True)
+            
+            agent_sample = get_monitor_agent().latest() if not window else None
+            if agent_sample and agent_sample.get("cpu_percent") is not None:
+                cpu_percent = agent_sample["cpu_percent"]
+                cpu_percent_per_core = agent_sample["cpu_percent_per_core"]
+                utilisation_source = "agent"
+            else:
+                utilisation = get_cpu_sampler().sample(window=window)
+                cpu_percent = utilisation["cpu_percent"]
+                cpu_percent_per_core = utilisation["cpu_percent_per_core"]
+                utilisation_source = "window" if window else utilisation["source"]
             
             temps = None
             try:
@@ -35,26 +69,25 @@ class CPUScanner:
                         if temperature is None:
                             temperature = entry.current
             
-            processor_id = platform.processor()
-            
             cpu_stats = psutil.cpu_stats()
             cpu_times = psutil.cpu_times()
             
             cpu_info = {
                 "detected": True,
-                "model": processor_id if processor_id else "Unknown CPU",
-                "architecture": platform.machine(),
-                "processor": platform.processor(),
-                "cores_physical": psutil.cpu_count(logical=False),
-                "cores_logical": psutil.cpu_count(logical=True),
+                "model": static["model"],
+                "architecture": static["architecture"],
+                "processor": static["processor"],
+                "cores_physical": static["cores_physical"],
+                "cores_logical": static["cores_logical"],
                 "frequency_current_mhz": round(cpu_freq.current, 2) if cpu_freq else None,
-                "frequency_max_mhz": round(cpu_freq.max, 2) if cpu_freq else None,
-                "frequency_min_mhz": round(cpu_freq.min, 2) if cpu_freq else None,
+                "frequency_max_mhz": static["frequency_max_mhz"],
+                "frequency_min_mhz": static["frequency_min_mhz"],
                 "cpu_percent_overall": round(cpu_percent, 2),
                 "cpu_percent_per_core": [round(p, 2) for p in cpu_percent_per_core],
+                "cpu_percent_source": utilisation_source,
                 "temperature_celsius": round(temperature, 2) if temperature else None,
                 "temperature_sensors": temp_sensors,
-                "processor_id": processor_id,
+                "processor_id": static["processor_id"],
                 "context_switches": cpu_stats.ctx_switches,
                 "interrupts": cpu_stats.interrupts,
                 "soft_interrupts": cpu_stats.soft_interrupts,
@@ -114,52 +147,88 @@ class CPUScanner:
         return max(0, score)
     
     @staticmethod
-    def perform_stress_test(duration: int = 5) -> Dict[str, Any]:
-        start_time = time.time()
+    def perform_stress_test(
+        duration: int = 5,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        cancel_event: Optional[threading.Event] = None,
+        kernel: str = "fp_fma",
+        workers: Optional[int] = None,
+        pin_cores: bool = True
+    ) -> Dict[str, Any]:
+        try:
+            engine = CPUStressEngine(kernel=kernel, workers=workers, pin_cores=pin_cores)
+        except ValueError as e:
+            return {
+                "test_passed": False,
+                "error": str(e)
+            }
+        
         results = []
         temp_results = []
+        timeline = []
+        cancelled = False
+        num_processes = engine.workers
         
-        def cpu_intensive_task():
-            end = time.time() + duration
-            while time.time() < end:
-                _ = [math.sqrt(i) * math.sin(i) for i in range(10000)]
+        print(f"Starting CPU stress test ({kernel}) with {num_processes} processes for {duration} seconds...")
         
-        num_processes = multiprocessing.cpu_count()
-        processes = []
-        
-        print(f"Starting CPU stress test with {num_processes} processes for {duration} seconds...")
+        start_time = time.time()
+        engine.start(duration)
         
-        for _ in range(num_processes):
-            p = multiprocessing.Process(target=cpu_intensive_task)
-            p.start()
-            processes.append(p)
+        agent = get_monitor_agent()
+        latest_sample = agent.latest()
+        last_seq = latest_sample["seq"] if latest_sample else 0
+        sampler = CPUSampler(min_interval=0)
+        sampler.sample()
         
         while time.time() - start_time < duration:
-            cpu_usage = psutil.cpu_percent(interval=0.1)
-            results.append(cpu_usage)
+            if cancel_event is not None and cancel_event.is_set():
+                cancelled = True
+                break
             
-            try:
-                if hasattr(psutil, "sensors_temperatures"):
-                    temps = psutil.sensors_temperatures()
-                    if temps:
-                        for name, entries in temps.items():
-                            if entries:
-                                temp_results.append(entries[0].current)
-                                break
-            except:
-                pass
+            agent_sample = None
+            if agent.is_running:
+                remaining = max(0.1, duration - (time.time() - start_time))
+                agent_sample = agent.wait_for_sample(last_seq, timeout=min(agent.interval * 2, remaining))
             
-            time.sleep(0.1)
+            if agent_sample is not None:
+                last_seq = agent_sample["seq"]
+                if agent_sample.get("cpu_percent") is None:
+                    continue
+                cpu_usage = agent_sample["cpu_percent"]
+            else:
+                time.sleep(0.2)
+                cpu_usage = sampler.sample()["cpu_percent"]
+            
+            sample = CPUScanner._stress_sample(engine, start_time, cpu_usage)
+            timeline.append(sample)
+            results.append(cpu_usage)
+            if sample["temperature_max_celsius"] is not None:
+                temp_results.append(sample["temperature_max_celsius"])
+            
+            if progress_callback:
+                progress_callback({
+                    "elapsed_seconds": sample["elapsed_seconds"],
+                    "cpu_percent": cpu_usage,
+                    "temperature_celsius": sample["temperature_max_celsius"],
+                    "ops_per_sec": sample["total_ops_per_sec"],
+                    "per_worker_ops_per_sec": sample["per_worker_ops_per_sec"],
+                    "frequency_avg_mhz": sample["frequency_avg_mhz"]
+                })
         
-        for p in processes:
-            p.terminate()
-            p.join()
+        engine.stop()
+        throughput = engine.join()
         
         avg_temp = round(sum(temp_results) / len(temp_results), 2) if temp_results else None
         max_temp = round(max(temp_results), 2) if temp_results else None
         
+        cpu_freq = psutil.cpu_freq()
+        throttling = ThrottleDetector.analyze(
+            timeline, max_frequency_mhz=cpu_freq.max if cpu_freq and cpu_freq.max else None
+        )
+        
         return {
             "test_passed": True,
+            "cancelled": cancelled,
             "duration_seconds": duration,
             "average_usage_percent": round(sum(results) / len(results), 2) if results else 0,
             "max_usage_percent": round(max(results), 2) if results else 0,
@@ -168,11 +237,42 @@ class CPUScanner:
             "max_temperature_celsius": max_temp,
             "processes_used": num_processes,
             "samples_collected": len(results),
+            "kernel": throughput["kernel"],
+            "ops_unit": throughput["unit"],
+            "vectorized": throughput["vectorized"],
+            "total_ops_per_sec": throughput["total_ops_per_sec"],
+            "per_worker": throughput["workers"],
+            "throttling": throttling,
+            "timeline": timeline,
             "performance_rating": CPUScanner._get_performance_rating(
                 round(sum(results) / len(results), 2) if results else 0
             )
         }
     
+    @staticmethod
+    def _stress_sample(engine: CPUStressEngine, start_time: float, cpu_usage: float) -> Dict[str, Any]:
+        worker_rates = engine.current_worker_rates()
+        
+        frequencies = []
+        try:
+            frequencies = [round(freq.current, 1) for freq in psutil.cpu_freq(percpu=True) or []]
+        except:
+            pass
+        
+        sensors = MonitorAgent.read_temperatures()["sensors"]
+        temperatures = [sensor["current"] for sensor in sensors]
+        
+        return {
+            "elapsed_seconds": round(time.time() - start_time, 2),
+            "cpu_percent": cpu_usage,
+            "total_ops_per_sec": round(sum(worker_rates), 2),
+            "per_worker_ops_per_sec": [round(rate, 2) for rate in worker_rates],
+            "frequency_per_core_mhz": frequencies,
+            "frequency_avg_mhz": round(sum(frequencies) / len(frequencies), 1) if frequencies else None,
+            "temperatures": sensors,
+            "temperature_max_celsius": max(temperatures) if temperatures else None
+        }
+    
     @staticmethod
     def _get_performance_rating(avg_usage: float) -> str:
         if avg_usage > 90:
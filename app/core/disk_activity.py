@@ -0,0 +1,101 @@
+import psutil
+import threading
+import time
+from typing import Dict, Any, Optional
+
+
+class DiskActivitySampler:
+    def __init__(self, min_interval: float = 0.5, bootstrap_window: float = 0.2, max_age: float = 5.0):
+        self.min_interval = min_interval
+        self.bootstrap_window = bootstrap_window
+        self.max_age = max_age
+        self._previous: Optional[Dict[str, Any]] = None
+        self._last_result: Optional[Dict[str, Any]] = None
+        self._lock = threading.Lock()
+
+    def sample(self, window: Optional[float] = None) -> Dict[str, Any]:
+        if window:
+            start = DiskActivitySampler._snapshot()
+            time.sleep(window)
+            current = DiskActivitySampler._snapshot()
+            result = DiskActivitySampler._compute(start, current)
+            with self._lock:
+                self._previous = current
+                self._last_result = result
+            return result
+
+        with self._lock:
+            current = DiskActivitySampler._snapshot()
+            previous = self._previous
+            if previous is None or current["monotonic"] - previous["monotonic"] > self.max_age:
+                time.sleep(self.bootstrap_window)
+                previous, current = current, DiskActivitySampler._snapshot()
+            elif self._last_result is not None and current["monotonic"] - previous["monotonic"] < self.min_interval:
+                return self._last_result
+
+            result = DiskActivitySampler._compute(previous, current)
+            self._previous = current
+            self._last_result = result
+            return result
+
+    @staticmethod
+    def _snapshot() -> Dict[str, Any]:
+        counters = {}
+        try:
+            if hasattr(psutil, "disk_io_counters"):
+                counters = psutil.disk_io_counters(perdisk=True, nowrap=True) or {}
+        except Exception:
+            counters = {}
+        return {
+            "monotonic": time.monotonic(),
+            "timestamp": time.time(),
+            "counters": counters
+        }
+
+    @staticmethod
+    def _compute(previous: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Any]:
+        elapsed = max(current["monotonic"] - previous["monotonic"], 1e-6)
+        devices = {}
+
+        for name, after in current["counters"].items():
+            before = previous["counters"].get(name)
+            if before is None:
+                continue
+
+            reads = after.read_count - before.read_count
+            writes = after.write_count - before.write_count
+            read_time = after.read_time - before.read_time
+            write_time = after.write_time - before.write_time
+            busy_time = getattr(after, "busy_time", None)
+            busy_before = getattr(before, "busy_time", None)
+
+            devices[name] = {
+                "read_mbps": round((after.read_bytes - before.read_bytes) / (1024**2) / elapsed, 3),
+                "write_mbps": round((after.write_bytes - before.write_bytes) / (1024**2) / elapsed, 3),
+                "read_iops": round(reads / elapsed, 1),
+                "write_iops": round(writes / elapsed, 1),
+                "avg_read_ms": round(read_time / reads, 3) if reads > 0 else None,
+                "avg_write_ms": round(write_time / writes, 3) if writes > 0 else None,
+                "busy_percent": (
+                    round(min(100.0, (busy_time - busy_before) / (elapsed * 1000) * 100), 2)
+                    if busy_time is not None and busy_before is not None else None
+                )
+            }
+
+        return {
+            "timestamp": current["timestamp"],
+            "interval_seconds": round(elapsed, 3),
+            "devices": devices
+        }
+
+
+_sampler: Optional[DiskActivitySampler] = None
+_sampler_lock = threading.Lock()
+
+
+def get_disk_activity_sampler() -> DiskActivitySampler:
+    global _sampler
+    with _sampler_lock:
+        if _sampler is None:
+            _sampler = DiskActivitySampler()
+        return _sampler
@@ -0,0 +1,274 @@
+import mmap
+import os
+import random
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Callable
+
+
+DEFAULT_BLOCK_SIZES_KB = [4, 16, 64, 256, 1024, 4096]
+RANDOM_BLOCK_BYTES = 4096
+FILL_CHUNK_BYTES = 4 * 1024 * 1024
+PERCENTILES = (50, 90, 99, 99.9)
+
+
+class DiskBenchmark:
+    def __init__(self, directory: str, file_size_mb: int = 256, direct: bool = True):
+        self.directory = directory
+        self.file_size = file_size_mb * 1024 * 1024
+        self.file_size -= self.file_size % FILL_CHUNK_BYTES
+        self.direct = direct
+        self.path: Optional[str] = None
+        self.cache_bypass = "none"
+
+    def __enter__(self) -> "DiskBenchmark":
+        self.prepare()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.cleanup()
+
+    def prepare(self, cancel_event: Optional[threading.Event] = None):
+        fd, self.path = tempfile.mkstemp(prefix="disk_bench_", suffix=".tmp", dir=self.directory)
+        try:
+            if hasattr(os, "posix_fallocate"):
+                try:
+                    os.posix_fallocate(fd, 0, self.file_size)
+                except OSError:
+                    pass
+
+            chunk = DiskBenchmark.aligned_buffer(FILL_CHUNK_BYTES, fill_random=True)
+            for offset in range(0, self.file_size, FILL_CHUNK_BYTES):
+                if cancel_event is not None and cancel_event.is_set():
+                    break
+                os.pwrite(fd, chunk, offset)
+            os.fsync(fd)
+            chunk.close()
+        finally:
+            os.close(fd)
+
+        probe = self._open(os.O_RDONLY)
+        os.close(probe)
+
+    def cleanup(self):
+        if self.path:
+            try:
+                os.remove(self.path)
+            except OSError:
+                pass
+            self.path = None
+
+    @staticmethod
+    def aligned_buffer(size: int, fill_random: bool = False) -> mmap.mmap:
+        buffer = mmap.mmap(-1, size)
+        if fill_random:
+            seed = os.urandom(min(size, 1024 * 1024))
+            for offset in range(0, size, len(seed)):
+                buffer[offset:offset + len(seed)] = seed[:size - offset]
+        return buffer
+
+    @staticmethod
+    def drop_cache(fd: int):
+        if hasattr(os, "posix_fadvise"):
+            try:
+                os.fdatasync(fd)
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+                return True
+            except OSError:
+                pass
+        return False
+
+    @staticmethod
+    def evict(fd: int, offset: int, length: int):
+        if hasattr(os, "posix_fadvise"):
+            try:
+                os.posix_fadvise(fd, offset, length, os.POSIX_FADV_DONTNEED)
+            except OSError:
+                pass
+
+    def _open(self, flags: int) -> int:
+        if self.direct and hasattr(os, "O_DIRECT"):
+            try:
+                fd = os.open(self.path, flags | os.O_DIRECT)
+                self.cache_bypass = "o_direct"
+                return fd
+            except OSError:
+                pass
+
+        if flags & (os.O_WRONLY | os.O_RDWR) and hasattr(os, "O_DSYNC"):
+            flags |= os.O_DSYNC
+        fd = os.open(self.path, flags)
+        self.cache_bypass = "fadvise" if DiskBenchmark.drop_cache(fd) else "none"
+        return fd
+
+    def sequential(self, mode: str, block_size: int, runtime: float,
+                   cancel_event: Optional[threading.Event] = None) -> Dict[str, Any]:
+        fd = self._open(os.O_RDONLY if mode == "read" else os.O_WRONLY)
+        buffer = DiskBenchmark.aligned_buffer(block_size, fill_random=mode == "write")
+        latencies: List[float] = []
+        moved = 0
+        offset = 0
+        evict = mode == "read" and self.cache_bypass != "o_direct"
+        try:
+            start = time.perf_counter()
+            deadline = start + runtime
+            while time.perf_counter() < deadline:
+                if cancel_event is not None and cancel_event.is_set():
+                    break
+                io_start = time.perf_counter()
+                if mode == "read":
+                    done = os.preadv(fd, [buffer], offset)
+                else:
+                    done = os.pwrite(fd, buffer, offset)
+                latencies.append(time.perf_counter() - io_start)
+                if evict:
+                    DiskBenchmark.evict(fd, offset, block_size)
+                moved += done
+                offset += block_size
+                if offset + block_size > self.file_size:
+                    offset = 0
+            if mode == "write" and self.cache_bypass != "o_direct":
+                os.fdatasync(fd)
+            elapsed = time.perf_counter() - start
+        finally:
+            os.close(fd)
+            buffer.close()
+
+        return DiskBenchmark._summary(f"seq{mode}", block_size, moved, elapsed, latencies, 1)
+
+    def random(self, mode: str, runtime: float, queue_depth: int = 4,
+               cancel_event: Optional[threading.Event] = None) -> Dict[str, Any]:
+        fd = self._open(os.O_RDONLY if mode == "read" else os.O_WRONLY)
+        blocks = self.file_size // RANDOM_BLOCK_BYTES
+        per_worker: List[List[float]] = [[] for _ in range(queue_depth)]
+        moved = [0] * queue_depth
+        evict = mode == "read" and self.cache_bypass != "o_direct"
+        start = time.perf_counter()
+        deadline = start + runtime
+
+        def worker(index: int):
+            buffer = DiskBenchmark.aligned_buffer(RANDOM_BLOCK_BYTES, fill_random=mode == "write")
+            rng = random.Random(index)
+            latencies = per_worker[index]
+            try:
+                while time.perf_counter() < deadline:
+                    if cancel_event is not None and cancel_event.is_set():
+                        break
+                    offset = rng.randrange(blocks) * RANDOM_BLOCK_BYTES
+                    io_start = time.perf_counter()
+                    if mode == "read":
+                        done = os.preadv(fd, [buffer], offset)
+                    else:
+                        done = os.pwrite(fd, buffer, offset)
+                    latencies.append(time.perf_counter() - io_start)
+                    if evict:
+                        DiskBenchmark.evict(fd, offset, RANDOM_BLOCK_BYTES)
+                    moved[index] += done
+            finally:
+                buffer.close()
+
+        try:
+            with ThreadPoolExecutor(max_workers=queue_depth, thread_name_prefix="disk-bench") as pool:
+                for future in [pool.submit(worker, index) for index in range(queue_depth)]:
+                    future.result()
+            elapsed = time.perf_counter() - start
+        finally:
+            os.close(fd)
+
+        latencies = [latency for worker_latencies in per_worker for latency in worker_latencies]
+        return DiskBenchmark._summary(f"rand{mode}", RANDOM_BLOCK_BYTES, sum(moved), elapsed, latencies, queue_depth)
+
+    @staticmethod
+    def _summary(name: str, block_size: int, moved: int, elapsed: float,
+                 latencies: List[float], queue_depth: int) -> Dict[str, Any]:
+        ios = len(latencies)
+        latencies_us = sorted(latency * 1e6 for latency in latencies)
+        percentiles = {
+            f"p{str(p).replace('.', '_')}": round(latencies_us[min(ios - 1, int(ios * p / 100))], 1) if ios else None
+            for p in PERCENTILES
+        }
+        iops = ios / elapsed if elapsed > 0 else 0.0
+        bw_mbps = moved / (1024 * 1024) / elapsed if elapsed > 0 else 0.0
+
+        return {
+            "name": name,
+            "block_size_kb": block_size // 1024,
+            "queue_depth": queue_depth,
+            "ios": ios,
+            "runtime_seconds": round(elapsed, 3),
+            "iops": round(iops, 1),
+            "bw_mbps": round(bw_mbps, 2),
+            "lat_us": {
+                "min": round(latencies_us[0], 1) if ios else None,
+                "mean": round(sum(latencies_us) / ios, 1) if ios else None,
+                "max": round(latencies_us[-1], 1) if ios else None,
+                **percentiles
+            },
+            "summary": (
+                f"{name}: bs={block_size // 1024}k iodepth={queue_depth} "
+                f"IOPS={DiskBenchmark._human(iops)}, BW={bw_mbps:.1f}MiB/s, "
+                f"lat p50={percentiles['p50']}us p99={percentiles['p99']}us"
+            )
+        }
+
+    @staticmethod
+    def _human(value: float) -> str:
+        if value >= 1000:
+            return f"{value / 1000:.1f}k"
+        return f"{value:.0f}"
+
+    def run(
+        self,
+        block_sizes_kb: Optional[List[int]] = None,
+        queue_depth: int = 4,
+        runtime: float = 1.0,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        cancel_event: Optional[threading.Event] = None
+    ) -> Dict[str, Any]:
+        block_sizes_kb = block_sizes_kb or DEFAULT_BLOCK_SIZES_KB
+        jobs = []
+        for block_kb in block_sizes_kb:
+            jobs.append(("sequential", "write", block_kb * 1024))
+            jobs.append(("sequential", "read", block_kb * 1024))
+        jobs.append(("random", "read", RANDOM_BLOCK_BYTES))
+        jobs.append(("random", "write", RANDOM_BLOCK_BYTES))
+
+        results = []
+        cancelled = False
+        for kind, mode, block_size in jobs:
+            if cancel_event is not None and cancel_event.is_set():
+                cancelled = True
+                break
+            if kind == "sequential":
+                result = self.sequential(mode, block_size, runtime, cancel_event)
+            else:
+                result = self.random(mode, runtime, queue_depth, cancel_event)
+            results.append(result)
+            if progress_callback:
+                progress_callback({
+                    "phase": result["name"],
+                    "block_size_kb": result["block_size_kb"],
+                    "iops": result["iops"],
+                    "bw_mbps": result["bw_mbps"],
+                    "lat_p99_us": result["lat_us"]["p99"]
+                })
+
+        sequential = [r for r in results if r["name"].startswith("seq")]
+        random_results = {r["name"]: r for r in results if r["name"].startswith("rand")}
+
+        return {
+            "cancelled": cancelled,
+            "cache_bypass": self.cache_bypass,
+            "file_size_mb": self.file_size // (1024 * 1024),
+            "queue_depth": queue_depth,
+            "runtime_per_test_seconds": runtime,
+            "sequential": sequential,
+            "random": list(random_results.values()),
+            "seq_read_mbps": max((r["bw_mbps"] for r in sequential if r["name"] == "seqread"), default=None),
+            "seq_write_mbps": max((r["bw_mbps"] for r in sequential if r["name"] == "seqwrite"), default=None),
+            "rand_read_iops": random_results["randread"]["iops"] if "randread" in random_results else None,
+            "rand_write_iops": random_results["randwrite"]["iops"] if "randwrite" in random_results else None,
+            "summary": [r["summary"] for r in results]
+        }
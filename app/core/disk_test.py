@@ -3,54 +3,77 @@ import os
 import time
 import tempfile
 import platform
-from typing import Dict, Any, List, Optional
+import threading
+from typing import Dict, Any, List, Optional, Callable
+from .disk_bench import DiskBenchmark
+from .disk_topology import get_disk_topology
+from .disk_activity import get_disk_activity_sampler
+
+
+STREAMING_MAX_TEST_SIZE_MB = 65536
+DISK_STATIC_FIELDS = (
+    "device", "device_name", "mount_point", "type", "file_system", "serial_number", "model",
+    "parent_device", "rotational", "removable", "logical_block_size", "physical_block_size",
+    "transport", "interface"
+)
 
 
 class DiskScanner:
     @staticmethod
-    def get_disks_info() -> List[Dict[str, Any]]:
+    def get_disks_info(static: Optional[Dict[str, Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
         disks = []
         
         try:
             partitions = psutil.disk_partitions()
-            io_counters = psutil.disk_io_counters(perdisk=True) if hasattr(psutil, 'disk_io_counters') else {}
+            io_counters = (psutil.disk_io_counters(perdisk=True) or {}) if hasattr(psutil, 'disk_io_counters') else {}
+            activity = get_disk_activity_sampler().sample()
             
             for partition in partitions:
                 try:
                     usage = psutil.disk_usage(partition.mountpoint)
                     
-                    disk_type = DiskScanner._detect_disk_type(partition.device)
-                    
-                    device_name = partition.device.split('/')[-1] if '/' in partition.device else partition.device
+                    known = static.get(partition.mountpoint) if static else None
+                    if known is None or known["device"] != partition.device:
+                        known = DiskScanner._get_disk_static(partition)
+                    device_name = known["device_name"]
                     
                     io_stats = None
-                    if io_counters:
-                        for disk_name, counters in io_counters.items():
-                            if device_name in disk_name or disk_name in device_name:
-                                io_stats = {
-                                    "read_count": counters.read_count,
-                                    "write_count": counters.write_count,
-                                    "read_bytes": round(counters.read_bytes / (1024**3), 2),
-                                    "write_bytes": round(counters.write_bytes / (1024**3), 2),
-                                    "read_time_ms": counters.read_time,
-                                    "write_time_ms": counters.write_time
-                                }
-                                break
+                    counters = io_counters.get(device_name)
+                    if counters is not None:
+                        io_stats = {
+                            "read_count": counters.read_count,
+                            "write_count": counters.write_count,
+                            "read_bytes": round(counters.read_bytes / (1024**3), 2),
+                            "write_bytes": round(counters.write_bytes / (1024**3), 2),
+                            "read_time_ms": counters.read_time,
+                            "write_time_ms": counters.write_time
+                        }
                     
                     disk_info = {
                         "detected": True,
-                        "device": partition.device,
+                        "device": known["device"],
                         "device_name": device_name,
-                        "mount_point": partition.mountpoint,
-                        "type": disk_type,
-                        "file_system": partition.fstype,
+                        "mount_point": known["mount_point"],
+                        "type": known["type"],
+                        "file_system": known["file_system"],
                         "total_gb": round(usage.total / (1024**3), 2),
                         "used_gb": round(usage.used / (1024**3), 2),
                         "free_gb": round(usage.free / (1024**3), 2),
                         "percent_used": round(usage.percent, 2),
-                        "serial_number": None,
-                        "interface": DiskScanner._get_interface(disk_type),
+                        "serial_number": known["serial_number"],
+                        "model": known["model"],
+                        "parent_device": known["parent_device"],
+                        "rotational": known["rotational"],
+                        "removable": known["removable"],
+                        "logical_block_size": known["logical_block_size"],
+                        "physical_block_size": known["physical_block_size"],
+                        "transport": known["transport"],
+                        "interface": known["interface"],
                         "io_stats": io_stats,
+                        "io_activity": (
+                            {**activity["devices"][device_name], "interval_seconds": activity["interval_seconds"]}
+                            if device_name in activity["devices"] else None
+                        ),
                         "read_speed_mbps": None,
                         "write_speed_mbps": None,
                         "status": DiskScanner._get_status(usage.percent),
@@ -81,13 +104,56 @@ class DiskScanner:
             }]
     
     @staticmethod
-    def _detect_disk_type(device: str) -> str:
+    def _get_disk_static(partition) -> Dict[str, Any]:
+        topology = get_disk_topology()
+        device_name = partition.device.split('/')[-1] if '/' in partition.device else partition.device
+        
+        entry = topology.resolve(partition.device)
+        roots = topology.root_devices(entry["name"]) if entry else []
+        if entry:
+            device_name = entry["name"]
+        
+        disk_type = DiskScanner._detect_disk_type(partition.device, roots)
+        root = roots[0] if roots else None
+        
+        return {
+            "device": partition.device,
+            "device_name": device_name,
+            "mount_point": partition.mountpoint,
+            "type": disk_type,
+            "file_system": partition.fstype,
+            "serial_number": root["serial"] if root else None,
+            "model": root["model"] if root else None,
+            "parent_device": root["name"] if root and root["name"] != device_name else None,
+            "rotational": root["rotational"] if root else None,
+            "removable": root["removable"] if root else None,
+            "logical_block_size": root["logical_block_size"] if root else None,
+            "physical_block_size": root["physical_block_size"] if root else None,
+            "transport": root["transport"] if root else None,
+            "interface": DiskScanner._get_interface(disk_type)
+        }
+    
+    @staticmethod
+    def _detect_disk_type(device: str, roots: Optional[List[Dict[str, Any]]] = None) -> str:
+        if roots:
+            root = roots[0]
+            if root["transport"] == "nvme":
+                return "NVMe SSD"
+            if root["transport"] == "mmc":
+                return "SD/MMC"
+            if root["rotational"] is not None:
+                solid_state = not any(r["rotational"] for r in roots)
+                if root["transport"] == "sata":
+                    return "SATA SSD" if solid_state else "HDD"
+                return "SSD" if solid_state else "HDD"
+        
         device_lower = device.lower()
+        device_name = device_lower.split('/')[-1]
         if 'nvme' in device_lower:
             return "NVMe SSD"
         elif 'ssd' in device_lower:
             return "SATA SSD"
-        elif 'mmc' in device_lower or 'sd' in device_lower:
+        elif device_name.startswith('mmcblk'):
             return "SD/MMC"
         else:
             try:
@@ -145,14 +211,27 @@ class DiskScanner:
         return max(0, score)
     
     @staticmethod
-    def perform_speed_test(mount_point: Optional[str] = None, test_size_mb: int = 50) -> Dict[str, Any]:
+    def perform_speed_test(
+        mount_point: Optional[str] = None,
+        test_size_mb: int = 50,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        cancel_event: Optional[threading.Event] = None,
+        streaming: bool = False,
+        chunk_size_mb: int = 4
+    ) -> Dict[str, Any]:
         try:
             if mount_point is None:
                 mount_point = tempfile.gettempdir()
             
             print(f"Starting disk speed test on {mount_point} with {test_size_mb}MB test file...")
             
-            test_file = os.path.join(mount_point, "disk_speed_test.tmp")
+            if streaming:
+                return DiskScanner._perform_streaming_speed_test(
+                    mount_point, test_size_mb, chunk_size_mb, progress_callback, cancel_event
+                )
+            
+            fd, test_file = tempfile.mkstemp(prefix="disk_speed_test_", suffix=".tmp", dir=mount_point)
+            os.close(fd)
             test_size = test_size_mb * 1024 * 1024
             test_data = os.urandom(test_size)
             
@@ -163,11 +242,41 @@ class DiskScanner:
                 os.fsync(f.fileno())
             write_time = time.time() - start_write
             
+            if progress_callback:
+                progress_callback({
+                    "phase": "write",
+                    "seconds": round(write_time, 4),
+                    "speed_mbps": round((test_size / (1024**2)) / write_time, 2) if write_time > 0 else None
+                })
+            
+            if cancel_event is not None and cancel_event.is_set():
+                try:
+                    os.remove(test_file)
+                except:
+                    pass
+                return {
+                    "test_passed": False,
+                    "cancelled": True,
+                    "error": "Test cancelled",
+                    "write_speed_mbps": None,
+                    "read_speed_mbps": None
+                }
+            
+            with open(test_file, 'rb') as f:
+                cache_dropped = DiskBenchmark.drop_cache(f.fileno())
+            
             start_read = time.time()
             with open(test_file, 'rb') as f:
                 _ = f.read()
             read_time = time.time() - start_read
             
+            if progress_callback:
+                progress_callback({
+                    "phase": "read",
+                    "seconds": round(read_time, 4),
+                    "speed_mbps": round((test_size / (1024**2)) / read_time, 2) if read_time > 0 else None
+                })
+            
             try:
                 os.remove(test_file)
             except:
@@ -186,6 +295,7 @@ class DiskScanner:
                 "read_speed_mbps": read_speed,
                 "write_time_seconds": round(write_time, 2),
                 "read_time_seconds": round(read_time, 2),
+                "read_cache_dropped": cache_dropped,
                 "estimated_disk_type": disk_type,
                 "performance_rating": DiskScanner._get_performance_rating(write_speed, read_speed)
             }
@@ -198,6 +308,213 @@ class DiskScanner:
                 "read_speed_mbps": None
             }
     
+    @staticmethod
+    def _perform_streaming_speed_test(
+        mount_point: str,
+        test_size_mb: int,
+        chunk_size_mb: int,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]],
+        cancel_event: Optional[threading.Event]
+    ) -> Dict[str, Any]:
+        test_size = test_size_mb * 1024 * 1024
+        chunk_size = chunk_size_mb * 1024 * 1024
+        free = psutil.disk_usage(mount_point).free
+        if test_size > free * 0.9:
+            return {
+                "test_passed": False,
+                "error": f"Not enough free space on {mount_point} for a {test_size_mb}MB test file",
+                "write_speed_mbps": None,
+                "read_speed_mbps": None
+            }
+        
+        fd, test_file = tempfile.mkstemp(prefix="disk_speed_test_", suffix=".tmp", dir=mount_point)
+        os.close(fd)
+        chunk = DiskBenchmark.aligned_buffer(chunk_size, fill_random=True)
+        view = memoryview(chunk)
+        read_buffer = bytearray(chunk_size)
+        cancelled = False
+        
+        try:
+            write_time, write_timeline, cancelled = DiskScanner._stream_phase(
+                "write", test_file, test_size, view, progress_callback, cancel_event
+            )
+            
+            read_time, read_timeline = None, []
+            if not cancelled:
+                read_time, read_timeline, cancelled = DiskScanner._stream_phase(
+                    "read", test_file, test_size, memoryview(read_buffer), progress_callback, cancel_event
+                )
+        finally:
+            view.release()
+            chunk.close()
+            try:
+                os.remove(test_file)
+            except:
+                pass
+        
+        if cancelled:
+            return {
+                "test_passed": False,
+                "cancelled": True,
+                "error": "Test cancelled",
+                "write_speed_mbps": None,
+                "read_speed_mbps": None
+            }
+        
+        write_speed = round(test_size_mb / write_time, 2)
+        read_speed = round(test_size_mb / read_time, 2)
+        
+        return {
+            "test_passed": True,
+            "streaming": True,
+            "mount_point": mount_point,
+            "test_size_mb": test_size_mb,
+            "chunk_size_mb": chunk_size_mb,
+            "write_speed_mbps": write_speed,
+            "read_speed_mbps": read_speed,
+            "write_time_seconds": round(write_time, 2),
+            "read_time_seconds": round(read_time, 2),
+            **DiskScanner._sustained_summary("write", write_timeline),
+            **DiskScanner._sustained_summary("read", read_timeline),
+            "write_timeline": write_timeline,
+            "read_timeline": read_timeline,
+            "estimated_disk_type": DiskScanner._determine_disk_type_by_speed(write_speed, read_speed),
+            "performance_rating": DiskScanner._get_performance_rating(write_speed, read_speed)
+        }
+    
+    @staticmethod
+    def _stream_phase(
+        mode: str,
+        path: str,
+        total: int,
+        buffer,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]],
+        cancel_event: Optional[threading.Event],
+        flush_every: int = 64 * 1024 * 1024,
+        sample_every: float = 0.5
+    ):
+        chunk_size = len(buffer)
+        timeline = []
+        cancelled = False
+        done = 0
+        flushed = 0
+        
+        with open(path, 'wb' if mode == "write" else 'rb', buffering=0) as f:
+            fileno = f.fileno()
+            if mode == "read":
+                DiskBenchmark.drop_cache(fileno)
+            
+            start = time.perf_counter()
+            sample_start, sample_bytes = start, 0
+            while done < total:
+                if cancel_event is not None and cancel_event.is_set():
+                    cancelled = True
+                    break
+                
+                length = min(chunk_size, total - done)
+                if mode == "write":
+                    moved = f.write(buffer[:length])
+                else:
+                    moved = f.readinto(buffer[:length])
+                    if not moved:
+                        break
+                done += moved
+                
+                if done - flushed >= flush_every or done >= total:
+                    if mode == "write":
+                        os.fdatasync(fileno)
+                    DiskBenchmark.evict(fileno, flushed, done - flushed)
+                    flushed = done
+                
+                now = time.perf_counter()
+                if now - sample_start >= sample_every or done >= total:
+                    point = {
+                        "elapsed_seconds": round(now - start, 2),
+                        "offset_mb": round(done / (1024**2), 1),
+                        "speed_mbps": round((done - sample_bytes) / (1024**2) / (now - sample_start), 2)
+                    }
+                    timeline.append(point)
+                    if progress_callback:
+                        progress_callback({"phase": mode, **point})
+                    sample_start, sample_bytes = now, done
+            
+            elapsed = time.perf_counter() - start
+        
+        return elapsed, timeline, cancelled
+    
+    @staticmethod
+    def _sustained_summary(mode: str, timeline: List[Dict[str, Any]]) -> Dict[str, Any]:
+        speeds = [point["speed_mbps"] for point in timeline]
+        if not speeds:
+            return {f"peak_{mode}_mbps": None, f"sustained_{mode}_mbps": None, f"{mode}_cliff_offset_mb": None}
+        
+        peak = max(speeds)
+        tail = speeds[-max(1, len(speeds) // 4):]
+        cliff = next(
+            (point["offset_mb"] for point in timeline[speeds.index(peak):] if point["speed_mbps"] < peak * 0.5),
+            None
+        )
+        return {
+            f"peak_{mode}_mbps": peak,
+            f"sustained_{mode}_mbps": round(sum(tail) / len(tail), 2),
+            f"{mode}_cliff_offset_mb": cliff
+        }
+    
+    @staticmethod
+    def perform_benchmark(
+        mount_point: Optional[str] = None,
+        file_size_mb: int = 256,
+        block_sizes_kb: Optional[List[int]] = None,
+        queue_depth: int = 4,
+        runtime: float = 1.0,
+        direct: bool = True,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        cancel_event: Optional[threading.Event] = None
+    ) -> Dict[str, Any]:
+        try:
+            if mount_point is None:
+                mount_point = tempfile.gettempdir()
+            
+            print(f"Starting disk benchmark on {mount_point} with {file_size_mb}MB test file...")
+            
+            with DiskBenchmark(mount_point, file_size_mb, direct=direct) as benchmark:
+                result = benchmark.run(
+                    block_sizes_kb=block_sizes_kb,
+                    queue_depth=queue_depth,
+                    runtime=runtime,
+                    progress_callback=progress_callback,
+                    cancel_event=cancel_event
+                )
+            
+            seq_read = result["seq_read_mbps"] or 0
+            seq_write = result["seq_write_mbps"] or 0
+            
+            return {
+                "test_passed": not result["cancelled"],
+                "mount_point": mount_point,
+                **result,
+                "estimated_disk_type": DiskScanner._determine_disk_type_from_benchmark(
+                    seq_write, seq_read, result["rand_read_iops"]
+                ),
+                "performance_rating": DiskScanner._get_performance_rating(seq_write, seq_read)
+            }
+            
+        except Exception as e:
+            return {
+                "test_passed": False,
+                "error": str(e),
+                "seq_read_mbps": None,
+                "seq_write_mbps": None
+            }
+    
+    @staticmethod
+    def _determine_disk_type_from_benchmark(write_speed: float, read_speed: float,
+                                            rand_read_iops: Optional[float]) -> str:
+        if rand_read_iops is not None and rand_read_iops < 400:
+            return "Fast HDD/Hybrid" if (write_speed + read_speed) / 2 > 100 else "HDD"
+        
+        return DiskScanner._determine_disk_type_by_speed(write_speed, read_speed)
+    
     @staticmethod
     def _determine_disk_type_by_speed(write_speed: float, read_speed: float) -> str:
         avg_speed = (write_speed + read_speed) / 2
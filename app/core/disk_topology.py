@@ -0,0 +1,227 @@
+import os
+import threading
+import time
+from typing import Dict, Any, Optional, List, Tuple
+
+
+SYS_BLOCK = "/sys/block"
+PROC_PARTITIONS = "/proc/partitions"
+SECTOR_BYTES = 512
+
+
+class DiskTopology:
+    def __init__(self, sys_block: str = SYS_BLOCK, check_interval: float = 2.0):
+        self.sys_block = sys_block
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._devices: Dict[str, Dict[str, Any]] = {}
+        self._by_devno: Dict[Tuple[int, int], str] = {}
+        self._by_mapper: Dict[str, str] = {}
+        self._signature: Optional[Tuple] = None
+        self._checked_at = 0.0
+        self.builds = 0
+
+    @property
+    def available(self) -> bool:
+        return os.path.isdir(self.sys_block)
+
+    def devices(self) -> Dict[str, Dict[str, Any]]:
+        self._refresh()
+        return self._devices
+
+    def resolve(self, device_path: str) -> Optional[Dict[str, Any]]:
+        self._refresh()
+        if not self._devices:
+            return None
+
+        name = None
+        try:
+            st = os.stat(device_path)
+            if st.st_rdev:
+                name = self._by_devno.get((os.major(st.st_rdev), os.minor(st.st_rdev)))
+        except OSError:
+            pass
+
+        if name is None:
+            base = os.path.basename(device_path)
+            name = base if base in self._devices else self._by_mapper.get(base)
+
+        return self._devices.get(name) if name else None
+
+    def root_devices(self, name: str) -> List[Dict[str, Any]]:
+        self._refresh()
+        entry = self._devices.get(name)
+        if entry is None:
+            return []
+        if entry["parent"]:
+            return self.root_devices(entry["parent"])
+        if not entry["slaves"]:
+            return [entry]
+
+        roots = []
+        for slave in entry["slaves"]:
+            roots.extend(self.root_devices(slave))
+        return roots
+
+    def invalidate(self):
+        with self._lock:
+            self._signature = None
+            self._checked_at = 0.0
+
+    def _refresh(self):
+        now = time.monotonic()
+        if self._signature is not None and now - self._checked_at < self.check_interval:
+            return
+
+        with self._lock:
+            if self._signature is not None and now - self._checked_at < self.check_interval:
+                return
+            signature = self._read_signature()
+            self._checked_at = now
+            if signature == self._signature:
+                return
+            self._build()
+            self._signature = signature
+
+    def _read_signature(self) -> Optional[Tuple]:
+        if not self.available:
+            return ()
+        try:
+            names = tuple(sorted(os.listdir(self.sys_block)))
+        except OSError:
+            names = ()
+        partitions = ""
+        try:
+            with open(PROC_PARTITIONS) as f:
+                partitions = f.read()
+        except OSError:
+            pass
+        return names, partitions
+
+    def _build(self):
+        devices: Dict[str, Dict[str, Any]] = {}
+        by_devno: Dict[Tuple[int, int], str] = {}
+        by_mapper: Dict[str, str] = {}
+
+        if self.available:
+            for name in os.listdir(self.sys_block):
+                path = os.path.join(self.sys_block, name)
+                disk = self._read_device(name, path, parent=None)
+                devices[name] = disk
+
+                try:
+                    children = os.listdir(path)
+                except OSError:
+                    children = []
+                for child in children:
+                    child_path = os.path.join(path, child)
+                    if os.path.exists(os.path.join(child_path, "partition")):
+                        partition = self._read_device(child, child_path, parent=name)
+                        devices[child] = partition
+                        disk["partitions"].append(child)
+
+        for name, entry in devices.items():
+            if entry["devno"]:
+                by_devno[entry["devno"]] = name
+            if entry["mapper_name"]:
+                by_mapper[entry["mapper_name"]] = name
+
+        self._devices = devices
+        self._by_devno = by_devno
+        self._by_mapper = by_mapper
+        self.builds += 1
+
+    def _read_device(self, name: str, path: str, parent: Optional[str]) -> Dict[str, Any]:
+        parent_path = os.path.join(self.sys_block, parent) if parent else path
+        devno = None
+        dev = DiskTopology._read(os.path.join(path, "dev"))
+        if dev and ":" in dev:
+            major, minor = dev.split(":", 1)
+            devno = (int(major), int(minor))
+
+        size = DiskTopology._read_int(os.path.join(path, "size"))
+        rotational = DiskTopology._read_int(os.path.join(parent_path, "queue", "rotational"))
+        serial = (
+            DiskTopology._read(os.path.join(parent_path, "serial"))
+            or DiskTopology._read(os.path.join(parent_path, "device", "serial"))
+            or DiskTopology._read(os.path.join(parent_path, "device", "wwid"))
+        )
+
+        try:
+            slaves = sorted(os.listdir(os.path.join(path, "slaves")))
+        except OSError:
+            slaves = []
+
+        return {
+            "name": name,
+            "parent": parent,
+            "devno": devno,
+            "size_bytes": size * SECTOR_BYTES if size is not None else None,
+            "rotational": bool(rotational) if rotational is not None else None,
+            "removable": DiskTopology._read_int(os.path.join(parent_path, "removable")) == 1,
+            "logical_block_size": DiskTopology._read_int(os.path.join(parent_path, "queue", "logical_block_size")),
+            "physical_block_size": DiskTopology._read_int(os.path.join(parent_path, "queue", "physical_block_size")),
+            "scheduler": DiskTopology._active_scheduler(os.path.join(parent_path, "queue", "scheduler")),
+            "model": DiskTopology._read(os.path.join(parent_path, "device", "model")),
+            "vendor": DiskTopology._read(os.path.join(parent_path, "device", "vendor")),
+            "serial": serial,
+            "transport": DiskTopology._transport(name if parent is None else parent, parent_path),
+            "mapper_name": DiskTopology._read(os.path.join(path, "dm", "name")),
+            "slaves": slaves,
+            "partitions": []
+        }
+
+    @staticmethod
+    def _transport(name: str, path: str) -> str:
+        if name.startswith(("loop", "zram", "ram", "dm-", "md")):
+            return "virtual"
+        if name.startswith("nvme"):
+            return "nvme"
+        if name.startswith("mmcblk"):
+            return "mmc"
+        real = os.path.realpath(path)
+        if "/usb" in real:
+            return "usb"
+        if "/virtio" in real:
+            return "virtio"
+        if "/ata" in real:
+            return "sata"
+        if "/host" in real or "/target" in real:
+            return "scsi"
+        return "unknown"
+
+    @staticmethod
+    def _active_scheduler(path: str) -> Optional[str]:
+        value = DiskTopology._read(path)
+        if value and "[" in value:
+            return value[value.index("[") + 1:value.index("]")]
+        return value
+
+    @staticmethod
+    def _read(path: str) -> Optional[str]:
+        try:
+            with open(path) as f:
+                value = f.read().strip()
+                return value or None
+        except (OSError, UnicodeDecodeError):
+            return None
+
+    @staticmethod
+    def _read_int(path: str) -> Optional[int]:
+        value = DiskTopology._read(path)
+        try:
+            return int(value) if value is not None else None
+        except ValueError:
+            return None
+
+
+_topology: Optional[DiskTopology] = None
+_topology_lock = threading.Lock()
+
+
+def get_disk_topology() -> DiskTopology:
+    global _topology
+    with _topology_lock:
+        if _topology is None:
+            _topology = DiskTopology()
+        return _topology
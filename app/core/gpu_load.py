@@ -0,0 +1,252 @@
+import threading
+import time
+from typing import Dict, Any, Optional
+
+from .gpu_telemetry import FakeGPUBackend, get_gpu_telemetry
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import cupy
+    CUPY_AVAILABLE = True
+except ImportError:
+    CUPY_AVAILABLE = False
+
+try:
+    import torch
+    TORCH_AVAILABLE = True
+except ImportError:
+    TORCH_AVAILABLE = False
+
+
+DEFAULT_MATRIX_SIZE = 4096
+MOCK_MATRIX_SIZE = 256
+
+
+class GPULoadGenerator:
+    name = "none"
+    description = ""
+    unit = "GFLOP/s"
+
+    def __init__(self, device_index: int = 0, matrix_size: int = DEFAULT_MATRIX_SIZE):
+        self.device_index = device_index
+        self.matrix_size = matrix_size
+        self.error: Optional[str] = None
+        self._work = 0.0
+        self._steps = 0
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._ready = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._started_at: Optional[float] = None
+        self._stopped_at: Optional[float] = None
+
+    @staticmethod
+    def available() -> bool:
+        return False
+
+    def start(self, timeout: float = 30.0) -> bool:
+        self._stop_event.clear()
+        self._ready.clear()
+        self._thread = threading.Thread(target=self._run, name=f"gpu-load-{self.name}", daemon=True)
+        self._thread.start()
+        self._ready.wait(timeout)
+        return self.error is None
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._thread = None
+
+    def work_done(self) -> float:
+        with self._lock:
+            return self._work
+
+    def summary(self) -> Dict[str, Any]:
+        elapsed = (self._stopped_at or time.perf_counter()) - (self._started_at or time.perf_counter())
+        return {
+            "name": self.name,
+            "unit": self.unit,
+            "matrix_size": self.matrix_size,
+            "steps": self._steps,
+            "active_seconds": round(elapsed, 3),
+            "average_throughput": round(self._work / elapsed / 1e9, 2) if elapsed > 0 else None,
+            "error": self.error
+        }
+
+    def _run(self):
+        try:
+            self._setup()
+        except Exception as e:
+            self.error = f"Setup failed: {e}"
+            self._ready.set()
+            return
+
+        self._started_at = time.perf_counter()
+        self._ready.set()
+        try:
+            while not self._stop_event.is_set():
+                work = self._step()
+                with self._lock:
+                    self._work += work
+                    self._steps += 1
+        except Exception as e:
+            self.error = str(e)
+        finally:
+            self._stopped_at = time.perf_counter()
+            try:
+                self._teardown()
+            except Exception:
+                pass
+
+    def _setup(self):
+        pass
+
+    def _step(self) -> float:
+        return 0.0
+
+    def _teardown(self):
+        pass
+
+
+class CuPyLoadGenerator(GPULoadGenerator):
+    name = "cupy"
+    description = "FP32 matrix multiply on the GPU via CuPy"
+
+    @staticmethod
+    def available() -> bool:
+        if not CUPY_AVAILABLE:
+            return False
+        try:
+            return cupy.cuda.runtime.getDeviceCount() > 0
+        except Exception:
+            return False
+
+    def _setup(self):
+        self._device = cupy.cuda.Device(self.device_index)
+        self._device.use()
+        self._a = cupy.random.random((self.matrix_size, self.matrix_size), dtype=cupy.float32)
+        self._b = cupy.random.random((self.matrix_size, self.matrix_size), dtype=cupy.float32)
+        self._c = cupy.empty_like(self._a)
+        self._device.synchronize()
+
+    def _step(self) -> float:
+        cupy.matmul(self._a, self._b, out=self._c)
+        self._device.synchronize()
+        return 2.0 * self.matrix_size ** 3
+
+    def _teardown(self):
+        del self._a, self._b, self._c
+        cupy.get_default_memory_pool().free_all_blocks()
+
+
+class TorchLoadGenerator(GPULoadGenerator):
+    name = "torch"
+    description = "FP32 matrix multiply on the GPU via PyTorch CUDA"
+
+    @staticmethod
+    def available() -> bool:
+        if not TORCH_AVAILABLE:
+            return False
+        try:
+            return torch.cuda.is_available() and torch.cuda.device_count() > 0
+        except Exception:
+            return False
+
+    def _setup(self):
+        self._device = torch.device(f"cuda:{self.device_index}")
+        self._a = torch.rand((self.matrix_size, self.matrix_size), dtype=torch.float32, device=self._device)
+        self._b = torch.rand((self.matrix_size, self.matrix_size), dtype=torch.float32, device=self._device)
+        self._c = torch.empty_like(self._a)
+        torch.cuda.synchronize(self._device)
+
+    def _step(self) -> float:
+        torch.matmul(self._a, self._b, out=self._c)
+        torch.cuda.synchronize(self._device)
+        return 2.0 * self.matrix_size ** 3
+
+    def _teardown(self):
+        del self._a, self._b, self._c
+        torch.cuda.empty_cache()
+
+
+class CPUMockLoadGenerator(GPULoadGenerator):
+    name = "mock"
+    description = "CPU-side stand-in for tests; drives the fake telemetry backend when it is active"
+
+    def __init__(self, device_index: int = 0, matrix_size: int = MOCK_MATRIX_SIZE):
+        super().__init__(device_index, matrix_size)
+
+    @staticmethod
+    def available() -> bool:
+        return True
+
+    def _fake_backend(self) -> Optional[FakeGPUBackend]:
+        backend = get_gpu_telemetry().backend
+        return backend if isinstance(backend, FakeGPUBackend) and self.device_index < backend.count else None
+
+    def _setup(self):
+        if NUMPY_AVAILABLE:
+            self._a = np.random.random((self.matrix_size, self.matrix_size)).astype(np.float32)
+            self._b = np.random.random((self.matrix_size, self.matrix_size)).astype(np.float32)
+            self._c = np.empty_like(self._a)
+        fake = self._fake_backend()
+        if fake is not None:
+            fake.set_load(100.0, self.device_index)
+
+    def _step(self) -> float:
+        if NUMPY_AVAILABLE:
+            np.matmul(self._a, self._b, out=self._c)
+            return 2.0 * self.matrix_size ** 3
+
+        x = 1.0
+        for _ in range(20000):
+            x = x * 0.999999 + 1e-7
+        return 40000.0
+
+    def _teardown(self):
+        fake = self._fake_backend()
+        if fake is not None:
+            fake.set_load(0.0, self.device_index)
+
+
+LOAD_GENERATORS = {
+    "cupy": CuPyLoadGenerator,
+    "torch": TorchLoadGenerator,
+    "mock": CPUMockLoadGenerator
+}
+LOAD_GENERATOR_CHOICES = ("auto", "none") + tuple(LOAD_GENERATORS)
+
+
+def list_load_generators() -> Dict[str, Dict[str, Any]]:
+    return {
+        name: {
+            "description": generator.description,
+            "unit": generator.unit,
+            "available": generator.available()
+        }
+        for name, generator in LOAD_GENERATORS.items()
+    }
+
+
+def create_load_generator(name: str = "auto", device_index: int = 0) -> Optional[GPULoadGenerator]:
+    if name == "none":
+        return None
+    if name == "auto":
+        for candidate in ("cupy", "torch"):
+            if LOAD_GENERATORS[candidate].available():
+                return LOAD_GENERATORS[candidate](device_index)
+        if isinstance(get_gpu_telemetry().backend, FakeGPUBackend):
+            return CPUMockLoadGenerator(device_index)
+        return None
+    generator = LOAD_GENERATORS.get(name)
+    if generator is None:
+        raise ValueError(f"Unknown GPU load generator: {name}")
+    if not generator.available():
+        raise ValueError(f"GPU load generator '{name}' is not available on this system")
+    return generator(device_index)
@@ -0,0 +1,344 @@
+import ctypes
+import ctypes.util
+import math
+import os
+import platform
+import threading
+import time
+from typing import Dict, Any, Optional, List
+
+try:
+    import GPUtil
+    GPUTIL_AVAILABLE = True
+except ImportError:
+    GPUTIL_AVAILABLE = False
+
+
+BACKEND_ENV = "GPU_TELEMETRY_BACKEND"
+NVML_SUCCESS = 0
+NVML_TEMPERATURE_GPU = 0
+NVML_CLOCK_GRAPHICS = 0
+NVML_CLOCK_MEM = 2
+NVML_BUFFER_SIZE = 96
+
+
+class _NvmlMemory(ctypes.Structure):
+    _fields_ = [("total", ctypes.c_ulonglong), ("free", ctypes.c_ulonglong), ("used", ctypes.c_ulonglong)]
+
+
+class _NvmlUtilization(ctypes.Structure):
+    _fields_ = [("gpu", ctypes.c_uint), ("memory", ctypes.c_uint)]
+
+
+def _reading(index: int, name: str, uuid: Optional[str], memory_total_mb: float, memory_used_mb: float,
+             load_percent: Optional[float], temperature: Optional[float], driver: Optional[str],
+             **extra) -> Dict[str, Any]:
+    return {
+        "id": index,
+        "name": name,
+        "uuid": uuid,
+        "memory_total_mb": memory_total_mb,
+        "memory_used_mb": memory_used_mb,
+        "memory_free_mb": max(memory_total_mb - memory_used_mb, 0),
+        "load_percent": load_percent,
+        "temperature_celsius": temperature,
+        "driver_version": driver,
+        "power_usage_w": extra.get("power_usage_w"),
+        "power_limit_w": extra.get("power_limit_w"),
+        "fan_speed_percent": extra.get("fan_speed_percent"),
+        "clock_graphics_mhz": extra.get("clock_graphics_mhz"),
+        "clock_memory_mhz": extra.get("clock_memory_mhz"),
+        "memory_bus_percent": extra.get("memory_bus_percent")
+    }
+
+
+class GPUTelemetryBackend:
+    name = "none"
+    min_sample_interval = 0.5
+
+    def open(self) -> bool:
+        return False
+
+    def read(self) -> List[Dict[str, Any]]:
+        return []
+
+    def close(self):
+        pass
+
+
+class NVMLBackend(GPUTelemetryBackend):
+    name = "nvml"
+    min_sample_interval = 0.05
+
+    def __init__(self):
+        self._lib = None
+        self._handles: List[ctypes.c_void_p] = []
+        self._static: List[Dict[str, Any]] = []
+        self._driver: Optional[str] = None
+
+    @staticmethod
+    def _library_candidates() -> List[str]:
+        if platform.system().lower() == "windows":
+            system_root = os.environ.get("SystemRoot", r"C:\Windows")
+            return [
+                os.path.join(system_root, "System32", "nvml.dll"),
+                os.path.join(os.environ.get("ProgramFiles", r"C:\Program Files"),
+                             "NVIDIA Corporation", "NVSMI", "nvml.dll")
+            ]
+        found = ctypes.util.find_library("nvidia-ml")
+        return ["libnvidia-ml.so.1", "libnvidia-ml.so"] + ([found] if found else [])
+
+    def open(self) -> bool:
+        for candidate in NVMLBackend._library_candidates():
+            try:
+                self._lib = ctypes.CDLL(candidate)
+                break
+            except OSError:
+                continue
+        if self._lib is None:
+            return False
+
+        init = getattr(self._lib, "nvmlInit_v2", None) or getattr(self._lib, "nvmlInit", None)
+        if init is None or init() != NVML_SUCCESS:
+            self._lib = None
+            return False
+
+        count = ctypes.c_uint()
+        if self._lib.nvmlDeviceGetCount_v2(ctypes.byref(count)) != NVML_SUCCESS:
+            self.close()
+            return False
+
+        self._driver = self._string(self._lib.nvmlSystemGetDriverVersion)
+        for index in range(count.value):
+            handle = ctypes.c_void_p()
+            if self._lib.nvmlDeviceGetHandleByIndex_v2(index, ctypes.byref(handle)) != NVML_SUCCESS:
+                continue
+            power_limit = self._uint(self._lib.nvmlDeviceGetEnforcedPowerLimit, handle)
+            self._handles.append(handle)
+            self._static.append({
+                "index": index,
+                "name": self._string(self._lib.nvmlDeviceGetName, handle) or f"NVIDIA GPU {index}",
+                "uuid": self._string(self._lib.nvmlDeviceGetUUID, handle),
+                "power_limit_w": round(power_limit / 1000, 1) if power_limit is not None else None
+            })
+        return True
+
+    def _string(self, func, *args) -> Optional[str]:
+        buffer = ctypes.create_string_buffer(NVML_BUFFER_SIZE)
+        if func(*args, buffer, ctypes.c_uint(NVML_BUFFER_SIZE)) != NVML_SUCCESS:
+            return None
+        return buffer.value.decode(errors="replace")
+
+    def _uint(self, func, *args) -> Optional[int]:
+        value = ctypes.c_uint()
+        if func(*args, ctypes.byref(value)) != NVML_SUCCESS:
+            return None
+        return value.value
+
+    def read(self) -> List[Dict[str, Any]]:
+        readings = []
+        for handle, static in zip(self._handles, self._static):
+            memory = _NvmlMemory()
+            has_memory = self._lib.nvmlDeviceGetMemoryInfo(handle, ctypes.byref(memory)) == NVML_SUCCESS
+            utilization = _NvmlUtilization()
+            has_utilization = self._lib.nvmlDeviceGetUtilizationRates(handle, ctypes.byref(utilization)) == NVML_SUCCESS
+            temperature = self._uint(self._lib.nvmlDeviceGetTemperature, handle, NVML_TEMPERATURE_GPU)
+            power = self._uint(self._lib.nvmlDeviceGetPowerUsage, handle)
+
+            readings.append(_reading(
+                static["index"], static["name"], static["uuid"],
+                memory.total / (1024 ** 2) if has_memory else 0.0,
+                memory.used / (1024 ** 2) if has_memory else 0.0,
+                float(utilization.gpu) if has_utilization else None,
+                float(temperature) if temperature is not None else None,
+                self._driver,
+                power_usage_w=round(power / 1000, 1) if power is not None else None,
+                power_limit_w=static["power_limit_w"],
+                fan_speed_percent=self._uint(self._lib.nvmlDeviceGetFanSpeed, handle),
+                clock_graphics_mhz=self._uint(self._lib.nvmlDeviceGetClockInfo, handle, NVML_CLOCK_GRAPHICS),
+                clock_memory_mhz=self._uint(self._lib.nvmlDeviceGetClockInfo, handle, NVML_CLOCK_MEM),
+                memory_bus_percent=float(utilization.memory) if has_utilization else None
+            ))
+        return readings
+
+    def close(self):
+        if self._lib is not None:
+            try:
+                self._lib.nvmlShutdown()
+            except Exception:
+                pass
+        self._lib = None
+        self._handles = []
+        self._static = []
+
+
+class GPUtilBackend(GPUTelemetryBackend):
+    name = "gputil"
+    min_sample_interval = 0.5
+
+    def open(self) -> bool:
+        if not GPUTIL_AVAILABLE:
+            return False
+        try:
+            return bool(GPUtil.getGPUs())
+        except Exception:
+            return False
+
+    def read(self) -> List[Dict[str, Any]]:
+        return [
+            _reading(
+                gpu.id, gpu.name, getattr(gpu, "uuid", None),
+                gpu.memoryTotal, gpu.memoryUsed,
+                gpu.load * 100 if gpu.load is not None else None,
+                gpu.temperature, getattr(gpu, "driver", None)
+            )
+            for gpu in GPUtil.getGPUs()
+        ]
+
+
+class FakeGPUBackend(GPUTelemetryBackend):
+    name = "fake"
+    min_sample_interval = 0.0
+
+    def __init__(self, count: int = 1, memory_total_mb: float = 8192.0, idle_temperature: float = 35.0):
+        self.count = count
+        self.memory_total_mb = memory_total_mb
+        self.idle_temperature = idle_temperature
+        self.load_percent = [0.0] * count
+        self.memory_used_mb = [512.0] * count
+        self.reads = 0
+        self._started = time.monotonic()
+
+    def open(self) -> bool:
+        return True
+
+    def set_load(self, load_percent: float, index: int = 0, memory_used_mb: Optional[float] = None):
+        self.load_percent[index] = max(0.0, min(100.0, load_percent))
+        if memory_used_mb is not None:
+            self.memory_used_mb[index] = min(memory_used_mb, self.memory_total_mb)
+
+    def read(self) -> List[Dict[str, Any]]:
+        self.reads += 1
+        ripple = math.sin((time.monotonic() - self._started) * 2)
+        readings = []
+        for index in range(self.count):
+            load = self.load_percent[index]
+            readings.append(_reading(
+                index, f"Fake GPU {index}", f"GPU-fake-{index:04d}",
+                self.memory_total_mb, self.memory_used_mb[index],
+                load, round(self.idle_temperature + load * 0.35 + ripple, 1), "fake-1.0",
+                power_usage_w=round(20 + load * 2.3, 1),
+                power_limit_w=250.0,
+                fan_speed_percent=int(30 + load * 0.6),
+                clock_graphics_mhz=int(300 + load * 15),
+                clock_memory_mhz=7000,
+                memory_bus_percent=round(load * 0.6, 1)
+            ))
+        return readings
+
+
+BACKENDS = {
+    "nvml": NVMLBackend,
+    "gputil": GPUtilBackend,
+    "fake": FakeGPUBackend
+}
+
+
+class GPUTelemetrySession:
+    def __init__(self, backend: Optional[GPUTelemetryBackend] = None, preference: Optional[str] = None):
+        self._lock = threading.Lock()
+        self.backend = backend if backend is not None else GPUTelemetrySession._select(preference)
+        self.opened_at = time.time()
+        self._devices: Optional[List[Dict[str, Any]]] = None
+        self._reopen = False
+
+    @staticmethod
+    def _select(preference: Optional[str]) -> GPUTelemetryBackend:
+        preference = (preference or os.environ.get(BACKEND_ENV) or "auto").lower()
+        names = [preference] if preference in BACKENDS else ["nvml", "gputil"]
+        for name in names:
+            backend = BACKENDS[name]()
+            try:
+                if backend.open():
+                    return backend
+            except Exception:
+                pass
+            backend.close()
+        return GPUTelemetryBackend()
+
+    @property
+    def backend_name(self) -> str:
+        return self.backend.name
+
+    @property
+    def available(self) -> bool:
+        return self.backend.name != "none"
+
+    def read(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return self.backend.read()
+
+    def refresh_devices(self):
+        with self._lock:
+            self._devices = None
+            self._reopen = True
+
+    def devices(self) -> List[Dict[str, Any]]:
+        if self._devices is None:
+            with self._lock:
+                if self._reopen:
+                    self._reopen = False
+                    self.backend.close()
+                    try:
+                        self.backend.open()
+                    except Exception:
+                        pass
+            self._devices = [
+                {
+                    "id": reading["id"],
+                    "name": reading["name"],
+                    "uuid": reading["uuid"],
+                    "memory_total_mb": round(reading["memory_total_mb"], 2),
+                    "driver_version": reading["driver_version"]
+                }
+                for reading in self.read()
+            ]
+        return self._devices
+
+    def read_device(self, index: int) -> Optional[Dict[str, Any]]:
+        for reading in self.read():
+            if reading["id"] == index:
+                return reading
+        return None
+
+    def close(self):
+        with self._lock:
+            self.backend.close()
+
+
+_session: Optional[GPUTelemetrySession] = None
+_session_lock = threading.Lock()
+
+
+def get_gpu_telemetry() -> GPUTelemetrySession:
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = GPUTelemetrySession()
+        return _session
+
+
+def refresh_gpu_devices():
+    with _session_lock:
+        session = _session
+    if session is not None:
+        session.refresh_devices()
+
+
+def set_gpu_telemetry_backend(backend: Optional[GPUTelemetryBackend]) -> Optional[GPUTelemetrySession]:
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = GPUTelemetrySession(backend) if backend is not None else None
+        return _session
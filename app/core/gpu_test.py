@@ -1,28 +1,28 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Callable
+import threading
 import time
 
-try:
-    import GPUtil
-    GPU_AVAILABLE = True
-except ImportError:
-    GPU_AVAILABLE = False
+from .gpu_telemetry import get_gpu_telemetry, GPUTIL_AVAILABLE
+from .gpu_load import create_load_generator
+from .cpu_stress import ThrottleDetector
 
 
 class GPUScanner:
     @staticmethod
     def get_gpu_info() -> List[Dict[str, Any]]:
-        if not GPU_AVAILABLE:
-            return [{
-                "detected": False,
-                "id": None,
-                "name": "No GPU Library",
-                "status": "GPUtil library not available - Install with: pip install gputil"
-            }]
-        
         try:
-            gpus = GPUtil.getGPUs()
+            telemetry = get_gpu_telemetry()
+            if not telemetry.available and not GPUTIL_AVAILABLE:
+                return [{
+                    "detected": False,
+                    "id": None,
+                    "name": "No GPU Library",
+                    "status": "No NVIDIA driver (NVML) or GPUtil library available - Install with: pip install gputil"
+                }]
+            
+            readings = telemetry.read()
             
-            if not gpus:
+            if not readings:
                 return [{
                     "detected": False,
                     "id": None,
@@ -32,29 +32,36 @@ class GPUScanner:
             
             gpu_info_list = []
             
-            for gpu in gpus:
-                load_percent = round(gpu.load * 100, 2) if gpu.load else 0
+            for gpu in readings:
+                load_percent = round(gpu["load_percent"], 2) if gpu["load_percent"] else 0
+                memory_total = gpu["memory_total_mb"]
+                memory_used = gpu["memory_used_mb"]
+                memory_percent = (memory_used / memory_total) * 100 if memory_total > 0 else 0
+                temperature = gpu["temperature_celsius"]
                 
                 gpu_info = {
                     "detected": True,
-                    "id": gpu.id,
-                    "name": gpu.name,
-                    "uuid": gpu.uuid if hasattr(gpu, 'uuid') else None,
-                    "memory_total_mb": round(gpu.memoryTotal, 2),
-                    "memory_total_gb": round(gpu.memoryTotal / 1024, 2),
-                    "memory_used_mb": round(gpu.memoryUsed, 2),
-                    "memory_used_gb": round(gpu.memoryUsed / 1024, 2),
-                    "memory_free_mb": round(gpu.memoryFree, 2),
-                    "memory_free_gb": round(gpu.memoryFree / 1024, 2),
-                    "memory_percent": round((gpu.memoryUsed / gpu.memoryTotal) * 100, 2) if gpu.memoryTotal > 0 else 0,
+                    "id": gpu["id"],
+                    "name": gpu["name"],
+                    "uuid": gpu["uuid"],
+                    "memory_total_mb": round(memory_total, 2),
+                    "memory_total_gb": round(memory_total / 1024, 2),
+                    "memory_used_mb": round(memory_used, 2),
+                    "memory_used_gb": round(memory_used / 1024, 2),
+                    "memory_free_mb": round(gpu["memory_free_mb"], 2),
+                    "memory_free_gb": round(gpu["memory_free_mb"] / 1024, 2),
+                    "memory_percent": round(memory_percent, 2),
                     "gpu_load_percent": load_percent,
-                    "temperature_celsius": round(gpu.temperature, 2) if gpu.temperature else None,
-                    "driver_version": gpu.driver if hasattr(gpu, 'driver') else "Unknown",
-                    "power_usage_w": None,
-                    "fan_speed_percent": None,
-                    "status": GPUScanner._get_status(load_percent, gpu.temperature),
-                    "health_score": GPUScanner._calculate_health_score(load_percent, gpu.temperature, 
-                                                                        (gpu.memoryUsed / gpu.memoryTotal) * 100 if gpu.memoryTotal > 0 else 0)
+                    "temperature_celsius": round(temperature, 2) if temperature else None,
+                    "driver_version": gpu["driver_version"] or "Unknown",
+                    "power_usage_w": gpu["power_usage_w"],
+                    "power_limit_w": gpu["power_limit_w"],
+                    "fan_speed_percent": gpu["fan_speed_percent"],
+                    "clock_graphics_mhz": gpu["clock_graphics_mhz"],
+                    "clock_memory_mhz": gpu["clock_memory_mhz"],
+                    "telemetry_backend": telemetry.backend_name,
+                    "status": GPUScanner._get_status(load_percent, temperature),
+                    "health_score": GPUScanner._calculate_health_score(load_percent, temperature, memory_percent)
                 }
                 
                 gpu_info_list.append(gpu_info)
@@ -111,52 +118,115 @@ class GPUScanner:
         return max(0, score)
     
     @staticmethod
-    def perform_gpu_stress_test(duration: int = 10, gpu_id: int = 0) -> Dict[str, Any]:
-        if not GPU_AVAILABLE:
+    def perform_gpu_stress_test(
+        duration: int = 10,
+        gpu_id: int = 0,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        cancel_event: Optional[threading.Event] = None,
+        sample_interval: float = 0.5,
+        load_generator: str = "auto"
+    ) -> Dict[str, Any]:
+        telemetry = get_gpu_telemetry()
+        if not telemetry.available:
             return {
                 "test_passed": False,
-                "error": "GPUtil library not available"
+                "error": "No GPU telemetry backend available (NVML or GPUtil)"
             }
         
+        generator = None
         try:
             print(f"Starting GPU stress test for {duration} seconds...")
             
-            gpus = GPUtil.getGPUs()
-            if not gpus or gpu_id >= len(gpus):
+            gpu = telemetry.read_device(gpu_id)
+            if gpu is None:
                 return {
                     "test_passed": False,
                     "error": "No GPU available for testing"
                 }
             
-            gpu = gpus[gpu_id]
+            sample_interval = max(sample_interval, telemetry.backend.min_sample_interval)
+            initial_temp = gpu["temperature_celsius"]
+            initial_load = gpu["load_percent"] or 0
+            initial_memory = (gpu["memory_used_mb"] / gpu["memory_total_mb"]) * 100 if gpu["memory_total_mb"] > 0 else 0
             
-            initial_temp = gpu.temperature
-            initial_load = gpu.load * 100 if gpu.load else 0
-            initial_memory = (gpu.memoryUsed / gpu.memoryTotal) * 100 if gpu.memoryTotal > 0 else 0
+            generator = create_load_generator(load_generator, gpu_id)
+            if generator is not None and not generator.start():
+                return {
+                    "test_passed": False,
+                    "load_generator": generator.name,
+                    "error": generator.error
+                }
             
-            load_samples = []
-            temp_samples = []
-            memory_samples = []
+            timeline = []
+            read_times = []
+            cancelled = False
+            previous_work, previous_time = 0.0, time.perf_counter()
             
             start_time = time.time()
             
             while time.time() - start_time < duration:
-                gpus = GPUtil.getGPUs()
-                if gpus and gpu_id < len(gpus):
-                    gpu = gpus[gpu_id]
-                    load_samples.append(gpu.load * 100 if gpu.load else 0)
-                    if gpu.temperature:
-                        temp_samples.append(gpu.temperature)
-                    if gpu.memoryTotal > 0:
-                        memory_samples.append((gpu.memoryUsed / gpu.memoryTotal) * 100)
+                if cancel_event is not None and cancel_event.is_set():
+                    cancelled = True
+                    break
                 
-                time.sleep(0.5)
+                time.sleep(sample_interval)
+                
+                read_start = time.perf_counter()
+                sample = telemetry.read_device(gpu_id)
+                read_times.append(time.perf_counter() - read_start)
+                if sample is None:
+                    continue
+                gpu = sample
+                
+                now = time.perf_counter()
+                work = generator.work_done() if generator is not None else 0.0
+                ops_per_sec = (work - previous_work) / (now - previous_time) if generator is not None else None
+                previous_work, previous_time = work, now
+                
+                point = {
+                    "elapsed_seconds": round(time.time() - start_time, 2),
+                    "load_percent": gpu["load_percent"] or 0,
+                    "temperature_celsius": gpu["temperature_celsius"],
+                    "memory_percent": (gpu["memory_used_mb"] / gpu["memory_total_mb"]) * 100 if gpu["memory_total_mb"] > 0 else None,
+                    "power_usage_w": gpu["power_usage_w"],
+                    "clock_graphics_mhz": gpu["clock_graphics_mhz"],
+                    "throughput_gflops": round(ops_per_sec / 1e9, 2) if ops_per_sec is not None else None,
+                    "total_ops_per_sec": ops_per_sec,
+                    "frequency_avg_mhz": gpu["clock_graphics_mhz"],
+                    "temperature_max_celsius": gpu["temperature_celsius"]
+                }
+                timeline.append(point)
+                
+                if progress_callback:
+                    progress_callback({
+                        "elapsed_seconds": point["elapsed_seconds"],
+                        "load_percent": point["load_percent"],
+                        "temperature_celsius": point["temperature_celsius"],
+                        "memory_percent": point["memory_percent"],
+                        "power_usage_w": point["power_usage_w"],
+                        "clock_graphics_mhz": point["clock_graphics_mhz"],
+                        "throughput_gflops": point["throughput_gflops"]
+                    })
             
-            return {
+            if generator is not None:
+                generator.stop()
+            
+            load_samples = [p["load_percent"] for p in timeline]
+            temp_samples = [p["temperature_celsius"] for p in timeline if p["temperature_celsius"]]
+            memory_samples = [p["memory_percent"] for p in timeline if p["memory_percent"] is not None]
+            power_samples = [p["power_usage_w"] for p in timeline if p["power_usage_w"] is not None]
+            clock_samples = [p["clock_graphics_mhz"] for p in timeline if p["clock_graphics_mhz"]]
+            
+            result = {
                 "test_passed": True,
+                "cancelled": cancelled,
                 "gpu_id": gpu_id,
-                "gpu_name": gpu.name,
+                "gpu_name": gpu["name"],
                 "duration_seconds": duration,
+                "telemetry_backend": telemetry.backend_name,
+                "load_generator": generator.name if generator is not None else None,
+                "sample_interval_seconds": sample_interval,
+                "average_sample_ms": round(sum(read_times) / len(read_times) * 1000, 3) if read_times else None,
                 "initial_load_percent": round(initial_load, 2),
                 "initial_temperature_celsius": round(initial_temp, 2) if initial_temp else None,
                 "initial_memory_percent": round(initial_memory, 2),
@@ -164,13 +234,59 @@ class GPUScanner:
                 "max_load_percent": round(max(load_samples), 2) if load_samples else 0,
                 "average_temperature_celsius": round(sum(temp_samples) / len(temp_samples), 2) if temp_samples else None,
                 "max_temperature_celsius": round(max(temp_samples), 2) if temp_samples else None,
+                "temperature_rise_celsius": round(max(temp_samples) - initial_temp, 2) if temp_samples and initial_temp else None,
                 "average_memory_percent": round(sum(memory_samples) / len(memory_samples), 2) if memory_samples else 0,
-                "samples_collected": len(load_samples),
-                "performance_rating": "GPU monitoring successful - For full stress test, use dedicated tools like FurMark"
+                "average_power_w": round(sum(power_samples) / len(power_samples), 1) if power_samples else None,
+                "max_power_w": round(max(power_samples), 1) if power_samples else None,
+                "average_clock_mhz": round(sum(clock_samples) / len(clock_samples)) if clock_samples else None,
+                "min_clock_mhz": min(clock_samples) if clock_samples else None,
+                "max_clock_mhz": max(clock_samples) if clock_samples else None,
+                "samples_collected": len(timeline),
+                "timeline": [
+                    {key: value for key, value in point.items()
+                     if key not in ("total_ops_per_sec", "frequency_avg_mhz", "temperature_max_celsius")}
+                    for point in timeline
+                ]
             }
             
+            if generator is None:
+                result["performance_rating"] = "GPU monitoring only - No compute library (CuPy or PyTorch CUDA) available to generate load"
+                return result
+            
+            rates = [p["throughput_gflops"] for p in timeline if p["throughput_gflops"]]
+            sustained = rates[len(rates) // 2:]
+            summary = generator.summary()
+            result.update({
+                "test_passed": generator.error is None,
+                "load_generator_error": generator.error,
+                "throughput_gflops": summary["average_throughput"],
+                "peak_gflops": round(max(rates), 2) if rates else None,
+                "sustained_gflops": round(sum(sustained) / len(sustained), 2) if sustained else None,
+                "throttling": ThrottleDetector.analyze(timeline, max(clock_samples) if clock_samples else None)
+            })
+            result["performance_rating"] = GPUScanner._get_stress_rating(result)
+            return result
+            
         except Exception as e:
             return {
                 "test_passed": False,
                 "error": str(e)
             }
+        finally:
+            if generator is not None:
+                generator.stop()
+    
+    @staticmethod
+    def _get_stress_rating(result: Dict[str, Any]) -> str:
+        verdict = result["throttling"].get("verdict")
+        max_temperature = result["max_temperature_celsius"]
+        if verdict == "thermal_throttling":
+            return "Poor - GPU throttles under sustained load"
+        elif verdict == "performance_degraded":
+            return "Fair - Throughput dropped during the run"
+        elif max_temperature and max_temperature > 85:
+            return "Fair - Stable throughput but running hot"
+        elif result["average_load_percent"] < 50:
+            return "Check - Load generator did not saturate the GPU"
+        else:
+            return "Excellent - Sustained throughput with stable clocks and temperatures"
@@ -0,0 +1,265 @@
+import copy
+import hashlib
+import json
+import os
+import platform
+import threading
+from datetime import datetime
+from typing import Dict, Any, Optional, List, Tuple
+
+import psutil
+
+from .battery_sysfs import get_sysfs_battery
+from .cpu_test import CPUScanner, CPU_STATIC_FIELDS
+from .disk_test import DISK_STATIC_FIELDS
+from .disk_topology import get_disk_topology
+from .collector_engine import CollectorEngine
+from .gpu_telemetry import get_gpu_telemetry, refresh_gpu_devices
+from .peripherals_sysfs import get_sysfs_peripherals
+
+
+INVENTORY_COMPONENTS = ("cpu", "ram", "disks", "gpu", "battery", "network", "peripherals")
+STATIC_COMPONENTS = ("cpu", "disks", "peripherals")
+INVENTORY_HISTORY_SIZE = 20
+FINGERPRINT_LENGTH = 16
+SYS_CLASS_NET = "/sys/class/net"
+VIRTUAL_DISK_PREFIXES = ("loop", "ram", "zram", "dm-", "md", "nbd")
+NULL_MAC = "00:00:00:00:00:00"
+PROBE_TIMEOUTS = {
+    "cpu": 5.0,
+    "ram": 5.0,
+    "disks": 10.0,
+    "gpu": 10.0,
+    "battery": 5.0,
+    "network": 5.0,
+    "peripherals": 10.0
+}
+
+
+def _digest(value: Any) -> str:
+    encoded = json.dumps(value, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()[:FINGERPRINT_LENGTH]
+
+
+def _cpu_facts() -> List[Dict[str, Any]]:
+    static = CPUScanner.get_cpu_static()
+    return [{
+        "model": static["model"],
+        "architecture": static["architecture"],
+        "cores_physical": static["cores_physical"],
+        "cores_logical": static["cores_logical"]
+    }]
+
+
+def _ram_facts() -> List[Dict[str, Any]]:
+    return [{"total_gb": round(psutil.virtual_memory().total / (1024**3), 1)}]
+
+
+def _disk_facts() -> List[Dict[str, Any]]:
+    facts = []
+    for name, entry in sorted(get_disk_topology().devices().items()):
+        if entry["parent"] or entry["slaves"] or name.startswith(VIRTUAL_DISK_PREFIXES):
+            continue
+        facts.append({
+            "kind": "disk",
+            "name": name,
+            "model": entry["model"],
+            "serial": entry["serial"],
+            "size_bytes": entry["size_bytes"],
+            "transport": entry["transport"]
+        })
+    for partition in sorted(psutil.disk_partitions(), key=lambda p: p.mountpoint):
+        facts.append({
+            "kind": "mount",
+            "device": partition.device,
+            "mount_point": partition.mountpoint,
+            "file_system": partition.fstype
+        })
+    return facts
+
+
+def _gpu_facts() -> List[Dict[str, Any]]:
+    return [
+        {"name": device["name"], "uuid": device["uuid"], "memory_total_mb": device["memory_total_mb"]}
+        for device in get_gpu_telemetry().devices()
+    ]
+
+
+def _battery_facts() -> List[Dict[str, Any]]:
+    reading = get_sysfs_battery().read()
+    if reading is not None and reading["present"]:
+        return [{
+            "manufacturer": reading["manufacturer"],
+            "model": reading["model_name"],
+            "serial": reading["serial_number"],
+            "technology": reading["technology"],
+            "design_capacity_wh": reading["energy_full_design_wh"]
+        }]
+    battery = psutil.sensors_battery() if hasattr(psutil, "sensors_battery") else None
+    return [{"present": True}] if battery is not None else []
+
+
+def _network_facts() -> List[Dict[str, Any]]:
+    physical_only = os.path.isdir(SYS_CLASS_NET)
+    facts = []
+    for name, addresses in sorted(psutil.net_if_addrs().items()):
+        if physical_only and not os.path.exists(os.path.join(SYS_CLASS_NET, name, "device")):
+            continue
+        for address in addresses:
+            if address.family == psutil.AF_LINK and address.address and address.address != NULL_MAC:
+                facts.append({"interface": name, "mac": address.address.lower()})
+    return facts
+
+
+def _peripheral_facts() -> Optional[List[Dict[str, Any]]]:
+    if platform.system() != "Linux":
+        return None
+    snapshot = get_sysfs_peripherals().snapshot()
+    if any(snapshot.get(name) is None for name in ("usb", "audio", "displays", "webcams")):
+        return None
+
+    facts = [
+        {"kind": "usb", "vendor_id": device["vendor_id"], "product_id": device["product_id"],
+         "product": device["product"]}
+        for device in snapshot["usb"]
+    ]
+    facts.extend({"kind": "audio", "id": card["id"], "name": card["name"]} for card in snapshot["audio"])
+    facts.extend({"kind": "display", "name": display["name"]} for display in snapshot["displays"])
+    facts.extend({"kind": "webcam", "name": webcam["name"]} for webcam in snapshot["webcams"])
+    return facts
+
+
+PROBES = {
+    "cpu": _cpu_facts,
+    "ram": _ram_facts,
+    "disks": _disk_facts,
+    "gpu": _gpu_facts,
+    "battery": _battery_facts,
+    "network": _network_facts,
+    "peripherals": _peripheral_facts
+}
+
+
+def extract_static(component: str, output: Any) -> Optional[Any]:
+    if component == "cpu":
+        if not isinstance(output, dict) or not output.get("detected"):
+            return None
+        return {field: output[field] for field in CPU_STATIC_FIELDS}
+    if component == "disks":
+        disks = {
+            disk["mount_point"]: {field: disk[field] for field in DISK_STATIC_FIELDS}
+            for disk in output or [] if disk.get("detected")
+        }
+        return disks or None
+    if component == "peripherals":
+        if not isinstance(output, dict) or str(output.get("status", "")).startswith("Error"):
+            return None
+        return copy.deepcopy(output)
+    return None
+
+
+def diff_inventories(previous: Optional[Dict[str, Any]], current: Dict[str, Any]) -> Dict[str, Any]:
+    changes = {}
+    if previous is not None:
+        for name in INVENTORY_COMPONENTS:
+            before = previous["facts"].get(name)
+            after = current["facts"].get(name)
+            if before is None or after is None:
+                continue
+            if previous["components"].get(name) == current["components"].get(name):
+                continue
+            before_items = {_digest(item): item for item in before}
+            after_items = {_digest(item): item for item in after}
+            changes[name] = {
+                "added": [item for key, item in after_items.items() if key not in before_items],
+                "removed": [item for key, item in before_items.items() if key not in after_items]
+            }
+
+    return {
+        "changed": bool(changes),
+        "previous_fingerprint": previous["fingerprint"] if previous else None,
+        "previous_taken_at": previous["taken_at"] if previous else None,
+        "fingerprint": current["fingerprint"],
+        "components": changes
+    }
+
+
+class HardwareInventory:
+    def __init__(self, history_size: int = INVENTORY_HISTORY_SIZE):
+        self.history_size = history_size
+        self._lock = threading.Lock()
+        self._static: Dict[str, Tuple[str, Any]] = {}
+        self._history: List[Dict[str, Any]] = []
+        self.hits = 0
+        self.misses = 0
+
+    def probe(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        engine = CollectorEngine()
+        for name, probe in PROBES.items():
+            engine.register(name, probe, timeout=timeout if timeout is not None else PROBE_TIMEOUTS.get(name, 5.0),
+                            fallback=lambda _: None)
+        collected = engine.run()
+        facts: Dict[str, Optional[List[Dict[str, Any]]]] = {name: collected["results"].get(name) for name in PROBES}
+
+        components = {name: _digest(value) if value is not None else None for name, value in facts.items()}
+        return {
+            "fingerprint": _digest(components),
+            "components": components,
+            "facts": facts,
+            "timed_out_probes": collected["timed_out"],
+            "taken_at": datetime.now().isoformat()
+        }
+
+    def cached_static(self, component: str, inventory: Dict[str, Any]) -> Optional[Any]:
+        fingerprint = inventory["components"].get(component)
+        with self._lock:
+            entry = self._static.get(component)
+            if fingerprint is None or entry is None or entry[0] != fingerprint:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return copy.deepcopy(entry[1])
+
+    def store_static(self, component: str, inventory: Dict[str, Any], output: Any) -> bool:
+        fingerprint = inventory["components"].get(component)
+        static = extract_static(component, output) if fingerprint is not None else None
+        if static is None:
+            return False
+        with self._lock:
+            self._static[component] = (fingerprint, static)
+        return True
+
+    def record(self, inventory: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            previous = self._history[-1] if self._history else None
+            if previous is None or previous["fingerprint"] != inventory["fingerprint"]:
+                self._history.append(inventory)
+                del self._history[:-self.history_size]
+        return diff_inventories(previous, inventory)
+
+    def latest(self) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._history[-1] if self._history else None
+
+    def history(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(self._history)
+
+    def invalidate(self):
+        with self._lock:
+            self._static.clear()
+        get_disk_topology().invalidate()
+        get_sysfs_peripherals().invalidate()
+        refresh_gpu_devices()
+
+
+_inventory: Optional[HardwareInventory] = None
+_inventory_lock = threading.Lock()
+
+
+def get_hardware_inventory() -> HardwareInventory:
+    global _inventory
+    with _inventory_lock:
+        if _inventory is None:
+            _inventory = HardwareInventory()
+        return _inventory
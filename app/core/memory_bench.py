@@ -0,0 +1,208 @@
+import ctypes
+import psutil
+import random
+import threading
+import time
+from array import array
+from typing import Dict, Any, Optional, List, Callable
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+CACHE_LINE_BYTES = 64
+DEFAULT_WORKING_SETS_KB = [16, 256, 4 * 1024, 32 * 1024, 256 * 1024]
+
+
+class MemoryBuffer:
+    def __init__(self, size_bytes: int):
+        self.size = size_bytes
+        self.data = bytearray(size_bytes)
+        self.address = ctypes.addressof((ctypes.c_char * size_bytes).from_buffer(self.data))
+        self.array = np.frombuffer(self.data, dtype=np.uint64) if NUMPY_AVAILABLE else None
+        self.fill(1)
+
+    def fill(self, value: int):
+        ctypes.memset(self.address, value, self.size)
+
+    def read(self) -> int:
+        if self.array is not None:
+            self.array.sum()
+        else:
+            self.data.find(b"\xff")
+        return self.size
+
+    def copy_from(self, other: "MemoryBuffer") -> int:
+        ctypes.memmove(self.address, other.address, self.size)
+        return 2 * self.size
+
+
+class MemoryBenchmark:
+    @staticmethod
+    def measure_bandwidth(size_bytes: int, min_time: float = 0.05, max_repeats: int = 1000) -> Dict[str, Any]:
+        source = MemoryBuffer(size_bytes)
+        target = MemoryBuffer(size_bytes)
+
+        results = {}
+        operations = {
+            "read": source.read,
+            "write": lambda: (target.fill(7), size_bytes)[1],
+            "copy": lambda: target.copy_from(source)
+        }
+        inner = max(1, (4 * 1024 * 1024) // size_bytes)
+        for name, operation in operations.items():
+            results[f"{name}_gbps"] = MemoryBenchmark._best_rate(operation, min_time, max_repeats, inner)
+
+        return results
+
+    @staticmethod
+    def measure_latency(size_bytes: int, steps: int = 200000) -> float:
+        lines = max(2, size_bytes // CACHE_LINE_BYTES)
+        stride = CACHE_LINE_BYTES // 8
+        chain = array("Q", bytes(lines * CACHE_LINE_BYTES))
+
+        if NUMPY_AVAILABLE:
+            order = np.random.permutation(lines)
+            successors = np.empty(lines, dtype=np.uint64)
+            successors[order] = np.roll(order, -1) * stride
+            np.frombuffer(chain, dtype=np.uint64)[::stride] = successors
+        else:
+            order = list(range(lines))
+            random.shuffle(order)
+            for position in range(lines):
+                chain[order[position] * stride] = order[(position + 1) % lines] * stride
+
+        index = 0
+        for _ in range(min(steps, lines)):
+            index = chain[index]
+
+        start = time.perf_counter()
+        for _ in range(steps):
+            index = chain[index]
+        elapsed = time.perf_counter() - start
+
+        return elapsed / steps * 1e9
+
+    @staticmethod
+    def measure_aggregate_bandwidth(threads: int, size_bytes: int, duration: float = 1.0) -> Dict[str, Any]:
+        results = {}
+        for name in ("write", "copy") + (("read",) if NUMPY_AVAILABLE else ()):
+            pairs = [(MemoryBuffer(size_bytes), MemoryBuffer(size_bytes)) for _ in range(threads)]
+            moved = [0] * threads
+            barrier = threading.Barrier(threads + 1)
+            deadline = [0.0]
+
+            def worker(index: int):
+                source, target = pairs[index]
+                operation = {
+                    "read": source.read,
+                    "write": lambda: (target.fill(7), size_bytes)[1],
+                    "copy": lambda: target.copy_from(source)
+                }[name]
+                barrier.wait()
+                while time.perf_counter() < deadline[0]:
+                    moved[index] += operation()
+
+            workers = [threading.Thread(target=worker, args=(index,), daemon=True) for index in range(threads)]
+            for thread in workers:
+                thread.start()
+            start = time.perf_counter()
+            deadline[0] = start + duration
+            barrier.wait()
+            for thread in workers:
+                thread.join()
+            elapsed = time.perf_counter() - start
+
+            results[f"{name}_gbps"] = round(sum(moved) / elapsed / 1e9, 2)
+            del pairs
+
+        results["threads"] = threads
+        results["buffer_mb_per_thread"] = round(size_bytes / (1024 * 1024), 1)
+        return results
+
+    @staticmethod
+    def run(
+        working_sets_kb: Optional[List[int]] = None,
+        threads: int = 1,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        cancel_event: Optional[threading.Event] = None
+    ) -> Dict[str, Any]:
+        budget_kb = psutil.virtual_memory().available // 1024 // 4
+        requested_kb = sorted(working_sets_kb or DEFAULT_WORKING_SETS_KB)
+        working_sets_kb = [size_kb for size_kb in requested_kb if size_kb * 2 <= budget_kb]
+        skipped_kb = [size_kb for size_kb in requested_kb if size_kb * 2 > budget_kb]
+        overhead_ns = MemoryBenchmark.measure_latency(4 * 1024)
+
+        levels = []
+        cancelled = False
+        for size_kb in working_sets_kb:
+            if cancel_event is not None and cancel_event.is_set():
+                cancelled = True
+                break
+
+            size_bytes = size_kb * 1024
+            bandwidth = MemoryBenchmark.measure_bandwidth(size_bytes)
+            latency_ns = MemoryBenchmark.measure_latency(size_bytes)
+            level = {
+                "working_set_kb": size_kb,
+                **bandwidth,
+                "latency_raw_ns": round(latency_ns, 2),
+                "latency_ns": round(max(0.0, latency_ns - overhead_ns), 2)
+            }
+            levels.append(level)
+
+            if progress_callback:
+                progress_callback(level)
+
+        aggregate = None
+        if not cancelled and threads > 1 and levels:
+            per_thread = min(64 * 1024 * 1024, budget_kb * 1024 // (2 * threads))
+            aggregate = MemoryBenchmark.measure_aggregate_bandwidth(threads, per_thread)
+
+        return {
+            "cancelled": cancelled,
+            "vectorized": NUMPY_AVAILABLE,
+            "interpreter_overhead_ns": round(overhead_ns, 2),
+            "levels": levels,
+            "skipped_working_sets_kb": skipped_kb,
+            "aggregate": aggregate,
+            "cliffs": MemoryBenchmark._find_cliffs(levels)
+        }
+
+    @staticmethod
+    def _best_rate(operation: Callable[[], int], min_time: float, max_repeats: int, inner: int = 1) -> float:
+        best = 0.0
+        spent = 0.0
+        repeats = 0
+        while spent < min_time and repeats < max_repeats:
+            moved = 0
+            start = time.perf_counter()
+            for _ in range(inner):
+                moved += operation()
+            elapsed = time.perf_counter() - start
+            spent += elapsed
+            repeats += 1
+            if elapsed > 0:
+                best = max(best, moved / elapsed)
+        return round(best / 1e9, 2)
+
+    @staticmethod
+    def _find_cliffs(levels: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        cliffs = []
+        for previous, current in zip(levels, levels[1:]):
+            if previous["copy_gbps"] and current["copy_gbps"] < previous["copy_gbps"] * 0.7:
+                cliffs.append({
+                    "between_kb": [previous["working_set_kb"], current["working_set_kb"]],
+                    "copy_gbps_drop_percent": round(
+                        (previous["copy_gbps"] - current["copy_gbps"]) / previous["copy_gbps"] * 100, 1
+                    )
+                })
+            elif current["latency_ns"] > max(previous["latency_ns"], 1.0) * 2:
+                cliffs.append({
+                    "between_kb": [previous["working_set_kb"], current["working_set_kb"]],
+                    "latency_increase_ns": round(current["latency_ns"] - previous["latency_ns"], 2)
+                })
+        return cliffs
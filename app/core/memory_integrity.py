@@ -0,0 +1,246 @@
+import mmap
+import multiprocessing
+import threading
+import time
+from array import array
+from typing import Dict, Any, Optional, List, Callable
+
+import psutil
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+WORD_BYTES = 8
+CHUNK_WORDS = 4 * 1024 * 1024
+MAX_REGION_BYTES = 512 * 1024 * 1024
+MAX_REPORTED_MISMATCHES = 32
+
+PATTERNS = {
+    "walking_ones": "Word i holds a single set bit at position i % 64",
+    "checkerboard": "Alternating 0xAA/0x55 bytes, then the inverse",
+    "address_in_address": "Each word holds its own byte offset"
+}
+
+
+def _periodic_words(pattern: str, phase: int) -> Optional[bytes]:
+    if pattern == "walking_ones":
+        return array("Q", [1 << bit for bit in range(64)]).tobytes()
+    if pattern == "checkerboard":
+        return (b"\xaa\x55" if phase == 0 else b"\x55\xaa") * 4
+    return None
+
+
+def _phases(pattern: str) -> int:
+    return 2 if pattern == "checkerboard" else 1
+
+
+def _expected_chunk(pattern: str, phase: int, base_offset: int, start_word: int, words: int):
+    periodic = _periodic_words(pattern, phase)
+    if NUMPY_AVAILABLE:
+        if periodic is not None:
+            unit = np.frombuffer(periodic, dtype=np.uint64)
+            repeats = -(-words // len(unit)) + 1
+            shift = start_word % len(unit)
+            return np.tile(unit, repeats)[shift:shift + words]
+        first = (base_offset // WORD_BYTES) + start_word
+        return np.arange(first, first + words, dtype=np.uint64) * np.uint64(WORD_BYTES)
+
+    if periodic is not None:
+        unit_words = len(periodic) // WORD_BYTES
+        shift = start_word % unit_words
+        rotated = periodic[shift * WORD_BYTES:] + periodic[:shift * WORD_BYTES]
+        return (rotated * (-(-words // unit_words)))[:words * WORD_BYTES]
+    first = (base_offset // WORD_BYTES) + start_word
+    return array("Q", range(first * WORD_BYTES, (first + words) * WORD_BYTES, WORD_BYTES)).tobytes()
+
+
+def _chunks(pattern: str, phase: int, base_offset: int, total_words: int):
+    periodic = _periodic_words(pattern, phase) is not None
+    cached = _expected_chunk(pattern, phase, base_offset, 0, min(CHUNK_WORDS, total_words)) if periodic else None
+    for start in range(0, total_words, CHUNK_WORDS):
+        words = min(CHUNK_WORDS, total_words - start)
+        if cached is not None:
+            yield start, words, cached[:words * (1 if NUMPY_AVAILABLE else WORD_BYTES)]
+        else:
+            yield start, words, _expected_chunk(pattern, phase, base_offset, start, words)
+
+
+def _fill(buffer: mmap.mmap, pattern: str, phase: int, base_offset: int):
+    total_words = len(buffer) // WORD_BYTES
+    words_view = np.frombuffer(buffer, dtype=np.uint64) if NUMPY_AVAILABLE else None
+    for start, words, expected in _chunks(pattern, phase, base_offset, total_words):
+        if words_view is not None:
+            words_view[start:start + words] = expected
+        else:
+            buffer[start * WORD_BYTES:(start + words) * WORD_BYTES] = expected
+    del words_view
+
+
+def _verify(buffer: mmap.mmap, pattern: str, phase: int, base_offset: int,
+            limit: int = MAX_REPORTED_MISMATCHES) -> Dict[str, Any]:
+    total_words = len(buffer) // WORD_BYTES
+    words_view = np.frombuffer(buffer, dtype=np.uint64) if NUMPY_AVAILABLE else None
+    mismatches = []
+    mismatch_count = 0
+
+    for start, words, expected in _chunks(pattern, phase, base_offset, total_words):
+        if words_view is not None:
+            actual = words_view[start:start + words]
+            bad = np.flatnonzero(actual != expected)
+            mismatch_count += int(bad.size)
+            for index in bad[:max(0, limit - len(mismatches))]:
+                mismatches.append({
+                    "offset": base_offset + (start + int(index)) * WORD_BYTES,
+                    "expected": f"0x{int(expected[index]):016x}",
+                    "actual": f"0x{int(actual[index]):016x}"
+                })
+            continue
+
+        actual = buffer[start * WORD_BYTES:(start + words) * WORD_BYTES]
+        if actual == expected:
+            continue
+        actual_words = array("Q", actual)
+        expected_words = array("Q", expected)
+        for index in range(words):
+            if actual_words[index] != expected_words[index]:
+                mismatch_count += 1
+                if len(mismatches) < limit:
+                    mismatches.append({
+                        "offset": base_offset + (start + index) * WORD_BYTES,
+                        "expected": f"0x{expected_words[index]:016x}",
+                        "actual": f"0x{actual_words[index]:016x}"
+                    })
+
+    del words_view
+    return {"mismatch_count": mismatch_count, "mismatches": mismatches}
+
+
+def _test_region(region_index: int, base_offset: int, size_bytes: int, patterns: List[str]) -> Dict[str, Any]:
+    start_time = time.perf_counter()
+    buffer = mmap.mmap(-1, size_bytes)
+    results = []
+    try:
+        for pattern in patterns:
+            for phase in range(_phases(pattern)):
+                _fill(buffer, pattern, phase, base_offset)
+                outcome = _verify(buffer, pattern, phase, base_offset)
+                results.append({"pattern": pattern, "phase": phase, **outcome})
+    finally:
+        buffer.close()
+
+    return {
+        "region": region_index,
+        "offset": base_offset,
+        "size_bytes": size_bytes,
+        "seconds": round(time.perf_counter() - start_time, 3),
+        "passes": results
+    }
+
+
+def _test_region_task(args) -> Dict[str, Any]:
+    return _test_region(*args)
+
+
+class MemoryIntegrityTester:
+    @staticmethod
+    def plan(size_mb: int, workers: int, budget_fraction: float = 0.5) -> Dict[str, Any]:
+        available = psutil.virtual_memory().available
+        budget = int(available * budget_fraction)
+        total = min(size_mb * 1024 * 1024, budget)
+        region = min(MAX_REGION_BYTES, budget // max(1, workers), total)
+        region -= region % mmap.PAGESIZE
+        regions = total // region if region else 0
+
+        return {
+            "requested_bytes": size_mb * 1024 * 1024,
+            "budget_bytes": budget,
+            "available_bytes": available,
+            "total_bytes": regions * region,
+            "region_bytes": region,
+            "regions": regions,
+            "workers": workers
+        }
+
+    @staticmethod
+    def run(
+        size_mb: int = 1024,
+        patterns: Optional[List[str]] = None,
+        workers: Optional[int] = None,
+        budget_fraction: float = 0.5,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        cancel_event: Optional[threading.Event] = None,
+        start_method: Optional[str] = None
+    ) -> Dict[str, Any]:
+        patterns = patterns or list(PATTERNS)
+        unknown = [pattern for pattern in patterns if pattern not in PATTERNS]
+        if unknown:
+            raise ValueError(f"Unknown patterns: {', '.join(unknown)}")
+
+        workers = workers or psutil.cpu_count(logical=True) or 1
+        plan = MemoryIntegrityTester.plan(size_mb, workers, budget_fraction)
+        tasks = [
+            (index, index * plan["region_bytes"], plan["region_bytes"], patterns)
+            for index in range(plan["regions"])
+        ]
+
+        start_time = time.perf_counter()
+        regions = []
+        cancelled = False
+        context = multiprocessing.get_context(start_method)
+        pool = context.Pool(processes=min(workers, max(1, len(tasks))))
+        try:
+            pending = [pool.apply_async(_test_region_task, (task,)) for task in tasks]
+            while pending:
+                if cancel_event is not None and cancel_event.is_set():
+                    cancelled = True
+                    pool.terminate()
+                    break
+                still_pending = []
+                for result in pending:
+                    if not result.ready():
+                        still_pending.append(result)
+                        continue
+                    region = result.get()
+                    regions.append(region)
+                    if progress_callback:
+                        tested = sum(r["size_bytes"] for r in regions)
+                        progress_callback({
+                            "elapsed_seconds": round(time.perf_counter() - start_time, 2),
+                            "regions_done": len(regions),
+                            "regions_total": len(tasks),
+                            "tested_mb": round(tested / (1024 * 1024), 1),
+                            "mismatches": sum(p["mismatch_count"] for r in regions for p in r["passes"])
+                        })
+                pending = still_pending
+                if pending:
+                    time.sleep(0.05)
+        finally:
+            pool.close()
+            pool.join()
+
+        elapsed = time.perf_counter() - start_time
+        regions.sort(key=lambda region: region["region"])
+        mismatches = [
+            {"pattern": p["pattern"], "phase": p["phase"], **m}
+            for r in regions for p in r["passes"] for m in p["mismatches"]
+        ]
+        mismatch_count = sum(p["mismatch_count"] for r in regions for p in r["passes"])
+        tested_bytes = sum(r["size_bytes"] for r in regions)
+        bytes_moved = tested_bytes * sum(_phases(pattern) for pattern in patterns) * 2
+
+        return {
+            "cancelled": cancelled,
+            "vectorized": NUMPY_AVAILABLE,
+            "patterns": patterns,
+            "plan": plan,
+            "tested_mb": round(tested_bytes / (1024 * 1024), 1),
+            "seconds": round(elapsed, 2),
+            "throughput_gbps": round(bytes_moved / elapsed / 1e9, 2) if elapsed > 0 else 0.0,
+            "mismatch_count": mismatch_count,
+            "mismatches": mismatches[:MAX_REPORTED_MISMATCHES],
+            "regions": regions
+        }
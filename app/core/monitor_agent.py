@@ -0,0 +1,196 @@
+import psutil
+import threading
+import time
+from collections import deque
+from typing import Dict, Any, Optional, List
+from .cpu_sampler import CPUSampler
+
+
+class MonitorAgent:
+    def __init__(self, interval: float = 1.0, buffer_size: int = 600, sensors_every: int = 5):
+        self.interval = interval
+        self.buffer_size = buffer_size
+        self.sensors_every = max(1, sensors_every)
+        self._buffer: deque = deque(maxlen=buffer_size)
+        self._condition = threading.Condition()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._seq = 0
+        self._previous: Optional[Dict[str, Any]] = None
+        self._cpu_sampler = CPUSampler(min_interval=0)
+        self._temperatures: Optional[Dict[str, Any]] = None
+        self._started_at: Optional[float] = None
+        self._cpu_seconds = 0.0
+        self._last_sample_ms: Optional[float] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, interval: Optional[float] = None):
+        if interval is not None:
+            self.interval = interval
+        if self.is_running:
+            return
+
+        self._stop_event.clear()
+        self._previous = None
+        self._cpu_sampler = CPUSampler(min_interval=0)
+        self._started_at = time.monotonic()
+        self._cpu_seconds = 0.0
+        self._thread = threading.Thread(target=self._run, name="monitor-agent", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+        self._thread = None
+        with self._condition:
+            self._condition.notify_all()
+
+    def latest(self, max_age: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        with self._condition:
+            if not self._buffer:
+                return None
+            sample = self._buffer[-1]
+        if max_age is None:
+            max_age = self.interval * 2 + 0.5
+        if time.time() - sample["timestamp"] > max_age:
+            return None
+        return sample
+
+    def samples(self, since_seq: int = -1, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        with self._condition:
+            selected = [sample for sample in self._buffer if sample["seq"] > since_seq]
+        if limit is not None:
+            selected = selected[-limit:]
+        return selected
+
+    def wait_for_sample(self, after_seq: int, timeout: float) -> Optional[Dict[str, Any]]:
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while True:
+                if self._buffer and self._buffer[-1]["seq"] > after_seq:
+                    return self._buffer[-1]
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self.is_running:
+                    return None
+                self._condition.wait(remaining)
+
+    def get_status(self) -> Dict[str, Any]:
+        elapsed = time.monotonic() - self._started_at if self._started_at and self.is_running else None
+        with self._condition:
+            buffered = len(self._buffer)
+        return {
+            "running": self.is_running,
+            "interval_seconds": self.interval,
+            "buffer_size": self.buffer_size,
+            "samples_buffered": buffered,
+            "samples_total": self._seq,
+            "last_sample_ms": self._last_sample_ms,
+            "agent_cpu_seconds": round(self._cpu_seconds, 4),
+            "overhead_percent_of_core": round(self._cpu_seconds / elapsed * 100, 4) if elapsed else None
+        }
+
+    def _run(self):
+        self._collect()
+        while not self._stop_event.wait(self.interval):
+            self._collect()
+
+    def _collect(self):
+        cpu_start = time.thread_time()
+        wall_start = time.perf_counter()
+
+        try:
+            sample = self._take_sample()
+        except Exception as e:
+            sample = {"error": str(e)}
+
+        sample["timestamp"] = time.time()
+        self._cpu_seconds += time.thread_time() - cpu_start
+        self._last_sample_ms = round((time.perf_counter() - wall_start) * 1000, 3)
+
+        with self._condition:
+            self._seq += 1
+            sample["seq"] = self._seq
+            self._buffer.append(sample)
+            self._condition.notify_all()
+
+    def _take_sample(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        cpu = self._cpu_sampler.sample()
+        memory = psutil.virtual_memory()
+        disk_io = psutil.disk_io_counters() if hasattr(psutil, "disk_io_counters") else None
+        net_io = psutil.net_io_counters()
+
+        if self._temperatures is None or self._seq % self.sensors_every == 0:
+            self._temperatures = MonitorAgent.read_temperatures()
+
+        current = {
+            "monotonic": now,
+            "disk_io": disk_io,
+            "net_io": net_io
+        }
+        previous = self._previous
+        self._previous = current
+
+        sample = {
+            "cpu_percent": None,
+            "cpu_percent_per_core": None,
+            "memory_percent": memory.percent,
+            "memory_available_gb": round(memory.available / (1024**3), 3),
+            "disk_read_bytes_per_sec": None,
+            "disk_write_bytes_per_sec": None,
+            "net_sent_bytes_per_sec": None,
+            "net_recv_bytes_per_sec": None,
+            "temperature_celsius": self._temperatures.get("primary") if self._temperatures else None,
+            "temperature_sensors": self._temperatures.get("sensors") if self._temperatures else []
+        }
+
+        if previous is None:
+            return sample
+
+        elapsed = max(now - previous["monotonic"], 1e-6)
+        sample["cpu_percent"] = cpu["cpu_percent"]
+        sample["cpu_percent_per_core"] = cpu["cpu_percent_per_core"]
+
+        if disk_io and previous["disk_io"]:
+            sample["disk_read_bytes_per_sec"] = round((disk_io.read_bytes - previous["disk_io"].read_bytes) / elapsed, 1)
+            sample["disk_write_bytes_per_sec"] = round((disk_io.write_bytes - previous["disk_io"].write_bytes) / elapsed, 1)
+
+        if net_io and previous["net_io"]:
+            sample["net_sent_bytes_per_sec"] = round((net_io.bytes_sent - previous["net_io"].bytes_sent) / elapsed, 1)
+            sample["net_recv_bytes_per_sec"] = round((net_io.bytes_recv - previous["net_io"].bytes_recv) / elapsed, 1)
+
+        return sample
+
+    @staticmethod
+    def read_temperatures() -> Dict[str, Any]:
+        sensors = []
+        primary = None
+        try:
+            if hasattr(psutil, "sensors_temperatures"):
+                for name, entries in (psutil.sensors_temperatures() or {}).items():
+                    for entry in entries:
+                        sensors.append({
+                            "label": entry.label if entry.label else name,
+                            "current": round(entry.current, 2)
+                        })
+                        if primary is None:
+                            primary = round(entry.current, 2)
+        except:
+            pass
+        return {"primary": primary, "sensors": sensors}
+
+
+_agent: Optional[MonitorAgent] = None
+_agent_lock = threading.Lock()
+
+
+def get_monitor_agent() -> MonitorAgent:
+    global _agent
+    with _agent_lock:
+        if _agent is None:
+            _agent = MonitorAgent()
+        return _agent
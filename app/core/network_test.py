@@ -3,7 +3,11 @@ import socket
 import subprocess
 import platform
 import time
-from typing import Dict, Any, List, Optional
+import threading
+from typing import Dict, Any, List, Optional, Callable
+
+from app.core.ping_engine import PingEngine
+from app.core.throughput import ThroughputClient, DEFAULT_PORT as THROUGHPUT_PORT
 
 
 class NetworkScanner:
@@ -101,6 +105,18 @@ class NetworkScanner:
     
     @staticmethod
     def _test_ping(host: str = "8.8.8.8", timeout: int = 3) -> Optional[float]:
+        try:
+            result = PingEngine(timeout=timeout).run([host], count=1)[host]
+            if result["avg_ms"] is not None:
+                return round(result["avg_ms"], 2)
+            if result["error"] is None:
+                return None
+        except Exception:
+            pass
+        return NetworkScanner._system_ping(host, timeout)
+
+    @staticmethod
+    def _system_ping(host: str, timeout: int) -> Optional[float]:
         try:
             param = '-n' if platform.system().lower() == 'windows' else '-c'
             timeout_param = '-w' if platform.system().lower() == 'windows' else '-W'
@@ -174,7 +190,17 @@ class NetworkScanner:
         return max(0, score)
     
     @staticmethod
-    def test_internet_speed() -> Dict[str, Any]:
+    def test_internet_speed(
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        cancel_event: Optional[threading.Event] = None,
+        server: Optional[str] = None,
+        port: int = THROUGHPUT_PORT,
+        streams: int = 4,
+        duration: float = 5.0
+    ) -> Dict[str, Any]:
+        if server:
+            return NetworkScanner.test_lan_throughput(server, port, streams, duration, progress_callback, cancel_event)
+        
         try:
             import speedtest
             
@@ -187,9 +213,24 @@ class NetworkScanner:
             print("Testing download speed...")
             download_speed = st.download() / 1_000_000
             
+            if progress_callback:
+                progress_callback({"phase": "download", "speed_mbps": round(download_speed, 2)})
+            
+            if cancel_event is not None and cancel_event.is_set():
+                return {
+                    "test_passed": False,
+                    "cancelled": True,
+                    "download_speed_mbps": round(download_speed, 2),
+                    "upload_speed_mbps": None,
+                    "error": "Test cancelled"
+                }
+            
             print("Testing upload speed...")
             upload_speed = st.upload() / 1_000_000
             
+            if progress_callback:
+                progress_callback({"phase": "upload", "speed_mbps": round(upload_speed, 2)})
+            
             server_info = st.results.server
             
             return {
@@ -212,6 +253,70 @@ class NetworkScanner:
                 "error": str(e)
             }
     
+    @staticmethod
+    def test_lan_throughput(
+        server: str,
+        port: int = THROUGHPUT_PORT,
+        streams: int = 4,
+        duration: float = 5.0,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        cancel_event: Optional[threading.Event] = None
+    ) -> Dict[str, Any]:
+        try:
+            print(f"Starting throughput test against {server}:{port} with {streams} streams...")
+            
+            client = ThroughputClient(server, port, streams=streams, duration=duration,
+                                      warmup=min(1.0, duration / 4))
+            latency = client.connect_latency()
+            if latency is None:
+                return {
+                    "test_passed": False,
+                    "download_speed_mbps": None,
+                    "upload_speed_mbps": None,
+                    "error": f"Throughput server {server}:{port} is not reachable"
+                }
+            
+            result = client.run(progress_callback, cancel_event)
+            download = result["download"]
+            upload = result["upload"]
+            download_speed = download["goodput_mbps"]
+            upload_speed = upload["goodput_mbps"] if upload else None
+            
+            if result["cancelled"]:
+                return {
+                    "test_passed": False,
+                    "cancelled": True,
+                    "download_speed_mbps": download_speed,
+                    "upload_speed_mbps": upload_speed,
+                    "error": "Test cancelled"
+                }
+            
+            return {
+                "test_passed": not download["errors"] and not upload["errors"],
+                "mode": "lan",
+                "download_speed_mbps": download_speed,
+                "upload_speed_mbps": upload_speed,
+                "ping_ms": latency,
+                "server_name": result["server"],
+                "streams": streams,
+                "download_fairness_index": download["fairness_index"],
+                "upload_fairness_index": upload["fairness_index"],
+                "download_retransmit_percent": download["retransmit_percent"],
+                "upload_retransmit_percent": upload["retransmit_percent"],
+                "download": download,
+                "upload": upload,
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "performance_rating": NetworkScanner._get_speed_rating(download_speed, upload_speed)
+            }
+            
+        except Exception as e:
+            return {
+                "test_passed": False,
+                "download_speed_mbps": None,
+                "upload_speed_mbps": None,
+                "error": str(e)
+            }
+    
     @staticmethod
     def _get_speed_rating(download_mbps: float, upload_mbps: float) -> str:
         if download_mbps > 100:
@@ -226,48 +331,50 @@ class NetworkScanner:
             return "Poor - Slow connection"
     
     @staticmethod
-    def perform_advanced_ping_test(host: str = "8.8.8.8", count: int = 20) -> Dict[str, Any]:
+    def perform_advanced_ping_test(
+        host: str = "8.8.8.8",
+        count: int = 20,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        cancel_event: Optional[threading.Event] = None,
+        hosts: Optional[List[str]] = None,
+        method: str = "auto",
+        port: Optional[int] = None,
+        interval: float = 0.02,
+        timeout: float = 2.0
+    ) -> Dict[str, Any]:
         try:
-            print(f"Performing advanced ping test to {host} with {count} packets...")
+            targets = list(dict.fromkeys(hosts or [host]))
+            print(f"Performing advanced ping test to {', '.join(targets)} with {count} packets ({method})...")
             
-            ping_times = []
-            failed_pings = 0
+            engine = PingEngine(timeout=timeout, interval=interval)
+            if port:
+                engine.tcp_port = engine.udp_port = port
             
-            for i in range(count):
-                ping_result = NetworkScanner._test_ping(host)
-                if ping_result is not None:
-                    ping_times.append(ping_result)
-                else:
-                    failed_pings += 1
-                time.sleep(0.2)
+            start = time.perf_counter()
+            raw_results = engine.run(targets, count, method, progress_callback, cancel_event)
+            elapsed = time.perf_counter() - start
             
-            if not ping_times:
-                return {
-                    "test_passed": False,
-                    "error": "All pings failed"
-                }
-            
-            avg_ping = sum(ping_times) / len(ping_times)
-            min_ping = min(ping_times)
-            max_ping = max(ping_times)
-            
-            jitter = sum(abs(ping_times[i] - ping_times[i-1]) for i in range(1, len(ping_times))) / (len(ping_times) - 1) if len(ping_times) > 1 else 0
-            
-            packet_loss = (failed_pings / count) * 100
+            results = {name: NetworkScanner._ping_host_summary(raw) for name, raw in raw_results.items()}
+            primary = results[targets[0]]
+            if len(targets) == 1:
+                if not primary["test_passed"]:
+                    return {
+                        "test_passed": False,
+                        "host": primary["host"],
+                        "method": primary["method"],
+                        "error": primary["error"]
+                    }
+                return {**primary, "duration_seconds": round(elapsed, 2)}
             
+            reachable = [r for r in results.values() if r["test_passed"]]
             return {
-                "test_passed": True,
-                "host": host,
-                "packets_sent": count,
-                "packets_received": len(ping_times),
-                "packets_lost": failed_pings,
-                "packet_loss_percent": round(packet_loss, 2),
-                "min_ping_ms": round(min_ping, 2),
-                "max_ping_ms": round(max_ping, 2),
-                "average_ping_ms": round(avg_ping, 2),
-                "jitter_ms": round(jitter, 2),
-                "connection_stability": NetworkScanner._get_stability_rating(packet_loss, jitter),
-                "performance_rating": NetworkScanner._get_ping_test_rating(avg_ping, packet_loss, jitter)
+                "test_passed": bool(reachable),
+                "cancelled": any(r["cancelled"] for r in results.values()),
+                "hosts_tested": len(targets),
+                "hosts_reachable": len(reachable),
+                "best_host": min(reachable, key=lambda r: r["average_ping_ms"])["host"] if reachable else None,
+                "duration_seconds": round(elapsed, 2),
+                "hosts": results
             }
             
         except Exception as e:
@@ -276,6 +383,41 @@ class NetworkScanner:
                 "error": str(e)
             }
     
+    @staticmethod
+    def _ping_host_summary(raw: Dict[str, Any]) -> Dict[str, Any]:
+        if not raw["packets_received"]:
+            return {
+                "test_passed": False,
+                "cancelled": raw["cancelled"],
+                "host": raw["host"],
+                "method": raw["method"],
+                "packets_sent": raw["packets_sent"],
+                "packet_loss_percent": raw["packet_loss_percent"],
+                "error": raw["error"] or "All pings failed"
+            }
+        
+        packet_loss = raw["packet_loss_percent"]
+        jitter = raw["jitter_ms"]
+        return {
+            "test_passed": True,
+            "cancelled": raw["cancelled"],
+            "host": raw["host"],
+            "method": raw["method"],
+            "packets_sent": raw["packets_sent"],
+            "packets_received": raw["packets_received"],
+            "packets_lost": raw["packets_lost"],
+            "packet_loss_percent": packet_loss,
+            "min_ping_ms": round(raw["min_ms"], 2),
+            "max_ping_ms": round(raw["max_ms"], 2),
+            "average_ping_ms": round(raw["avg_ms"], 2),
+            "p50_ping_ms": round(raw["p50_ms"], 2),
+            "p90_ping_ms": round(raw["p90_ms"], 2),
+            "p99_ping_ms": round(raw["p99_ms"], 2),
+            "jitter_ms": round(jitter, 2),
+            "connection_stability": NetworkScanner._get_stability_rating(packet_loss, jitter),
+            "performance_rating": NetworkScanner._get_ping_test_rating(raw["avg_ms"], packet_loss, jitter)
+        }
+    
     @staticmethod
     def _get_stability_rating(packet_loss: float, jitter: float) -> str:
         if packet_loss == 0 and jitter < 5:
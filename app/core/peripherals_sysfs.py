@@ -0,0 +1,232 @@
+import os
+import threading
+import time
+from typing import Dict, Any, Optional, List, Tuple
+
+
+USB_CLASS_HID = "03"
+USB_CLASS_AUDIO = "01"
+USB_CLASS_VIDEO = "0e"
+USB_CLASS_HUB = "09"
+HID_PROTOCOL_KEYBOARD = "01"
+HID_PROTOCOL_MOUSE = "02"
+
+
+class SysfsPeripherals:
+    def __init__(self, sys_root: str = "/sys", proc_root: str = "/proc", check_interval: float = 2.0):
+        self.sys_root = sys_root
+        self.proc_root = proc_root
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._signature: Optional[Tuple] = None
+        self._checked_at = 0.0
+        self._snapshot: Dict[str, Any] = {}
+        self.builds = 0
+
+    @property
+    def usb_path(self) -> str:
+        return os.path.join(self.sys_root, "bus", "usb", "devices")
+
+    @property
+    def drm_path(self) -> str:
+        return os.path.join(self.sys_root, "class", "drm")
+
+    @property
+    def video_path(self) -> str:
+        return os.path.join(self.sys_root, "class", "video4linux")
+
+    @property
+    def asound_cards_path(self) -> str:
+        return os.path.join(self.proc_root, "asound", "cards")
+
+    def sources(self) -> Dict[str, bool]:
+        return {
+            "usb": os.path.isdir(self.usb_path),
+            "audio": os.path.isfile(self.asound_cards_path),
+            "displays": os.path.isdir(self.drm_path),
+            "webcams": os.path.isdir(self.video_path)
+        }
+
+    def snapshot(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        if self._signature is not None and now - self._checked_at < self.check_interval:
+            return self._snapshot
+
+        with self._lock:
+            if self._signature is not None and now - self._checked_at < self.check_interval:
+                return self._snapshot
+            signature = self._read_signature()
+            self._checked_at = now
+            if signature != self._signature:
+                self._snapshot = self._build()
+                self._signature = signature
+                self.builds += 1
+            return self._snapshot
+
+    def invalidate(self):
+        with self._lock:
+            self._signature = None
+            self._checked_at = 0.0
+
+    def _read_signature(self) -> Tuple:
+        drm_status = tuple(
+            (name, SysfsPeripherals._read(os.path.join(self.drm_path, name, "status")))
+            for name in SysfsPeripherals._listdir(self.drm_path) if "-" in name
+        )
+        return (
+            SysfsPeripherals._listdir(self.usb_path),
+            drm_status,
+            SysfsPeripherals._listdir(self.video_path),
+            SysfsPeripherals._read(self.asound_cards_path)
+        )
+
+    def _build(self) -> Dict[str, Any]:
+        sources = self.sources()
+        return {
+            "sources": sources,
+            "usb": self._usb_devices() if sources["usb"] else None,
+            "audio": self._audio_cards() if sources["audio"] else None,
+            "displays": self._displays() if sources["displays"] else None,
+            "webcams": self._webcams() if sources["webcams"] else None
+        }
+
+    def _usb_devices(self) -> List[Dict[str, Any]]:
+        devices = []
+        names = SysfsPeripherals._listdir(self.usb_path)
+        interfaces: Dict[str, List[Dict[str, Optional[str]]]] = {}
+        for name in names:
+            if ":" in name:
+                path = os.path.join(self.usb_path, name)
+                interfaces.setdefault(name.split(":", 1)[0], []).append({
+                    "class": SysfsPeripherals._read(os.path.join(path, "bInterfaceClass")),
+                    "protocol": SysfsPeripherals._read(os.path.join(path, "bInterfaceProtocol"))
+                })
+
+        for name in names:
+            if ":" in name:
+                continue
+            path = os.path.join(self.usb_path, name)
+            vendor_id = SysfsPeripherals._read(os.path.join(path, "idVendor"))
+            product_id = SysfsPeripherals._read(os.path.join(path, "idProduct"))
+            if vendor_id is None:
+                continue
+
+            device_class = SysfsPeripherals._read(os.path.join(path, "bDeviceClass"))
+            device_interfaces = interfaces.get(name, [])
+            classes = {interface["class"] for interface in device_interfaces} | {device_class}
+            hid_protocols = {interface["protocol"] for interface in device_interfaces
+                             if interface["class"] == USB_CLASS_HID}
+            speed = SysfsPeripherals._read(os.path.join(path, "speed"))
+            bus = SysfsPeripherals._read_int(os.path.join(path, "busnum"))
+            number = SysfsPeripherals._read_int(os.path.join(path, "devnum"))
+            manufacturer = SysfsPeripherals._read(os.path.join(path, "manufacturer"))
+            product = SysfsPeripherals._read(os.path.join(path, "product"))
+
+            devices.append({
+                "sysfs_name": name,
+                "bus": bus,
+                "device": number,
+                "vendor_id": vendor_id,
+                "product_id": product_id,
+                "manufacturer": manufacturer,
+                "product": product,
+                "speed_mbps": float(speed) if speed and speed.replace(".", "", 1).isdigit() else None,
+                "is_hub": USB_CLASS_HUB in classes,
+                "is_keyboard": HID_PROTOCOL_KEYBOARD in hid_protocols,
+                "is_mouse": HID_PROTOCOL_MOUSE in hid_protocols,
+                "is_audio": USB_CLASS_AUDIO in classes,
+                "is_video": USB_CLASS_VIDEO in classes,
+                "description": (
+                    f"Bus {bus or 0:03d} Device {number or 0:03d}: ID {vendor_id}:{product_id} "
+                    f"{' '.join(part for part in (manufacturer, product) if part)}"
+                ).strip()
+            })
+
+        devices.sort(key=lambda device: (device["bus"] or 0, device["device"] or 0))
+        return devices
+
+    def _audio_cards(self) -> List[Dict[str, Any]]:
+        cards = []
+        content = SysfsPeripherals._read(self.asound_cards_path) or ""
+        for line in content.splitlines():
+            stripped = line.strip()
+            if not stripped or not stripped[0].isdigit() or "]:" not in stripped:
+                continue
+            index, rest = stripped.split("[", 1)
+            card_id, description = rest.split("]:", 1)
+            driver, _, name = description.partition(" - ")
+            cards.append({
+                "index": int(index.strip()),
+                "id": card_id.strip(),
+                "driver": driver.strip(),
+                "name": name.strip() or driver.strip(),
+                "status": "Active"
+            })
+        return cards
+
+    def _displays(self) -> List[Dict[str, Any]]:
+        displays = []
+        for name in SysfsPeripherals._listdir(self.drm_path):
+            if "-" not in name or not name.startswith("card"):
+                continue
+            path = os.path.join(self.drm_path, name)
+            if SysfsPeripherals._read(os.path.join(path, "status")) != "connected":
+                continue
+            modes = SysfsPeripherals._read(os.path.join(path, "modes"))
+            displays.append({
+                "name": name.split("-", 1)[1],
+                "resolution": modes.splitlines()[0] if modes else "Unknown",
+                "enabled": SysfsPeripherals._read(os.path.join(path, "enabled")) == "enabled",
+                "card": name.split("-", 1)[0]
+            })
+        return displays
+
+    def _webcams(self) -> List[Dict[str, Any]]:
+        webcams = []
+        for name in SysfsPeripherals._listdir(self.video_path):
+            path = os.path.join(self.video_path, name)
+            index = SysfsPeripherals._read_int(os.path.join(path, "index"))
+            if index not in (None, 0):
+                continue
+            webcams.append({
+                "name": SysfsPeripherals._read(os.path.join(path, "name")) or f"/dev/{name}",
+                "device": f"/dev/{name}",
+                "status": "Available"
+            })
+        return webcams
+
+    @staticmethod
+    def _listdir(path: str) -> Tuple[str, ...]:
+        try:
+            return tuple(sorted(os.listdir(path)))
+        except OSError:
+            return ()
+
+    @staticmethod
+    def _read(path: str) -> Optional[str]:
+        try:
+            with open(path) as f:
+                value = f.read().strip()
+                return value or None
+        except (OSError, UnicodeDecodeError):
+            return None
+
+    @staticmethod
+    def _read_int(path: str) -> Optional[int]:
+        value = SysfsPeripherals._read(path)
+        try:
+            return int(value) if value is not None else None
+        except ValueError:
+            return None
+
+
+_peripherals: Optional[SysfsPeripherals] = None
+_peripherals_lock = threading.Lock()
+
+
+def get_sysfs_peripherals() -> SysfsPeripherals:
+    global _peripherals
+    with _peripherals_lock:
+        if _peripherals is None:
+            _peripherals = SysfsPeripherals()
+        return _peripherals
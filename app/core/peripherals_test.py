@@ -1,19 +1,50 @@
 import psutil
 import platform
 import subprocess
-from typing import Dict, Any, List
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Callable, Tuple
+
+from .peripherals_sysfs import get_sysfs_peripherals
+
+
+FALLBACK_CACHE_SECONDS = 60.0
+_fallback_cache: Dict[str, Tuple[float, Any]] = {}
+_fallback_lock = threading.Lock()
 
 
 class PeripheralsScanner:
     @staticmethod
-    def get_peripherals_info() -> Dict[str, Any]:
+    def get_peripherals_info(use_cache: bool = True) -> Dict[str, Any]:
         try:
-            usb_devices = PeripheralsScanner._get_usb_devices()
-            audio_devices = PeripheralsScanner._get_audio_devices()
-            displays = PeripheralsScanner._get_display_info()
+            start = time.perf_counter()
+            snapshot: Dict[str, Any] = {}
+            if platform.system() == 'Linux':
+                sysfs = get_sysfs_peripherals()
+                if not use_cache:
+                    sysfs.invalidate()
+                snapshot = sysfs.snapshot()
+            
+            fallbacks = {
+                name: func for name, func in (
+                    ("usb", PeripheralsScanner._get_usb_devices),
+                    ("audio", PeripheralsScanner._get_audio_devices),
+                    ("displays", PeripheralsScanner._get_display_info),
+                    ("webcams", PeripheralsScanner._detect_webcams)
+                ) if snapshot.get(name) is None
+            }
+            fallback_results = PeripheralsScanner._run_fallbacks(fallbacks, use_cache)
+            
+            usb_details = snapshot.get("usb")
+            if usb_details is not None:
+                usb_devices = [device["description"] for device in usb_details]
+            else:
+                usb_details = []
+                usb_devices = fallback_results["usb"]
             
-            keyboard_detected = False
-            mouse_detected = False
+            keyboard_detected = any(device["is_keyboard"] for device in usb_details)
+            mouse_detected = any(device["is_mouse"] for device in usb_details)
             
             for device in usb_devices:
                 device_lower = device.lower()
@@ -22,16 +53,24 @@ class PeripheralsScanner:
                 if any(keyword in device_lower for keyword in ['mouse', 'pointing', 'trackpad', 'touchpad']):
                     mouse_detected = True
             
+            sources = {name: "subprocess" if name in fallbacks else "sysfs"
+                       for name in ("usb", "audio", "displays", "webcams")}
+            
             peripherals_info = {
                 "keyboard_detected": keyboard_detected,
                 "mouse_detected": mouse_detected,
-                "displays": displays,
-                "audio_devices": audio_devices,
-                "usb_devices": usb_devices,
+                "displays": snapshot["displays"] if "displays" not in fallbacks else fallback_results["displays"],
+                "audio_devices": snapshot["audio"] if "audio" not in fallbacks else fallback_results["audio"],
+                "usb_devices": usb_devices[:20],
                 "usb_device_count": len(usb_devices),
+                "usb_device_details": usb_details,
                 "bluetooth_devices": [],
                 "printers": [],
-                "webcams": PeripheralsScanner._detect_webcams(),
+                "webcams": snapshot["webcams"] if "webcams" not in fallbacks else fallback_results["webcams"],
+                "discovery": {
+                    "sources": sources,
+                    "duration_ms": round((time.perf_counter() - start) * 1000, 2)
+                },
                 "status": "Good" if keyboard_detected and mouse_detected else "Warning - Some peripherals not detected"
             }
             
@@ -48,6 +87,30 @@ class PeripheralsScanner:
                 "status": f"Error: {str(e)}"
             }
     
+    @staticmethod
+    def _run_fallbacks(fallbacks: Dict[str, Callable[[], Any]], use_cache: bool = True) -> Dict[str, Any]:
+        results: Dict[str, Any] = {}
+        pending = {}
+        now = time.monotonic()
+        with _fallback_lock:
+            for name, func in fallbacks.items():
+                cached = _fallback_cache.get(name)
+                if use_cache and cached is not None and now - cached[0] < FALLBACK_CACHE_SECONDS:
+                    results[name] = cached[1]
+                else:
+                    pending[name] = func
+        
+        if pending:
+            with ThreadPoolExecutor(max_workers=len(pending), thread_name_prefix="peripherals") as pool:
+                futures = {name: pool.submit(func) for name, func in pending.items()}
+                for name, future in futures.items():
+                    results[name] = future.result()
+            with _fallback_lock:
+                for name in pending:
+                    _fallback_cache[name] = (time.monotonic(), results[name])
+        
+        return results
+    
     @staticmethod
     def _get_usb_devices() -> List[str]:
         usb_devices = []
@@ -78,7 +141,7 @@ class PeripheralsScanner:
         except Exception:
             pass
         
-        return usb_devices[:20]
+        return usb_devices
     
     @staticmethod
     def _get_audio_devices() -> List[Dict[str, Any]]:
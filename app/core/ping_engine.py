@@ -0,0 +1,318 @@
+import asyncio
+import os
+import socket
+import struct
+import threading
+import time
+from typing import Dict, Any, Optional, List, Callable, Tuple
+
+
+ICMP_ECHO_REQUEST = 8
+ICMP_ECHO_REPLY = 0
+ICMPV6_ECHO_REQUEST = 128
+ICMPV6_ECHO_REPLY = 129
+PAYLOAD = b"system-guardian-ping"
+PERCENTILES = (50, 90, 99)
+PING_METHODS = ("auto", "icmp", "tcp", "udp")
+MAX_PING_HOSTS = 10
+
+
+def _checksum(data: bytes) -> int:
+    if len(data) % 2:
+        data += b"\x00"
+    total = sum(struct.unpack(f"!{len(data) // 2}H", data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+
+class _ProbeSocket:
+    def __init__(self, loop, sock: socket.socket, parse: Callable[[bytes], Optional[int]]):
+        self.loop = loop
+        self.sock = sock
+        self.parse = parse
+        self.pending: Dict[int, Tuple[float, asyncio.Future]] = {}
+        sock.setblocking(False)
+        loop.add_reader(sock.fileno(), self._on_readable)
+
+    def send(self, sequence: int, packet: bytes) -> asyncio.Future:
+        future = self.loop.create_future()
+        self.pending[sequence] = (time.perf_counter(), future)
+        try:
+            self.sock.send(packet)
+        except OSError:
+            self.pending.pop(sequence, None)
+            future.set_result(None)
+        return future
+
+    def forget(self, sequence: int):
+        self.pending.pop(sequence, None)
+
+    def close(self):
+        self.loop.remove_reader(self.sock.fileno())
+        self.sock.close()
+
+    def _on_readable(self):
+        while True:
+            try:
+                data = self.sock.recv(2048)
+            except (BlockingIOError, InterruptedError):
+                return
+            except ConnectionRefusedError:
+                if self.pending:
+                    self._resolve(min(self.pending))
+                continue
+            except OSError:
+                return
+            sequence = self.parse(data)
+            if sequence is not None and sequence in self.pending:
+                self._resolve(sequence)
+
+    def _resolve(self, sequence: int):
+        sent, future = self.pending.pop(sequence)
+        if not future.done():
+            future.set_result((time.perf_counter() - sent) * 1000)
+
+
+class PingEngine:
+    def __init__(self, timeout: float = 2.0, interval: float = 0.02, tcp_port: int = 443, udp_port: int = 7):
+        self.timeout = timeout
+        self.interval = interval
+        self.tcp_port = tcp_port
+        self.udp_port = udp_port
+
+    @staticmethod
+    def icmp_socket_type(family: int = socket.AF_INET) -> Optional[int]:
+        protocol = socket.IPPROTO_ICMP if family == socket.AF_INET else socket.IPPROTO_ICMPV6
+        for sock_type in (socket.SOCK_DGRAM, socket.SOCK_RAW):
+            try:
+                socket.socket(family, sock_type, protocol).close()
+                return sock_type
+            except OSError:
+                continue
+        return None
+
+    def run(self, hosts: List[str], count: int = 20, method: str = "auto",
+            progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+            cancel_event: Optional[threading.Event] = None) -> Dict[str, Dict[str, Any]]:
+        return asyncio.run(self.probe_hosts(hosts, count, method, progress_callback, cancel_event))
+
+    async def probe_hosts(self, hosts: List[str], count: int = 20, method: str = "auto",
+                          progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+                          cancel_event: Optional[threading.Event] = None) -> Dict[str, Dict[str, Any]]:
+        results = await asyncio.gather(*[
+            self.probe_host(host, count, method, progress_callback, cancel_event) for host in hosts
+        ])
+        return dict(zip(hosts, results))
+
+    async def probe_host(self, host: str, count: int = 20, method: str = "auto",
+                         progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+                         cancel_event: Optional[threading.Event] = None) -> Dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        try:
+            family, address = await self._resolve(host)
+        except OSError as e:
+            return PingEngine.summarize(host, method, [], count, error=f"Cannot resolve host: {e}")
+
+        icmp_type = PingEngine.icmp_socket_type(family) if method in ("auto", "icmp") else None
+        if method == "auto":
+            method = "icmp" if icmp_type is not None else "tcp"
+        elif method == "icmp" and icmp_type is None:
+            return PingEngine.summarize(host, method, [], count, error="ICMP sockets are not permitted")
+        elif method not in PING_METHODS:
+            raise ValueError(f"Unknown ping method: {method}")
+
+        identifier = os.getpid() & 0xFFFF
+        probe_socket = None
+        try:
+            if method == "icmp":
+                probe_socket = self._icmp_socket(loop, family, address, icmp_type, identifier)
+            elif method == "udp":
+                probe_socket = self._open_probe_socket(
+                    loop, family, socket.SOCK_DGRAM, 0, (address, self.udp_port), PingEngine._parse_udp
+                )
+        except OSError as e:
+            return PingEngine.summarize(host, method, [], count, error=f"Cannot open {method} socket: {e}")
+
+        rtts: List[Optional[float]] = [None] * count
+        tasks = []
+
+        async def probe(sequence: int):
+            if method == "tcp":
+                rtt = await self._tcp_probe(loop, family, address)
+            else:
+                future = probe_socket.send(sequence, self._packet(method, family, identifier, sequence))
+                try:
+                    rtt = await asyncio.wait_for(future, self.timeout)
+                except asyncio.TimeoutError:
+                    probe_socket.forget(sequence)
+                    rtt = None
+            rtts[sequence] = rtt
+            if progress_callback:
+                progress_callback({
+                    "host": host,
+                    "sequence": sequence + 1,
+                    "rtt_ms": round(rtt, 3) if rtt is not None else None
+                })
+
+        sent_count = 0
+        try:
+            for sequence in range(count):
+                if cancel_event is not None and cancel_event.is_set():
+                    break
+                tasks.append(asyncio.ensure_future(probe(sequence)))
+                sent_count += 1
+                if sequence < count - 1:
+                    await asyncio.sleep(self.interval)
+            await asyncio.gather(*tasks)
+        finally:
+            if probe_socket is not None:
+                probe_socket.close()
+
+        return PingEngine.summarize(host, method, rtts[:sent_count], sent_count,
+                                    cancelled=sent_count < count)
+
+    async def _resolve(self, host: str) -> Tuple[int, str]:
+        loop = asyncio.get_running_loop()
+        infos = await loop.getaddrinfo(host, None, type=socket.SOCK_DGRAM)
+        for family in (socket.AF_INET, socket.AF_INET6):
+            for info in infos:
+                if info[0] == family:
+                    return family, info[4][0]
+        raise OSError(f"No address for {host}")
+
+    def _icmp_socket(self, loop, family: int, address: str, sock_type: int, identifier: int) -> _ProbeSocket:
+        protocol_number = socket.IPPROTO_ICMP if family == socket.AF_INET else socket.IPPROTO_ICMPV6
+        reply_type = ICMP_ECHO_REPLY if family == socket.AF_INET else ICMPV6_ECHO_REPLY
+        strip_ip_header = sock_type == socket.SOCK_RAW and family == socket.AF_INET
+        match_identifier = identifier if sock_type == socket.SOCK_RAW else None
+        return self._open_probe_socket(
+            loop, family, sock_type, protocol_number, (address, 0),
+            lambda data: PingEngine._parse_icmp(data, reply_type, strip_ip_header, match_identifier)
+        )
+
+    @staticmethod
+    def _open_probe_socket(loop, family: int, sock_type: int, protocol_number: int, address: Tuple,
+                           parse: Callable[[bytes], Optional[int]]) -> _ProbeSocket:
+        sock = socket.socket(family, sock_type, protocol_number)
+        try:
+            sock.connect(address)
+            return _ProbeSocket(loop, sock, parse)
+        except OSError:
+            sock.close()
+            raise
+
+    async def _tcp_probe(self, loop, family: int, address: str) -> Optional[float]:
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        sock.setblocking(False)
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(loop.sock_connect(sock, (address, self.tcp_port)), self.timeout)
+            return (time.perf_counter() - start) * 1000
+        except ConnectionRefusedError:
+            return (time.perf_counter() - start) * 1000
+        except (asyncio.TimeoutError, OSError):
+            return None
+        finally:
+            sock.close()
+
+    def _packet(self, method: str, family: int, identifier: int, sequence: int) -> bytes:
+        if method == "udp":
+            return struct.pack("!H", sequence) + PAYLOAD
+        request_type = ICMP_ECHO_REQUEST if family == socket.AF_INET else ICMPV6_ECHO_REQUEST
+        header = struct.pack("!BBHHH", request_type, 0, 0, identifier, sequence)
+        checksum = _checksum(header + PAYLOAD) if family == socket.AF_INET else 0
+        return struct.pack("!BBHHH", request_type, 0, checksum, identifier, sequence) + PAYLOAD
+
+    @staticmethod
+    def _parse_icmp(data: bytes, reply_type: int, strip_ip_header: bool = False,
+                    identifier: Optional[int] = None) -> Optional[int]:
+        if strip_ip_header and data:
+            data = data[(data[0] & 0x0F) * 4:]
+        if len(data) < 8 or data[0] != reply_type:
+            return None
+        reply_identifier, sequence = struct.unpack("!HH", data[4:8])
+        if identifier is not None and reply_identifier != identifier:
+            return None
+        return sequence
+
+    @staticmethod
+    def _parse_udp(data: bytes) -> Optional[int]:
+        if len(data) < 2:
+            return None
+        return struct.unpack("!H", data[:2])[0]
+
+    @staticmethod
+    def summarize(host: str, method: str, rtts: List[Optional[float]], sent: int,
+                  cancelled: bool = False, error: Optional[str] = None) -> Dict[str, Any]:
+        received = [rtt for rtt in rtts if rtt is not None]
+        ordered = sorted(received)
+
+        jitter = 0.0
+        previous = None
+        for rtt in received:
+            if previous is not None:
+                jitter += (abs(rtt - previous) - jitter) / 16
+            previous = rtt
+
+        lost = sent - len(received)
+        return {
+            "host": host,
+            "method": method,
+            "cancelled": cancelled,
+            "error": error,
+            "packets_sent": sent,
+            "packets_received": len(received),
+            "packets_lost": lost,
+            "packet_loss_percent": round(lost / sent * 100, 2) if sent else 0.0,
+            "min_ms": round(ordered[0], 3) if ordered else None,
+            "max_ms": round(ordered[-1], 3) if ordered else None,
+            "avg_ms": round(sum(ordered) / len(ordered), 3) if ordered else None,
+            **{
+                f"p{p}_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))], 3) if ordered else None
+                for p in PERCENTILES
+            },
+            "jitter_ms": round(jitter, 3),
+            "rtts_ms": [round(rtt, 3) if rtt is not None else None for rtt in rtts]
+        }
+
+
+class UDPEchoServer:
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self.host = host
+        self.port = port
+        self._thread: Optional[threading.Thread] = None
+        self._sock: Optional[socket.socket] = None
+        self._stop = threading.Event()
+
+    def __enter__(self) -> "UDPEchoServer":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def start(self):
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._sock.bind((self.host, self.port))
+        self._sock.settimeout(0.2)
+        self.port = self._sock.getsockname()[1]
+        self._thread = threading.Thread(target=self._serve, name="udp-echo", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        if self._sock is not None:
+            self._sock.close()
+
+    def _serve(self):
+        while not self._stop.is_set():
+            try:
+                data, addr = self._sock.recvfrom(2048)
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+            self._sock.sendto(data, addr)
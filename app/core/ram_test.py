@@ -1,6 +1,9 @@
 import psutil
 import time
-from typing import Dict, Any
+import threading
+from typing import Dict, Any, Optional, List, Callable
+from .memory_bench import MemoryBenchmark, MemoryBuffer
+from .memory_integrity import MemoryIntegrityTester
 
 
 class RAMScanner:
@@ -73,7 +76,12 @@ class RAMScanner:
         return max(0, score)
     
     @staticmethod
-    def perform_memory_stress_test(duration: int = 5, test_size_mb: int = 100) -> Dict[str, Any]:
+    def perform_memory_stress_test(
+        duration: int = 5,
+        test_size_mb: int = 100,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        cancel_event: Optional[threading.Event] = None
+    ) -> Dict[str, Any]:
         try:
             print(f"Starting RAM stress test for {duration} seconds with {test_size_mb}MB allocation...")
             
@@ -83,17 +91,36 @@ class RAMScanner:
             start_time = time.time()
             allocations = []
             usage_samples = []
+            write_rates = []
+            cancelled = False
             
             while time.time() - start_time < duration:
+                if cancel_event is not None and cancel_event.is_set():
+                    cancelled = True
+                    break
+                
                 try:
-                    allocations.append(bytearray(test_size_bytes))
+                    buffer = MemoryBuffer(test_size_bytes)
+                    allocations.append(buffer)
                     
-                    for i in range(0, test_size_bytes, 1024):
-                        allocations[-1][i] = (i % 256)
+                    fill_start = time.perf_counter()
+                    buffer.fill(len(allocations) % 256)
+                    fill_elapsed = time.perf_counter() - fill_start
+                    write_gbps = round(test_size_bytes / fill_elapsed / 1e9, 2) if fill_elapsed > 0 else None
+                    if write_gbps is not None:
+                        write_rates.append(write_gbps)
                     
                     mem_current = psutil.virtual_memory()
                     usage_samples.append(mem_current.percent)
                     
+                    if progress_callback:
+                        progress_callback({
+                            "elapsed_seconds": round(time.time() - start_time, 2),
+                            "memory_percent": mem_current.percent,
+                            "allocated_mb": len(allocations) * test_size_mb,
+                            "write_gbps": write_gbps
+                        })
+                    
                     time.sleep(0.5)
                     
                 except MemoryError:
@@ -105,6 +132,7 @@ class RAMScanner:
             
             return {
                 "test_passed": True,
+                "cancelled": cancelled,
                 "duration_seconds": duration,
                 "test_size_mb": test_size_mb,
                 "allocations_made": len(usage_samples),
@@ -113,6 +141,7 @@ class RAMScanner:
                 "average_usage_percent": round(sum(usage_samples) / len(usage_samples), 2) if usage_samples else 0,
                 "max_usage_percent": round(max(usage_samples), 2) if usage_samples else 0,
                 "memory_allocated_mb": len(usage_samples) * test_size_mb,
+                "average_write_gbps": round(sum(write_rates) / len(write_rates), 2) if write_rates else None,
                 "performance_rating": "Good - Memory allocation successful"
             }
             
@@ -122,3 +151,97 @@ class RAMScanner:
                 "error": str(e),
                 "performance_rating": "Failed"
             }
+    
+    @staticmethod
+    def perform_memory_benchmark(
+        working_sets_kb: Optional[List[int]] = None,
+        threads: Optional[int] = None,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        cancel_event: Optional[threading.Event] = None
+    ) -> Dict[str, Any]:
+        try:
+            threads = threads or psutil.cpu_count(logical=True) or 1
+            print(f"Starting memory benchmark with {threads} threads...")
+            
+            start_time = time.time()
+            result = MemoryBenchmark.run(
+                working_sets_kb=working_sets_kb,
+                threads=threads,
+                progress_callback=progress_callback,
+                cancel_event=cancel_event
+            )
+            
+            dram = result["levels"][-1] if result["levels"] else None
+            return {
+                "test_passed": True,
+                "duration_seconds": round(time.time() - start_time, 2),
+                **result,
+                "dram_copy_gbps": dram["copy_gbps"] if dram else None,
+                "dram_latency_ns": dram["latency_ns"] if dram else None,
+                "performance_rating": RAMScanner._get_bandwidth_rating(dram["copy_gbps"] if dram else 0)
+            }
+            
+        except Exception as e:
+            return {
+                "test_passed": False,
+                "error": str(e),
+                "performance_rating": "Failed"
+            }
+    
+    @staticmethod
+    def perform_memory_integrity_test(
+        size_mb: int = 1024,
+        patterns: Optional[List[str]] = None,
+        workers: Optional[int] = None,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        cancel_event: Optional[threading.Event] = None
+    ) -> Dict[str, Any]:
+        try:
+            print(f"Starting memory integrity test over {size_mb}MB...")
+            
+            result = MemoryIntegrityTester.run(
+                size_mb=size_mb,
+                patterns=patterns,
+                workers=workers,
+                progress_callback=progress_callback,
+                cancel_event=cancel_event
+            )
+            
+            if result["tested_mb"] == 0 and not result["cancelled"]:
+                return {
+                    "test_passed": False,
+                    **result,
+                    "error": "Insufficient memory to test",
+                    "performance_rating": "Failed"
+                }
+            
+            if result["mismatch_count"]:
+                rating = "Critical - Memory errors detected"
+            elif result["plan"]["total_bytes"] < result["plan"]["requested_bytes"]:
+                rating = "Good - No errors in the tested portion (limited by available memory)"
+            else:
+                rating = "Excellent - No memory errors detected"
+            
+            return {
+                "test_passed": result["mismatch_count"] == 0 and not result["cancelled"] and result["tested_mb"] > 0,
+                **result,
+                "performance_rating": rating
+            }
+            
+        except Exception as e:
+            return {
+                "test_passed": False,
+                "error": str(e),
+                "performance_rating": "Failed"
+            }
+    
+    @staticmethod
+    def _get_bandwidth_rating(copy_gbps: float) -> str:
+        if copy_gbps > 20:
+            return "Excellent - High memory bandwidth"
+        elif copy_gbps > 10:
+            return "Good - Normal memory bandwidth"
+        elif copy_gbps > 5:
+            return "Fair - Memory bandwidth is limited"
+        else:
+            return "Poor - Memory bandwidth is very low"
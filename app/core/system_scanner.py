@@ -1,6 +1,7 @@
 from datetime import datetime
 import uuid
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+from .collector_engine import CollectorEngine
 from .cpu_test import CPUScanner
 from .ram_test import RAMScanner
 from .disk_test import DiskScanner
@@ -8,9 +9,20 @@ from .gpu_test import GPUScanner
 from .battery_test import BatteryScanner
 from .network_test import NetworkScanner
 from .peripherals_test import PeripheralsScanner
+from .inventory import STATIC_COMPONENTS, get_hardware_inventory
 
 
 class SystemScanner:
+    COLLECTOR_TIMEOUTS = {
+        "cpu": 10.0,
+        "ram": 5.0,
+        "disks": 15.0,
+        "gpu": 10.0,
+        "battery": 5.0,
+        "network": 10.0,
+        "peripherals": 20.0
+    }
+    
     def __init__(self):
         self.cpu_scanner = CPUScanner()
         self.ram_scanner = RAMScanner()
@@ -20,7 +32,8 @@ class SystemScanner:
         self.network_scanner = NetworkScanner()
         self.peripherals_scanner = PeripheralsScanner()
     
-    def perform_full_scan(self, device_id: str = None) -> Dict[str, Any]:
+    def perform_full_scan(self, device_id: str = None, collector_timeout: Optional[float] = None,
+                          cpu_window: Optional[float] = None, refresh_inventory: bool = False) -> Dict[str, Any]:
         if device_id is None:
             device_id = str(uuid.uuid4())
         
@@ -28,26 +41,55 @@ class SystemScanner:
         
         print("Starting system scan...")
         
-        print("Scanning CPU...")
-        cpu_info = self.cpu_scanner.get_cpu_info()
-        
-        print("Scanning RAM...")
-        ram_info = self.ram_scanner.get_ram_info()
-        
-        print("Scanning Disks...")
-        disks_info = self.disk_scanner.get_disks_info()
-        
-        print("Scanning GPU...")
-        gpu_info = self.gpu_scanner.get_gpu_info()
-        
-        print("Scanning Battery...")
-        battery_info = self.battery_scanner.get_battery_info()
+        hardware_inventory = get_hardware_inventory()
+        if refresh_inventory:
+            hardware_inventory.invalidate()
+        inventory = hardware_inventory.probe(timeout=collector_timeout)
+        if inventory["timed_out_probes"]:
+            print(f"Inventory probes timed out: {', '.join(inventory['timed_out_probes'])}")
+        cached = {name: hardware_inventory.cached_static(name, inventory) for name in STATIC_COMPONENTS}
         
-        print("Scanning Network...")
-        network_info = self.network_scanner.get_network_info()
-        
-        print("Scanning Peripherals...")
-        peripherals_info = self.peripherals_scanner.get_peripherals_info()
+        if cached["peripherals"] is not None:
+            peripherals_collector = lambda: cached["peripherals"]
+        else:
+            peripherals_collector = lambda: self.peripherals_scanner.get_peripherals_info(use_cache=not refresh_inventory)
+        
+        engine = CollectorEngine(default_timeout=collector_timeout or 15.0)
+        engine.register("cpu", lambda: self.cpu_scanner.get_cpu_info(window=cpu_window, static=cached["cpu"]),
+                        timeout=self._timeout("cpu", collector_timeout))
+        engine.register("ram", self.ram_scanner.get_ram_info, timeout=self._timeout("ram", collector_timeout))
+        engine.register("disks", lambda: self.disk_scanner.get_disks_info(static=cached["disks"]),
+                        timeout=self._timeout("disks", collector_timeout), fallback=self._list_fallback)
+        engine.register("gpu", self.gpu_scanner.get_gpu_info, timeout=self._timeout("gpu", collector_timeout),
+                        fallback=self._list_fallback)
+        engine.register("battery", self.battery_scanner.get_battery_info,
+                        timeout=self._timeout("battery", collector_timeout))
+        engine.register("network", self.network_scanner.get_network_info,
+                        timeout=self._timeout("network", collector_timeout))
+        engine.register("peripherals", peripherals_collector,
+                        timeout=self._timeout("peripherals", collector_timeout))
+        
+        collected = engine.run()
+        results = collected["results"]
+        
+        cpu_info = results["cpu"]
+        ram_info = results["ram"]
+        disks_info = results["disks"]
+        gpu_info = results["gpu"]
+        battery_info = results["battery"]
+        network_info = results["network"]
+        peripherals_info = results["peripherals"]
+        
+        if collected["timed_out"]:
+            print(f"Collectors timed out: {', '.join(collected['timed_out'])}")
+        
+        incomplete = set(collected["timed_out"]) | set(collected["failed"])
+        for name in STATIC_COMPONENTS:
+            if cached[name] is None and name not in incomplete:
+                hardware_inventory.store_static(name, inventory, results[name])
+        changes = hardware_inventory.record(inventory)
+        if changes["changed"]:
+            print(f"Hardware changed since last scan: {', '.join(changes['components'])}")
         
         overall_health, recommendations = self._analyze_system_health(
             cpu_info, ram_info, disks_info, gpu_info, battery_info, network_info
@@ -65,13 +107,39 @@ class SystemScanner:
             "network": network_info,
             "peripherals": peripherals_info,
             "overall_health": overall_health,
-            "recommendations": recommendations
+            "recommendations": recommendations,
+            "inventory": {
+                **inventory,
+                "cached_components": [name for name in STATIC_COMPONENTS if cached[name] is not None],
+                "changes": changes
+            },
+            "partial": bool(collected["timed_out"] or collected["failed"]),
+            "timed_out_collectors": collected["timed_out"],
+            "failed_collectors": collected["failed"],
+            "scan_timings": {
+                "collectors": collected["timings"],
+                "total_ms": collected["total_ms"]
+            }
         }
         
         print("Scan completed successfully!")
         
         return scan_result
     
+    def _timeout(self, name: str, override: Optional[float]) -> float:
+        if override is not None:
+            return override
+        return self.COLLECTOR_TIMEOUTS.get(name, 15.0)
+    
+    @staticmethod
+    def _list_fallback(status: str) -> List[Dict[str, Any]]:
+        return [{
+            "detected": False,
+            "id": None,
+            "device": None,
+            "status": status
+        }]
+    
     def _analyze_system_health(
         self, cpu: Dict, ram: Dict, disks: List[Dict], 
         gpu: List[Dict], battery: Dict, network: Dict
@@ -99,7 +167,7 @@ class SystemScanner:
                 issues.append("critical_disk")
                 recommendations.append(f"مساحة القرص {disk.get('device')} شبه ممتلئة - Disk space critical")
         
-        if battery.get('detected') and battery.get('health_percent', 100) < 70:
+        if battery.get('detected') and battery.get('health_percent') is not None and battery['health_percent'] < 70:
             issues.append("battery_health")
             recommendations.append("صحة البطارية منخفضة - Battery health degraded")
         
@@ -0,0 +1,376 @@
+import argparse
+import json
+import os
+import socket
+import struct
+import tempfile
+import threading
+import time
+import uuid
+from typing import Dict, Any, Optional, List, Callable, Tuple
+
+
+DEFAULT_PORT = 5201
+PAYLOAD_BYTES = 16 * 1024 * 1024
+SEND_CHUNK_BYTES = 4 * 1024 * 1024
+RECV_BUFFER_BYTES = 1024 * 1024
+SOCKET_BUFFER_BYTES = 4 * 1024 * 1024
+TCP_INFO_TOTAL_RETRANS_OFFSET = 100
+TCP_INFO_SND_MSS_OFFSET = 16
+CONNECTION_TIMEOUT_MARGIN = 10.0
+STATS_TTL_SECONDS = 60.0
+
+
+def _payload_file() -> tempfile.TemporaryFile:
+    payload = tempfile.TemporaryFile(prefix="throughput_")
+    block = os.urandom(1024 * 1024)
+    for _ in range(PAYLOAD_BYTES // len(block)):
+        payload.write(block)
+    payload.flush()
+    return payload
+
+
+def _tune(sock: socket.socket):
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    for option in (socket.SO_SNDBUF, socket.SO_RCVBUF):
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, option, SOCKET_BUFFER_BYTES)
+        except OSError:
+            pass
+
+
+def _send_for(sock: socket.socket, payload, deadline: float, counter: List[int],
+              cancel_event: Optional[threading.Event] = None):
+    offset = 0
+    while time.monotonic() < deadline:
+        if cancel_event is not None and cancel_event.is_set():
+            break
+        count = min(SEND_CHUNK_BYTES, PAYLOAD_BYTES - offset)
+        sent = sock.sendfile(payload, offset=offset, count=count)
+        if not sent:
+            break
+        counter[0] += sent
+        offset = (offset + sent) % PAYLOAD_BYTES
+
+
+def _receive_all(sock: socket.socket, counter: List[int]):
+    buffer = memoryview(bytearray(RECV_BUFFER_BYTES))
+    while True:
+        received = sock.recv_into(buffer)
+        if not received:
+            break
+        counter[0] += received
+
+
+def _read_line(sock: socket.socket, limit: int = 4096) -> bytes:
+    line = bytearray()
+    while len(line) < limit:
+        byte = sock.recv(1)
+        if not byte or byte == b"\n":
+            break
+        line += byte
+    return bytes(line)
+
+
+def tcp_retransmits(sock: socket.socket) -> Optional[Dict[str, int]]:
+    if not hasattr(socket, "TCP_INFO"):
+        return None
+    try:
+        info = sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_INFO, 104)
+    except OSError:
+        return None
+    if len(info) < TCP_INFO_TOTAL_RETRANS_OFFSET + 4:
+        return None
+    return {
+        "segments": struct.unpack_from("I", info, TCP_INFO_TOTAL_RETRANS_OFFSET)[0],
+        "mss": struct.unpack_from("I", info, TCP_INFO_SND_MSS_OFFSET)[0]
+    }
+
+
+class ThroughputServer:
+    def __init__(self, host: str = "0.0.0.0", port: int = DEFAULT_PORT, max_duration: float = 60.0):
+        self.host = host
+        self.port = port
+        self.max_duration = max_duration
+        self._sock: Optional[socket.socket] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._stats: Dict[str, Tuple[float, Dict[str, int]]] = {}
+        self._stats_ready = threading.Condition()
+        self._payload = None
+
+    def __enter__(self) -> "ThroughputServer":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def start(self):
+        self._payload = _payload_file()
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._sock.bind((self.host, self.port))
+        self._sock.listen(64)
+        self._sock.settimeout(0.2)
+        self.port = self._sock.getsockname()[1]
+        self._thread = threading.Thread(target=self._serve, name="throughput-server", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        if self._sock is not None:
+            self._sock.close()
+        if self._payload is not None:
+            self._payload.close()
+
+    def serve_forever(self):
+        self.start()
+        try:
+            while self._thread.is_alive():
+                self._thread.join(0.5)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+    def _serve(self):
+        while not self._stop.is_set():
+            try:
+                conn, _ = self._sock.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+            threading.Thread(target=self._handle, args=(conn,), name="throughput-stream", daemon=True).start()
+
+    def _handle(self, conn: socket.socket):
+        try:
+            conn.settimeout(self.max_duration + CONNECTION_TIMEOUT_MARGIN)
+            _tune(conn)
+            request = json.loads(_read_line(conn))
+            command = request.get("command")
+            if command == "download":
+                counter = [0]
+                duration = min(float(request.get("duration", 5)), self.max_duration)
+                with open(self._payload.fileno(), "rb", closefd=False) as payload:
+                    _send_for(conn, payload, time.monotonic() + duration, counter)
+                conn.shutdown(socket.SHUT_WR)
+                conn.recv(1)
+                with self._stats_ready:
+                    now = time.monotonic()
+                    for key in [key for key, (stored_at, _) in self._stats.items()
+                                if now - stored_at > STATS_TTL_SECONDS]:
+                        del self._stats[key]
+                    self._stats[f"{request.get('session')}:{request.get('stream')}"] = (now, {
+                        "bytes_sent": counter[0],
+                        **(tcp_retransmits(conn) or {})
+                    })
+                    self._stats_ready.notify_all()
+            elif command == "upload":
+                counter = [0]
+                _receive_all(conn, counter)
+                conn.sendall(json.dumps({"bytes_received": counter[0]}).encode() + b"\n")
+            elif command == "stats":
+                prefix = f"{request.get('session')}:"
+                expected = int(request.get("streams", 0))
+                with self._stats_ready:
+                    self._stats_ready.wait_for(
+                        lambda: sum(1 for key in self._stats if key.startswith(prefix)) >= expected, timeout=2.0
+                    )
+                    stats = {key[len(prefix):]: self._stats.pop(key)[1] for key in list(self._stats)
+                             if key.startswith(prefix)}
+                conn.sendall(json.dumps(stats).encode() + b"\n")
+        except (OSError, ValueError):
+            pass
+        finally:
+            conn.close()
+
+
+class ThroughputClient:
+    def __init__(self, host: str, port: int = DEFAULT_PORT, streams: int = 4,
+                 duration: float = 5.0, warmup: float = 1.0, timeout: float = 5.0):
+        self.host = host
+        self.port = port
+        self.streams = streams
+        self.duration = duration
+        self.warmup = warmup
+        self.timeout = timeout
+        self.session = uuid.uuid4().hex[:12]
+
+    def run(self, progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+            cancel_event: Optional[threading.Event] = None) -> Dict[str, Any]:
+        latency = self.connect_latency()
+        download = self.phase("download", progress_callback, cancel_event)
+        upload = None
+        if cancel_event is None or not cancel_event.is_set():
+            upload = self.phase("upload", progress_callback, cancel_event)
+        return {
+            "server": f"{self.host}:{self.port}",
+            "streams": self.streams,
+            "duration_seconds": self.duration,
+            "warmup_seconds": self.warmup,
+            "connect_latency_ms": latency,
+            "download": download,
+            "upload": upload,
+            "cancelled": cancel_event is not None and cancel_event.is_set()
+        }
+
+    def connect_latency(self) -> Optional[float]:
+        samples = []
+        for _ in range(3):
+            start = time.perf_counter()
+            try:
+                with socket.create_connection((self.host, self.port), timeout=self.timeout):
+                    samples.append((time.perf_counter() - start) * 1000)
+            except OSError:
+                return None
+        return round(min(samples), 3)
+
+    def _connect(self, command: str, stream: int) -> socket.socket:
+        sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        _tune(sock)
+        request = {"command": command, "duration": self.duration, "session": self.session, "stream": stream}
+        sock.sendall(json.dumps(request).encode() + b"\n")
+        return sock
+
+    def _request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        with socket.create_connection((self.host, self.port), timeout=self.timeout) as sock:
+            sock.sendall(json.dumps(request).encode() + b"\n")
+            return json.loads(sock.makefile("rb").readline() or b"{}")
+
+    def phase(self, direction: str, progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+              cancel_event: Optional[threading.Event] = None) -> Dict[str, Any]:
+        sockets = [self._connect(direction, stream) for stream in range(self.streams)]
+        counters = [[0] for _ in sockets]
+        results: List[Dict[str, Any]] = [{} for _ in sockets]
+        payload = _payload_file() if direction == "upload" else None
+        start = time.monotonic()
+        deadline = start + self.duration
+
+        def stream_worker(index: int):
+            sock = sockets[index]
+            try:
+                if direction == "download":
+                    sock.settimeout(self.duration + self.timeout)
+                    _receive_all(sock, counters[index])
+                    sock.sendall(b"\n")
+                else:
+                    with open(payload.fileno(), "rb", closefd=False) as source:
+                        _send_for(sock, source, deadline, counters[index], cancel_event)
+                    results[index].update(tcp_retransmits(sock) or {})
+                    sock.shutdown(socket.SHUT_WR)
+                    reply = json.loads(sock.makefile("rb").readline() or b"{}")
+                    results[index]["bytes_delivered"] = reply.get("bytes_received")
+            except (OSError, ValueError) as e:
+                results[index]["error"] = str(e)
+            finally:
+                results[index]["finished"] = time.monotonic()
+                sock.close()
+
+        threads = [threading.Thread(target=stream_worker, args=(index,), name=f"throughput-{direction}-{index}",
+                                    daemon=True) for index in range(len(sockets))]
+        for thread in threads:
+            thread.start()
+
+        warmup_bytes = None
+        warmup_at = start + self.warmup
+        samples = []
+        previous_total, previous_time = 0, start
+        while any(thread.is_alive() for thread in threads):
+            time.sleep(0.1)
+            now = time.monotonic()
+            per_stream = [counter[0] for counter in counters]
+            if warmup_bytes is None and now >= warmup_at:
+                warmup_bytes, warmup_at = per_stream, now
+            if now - previous_time >= 0.5:
+                total = sum(per_stream)
+                mbps = (total - previous_total) * 8 / (now - previous_time) / 1_000_000
+                samples.append({"elapsed": round(now - start, 2), "mbps": round(mbps, 2)})
+                previous_total, previous_time = total, now
+                if progress_callback:
+                    progress_callback({"phase": direction, "elapsed": round(now - start, 2), "speed_mbps": round(mbps, 2)})
+            if cancel_event is not None and cancel_event.is_set() and direction == "download":
+                for sock in sockets:
+                    try:
+                        sock.shutdown(socket.SHUT_RDWR)
+                    except OSError:
+                        pass
+        if payload is not None:
+            payload.close()
+
+        end = max((result["finished"] for result in results), default=time.monotonic())
+        if direction == "download":
+            server_stats = {}
+            try:
+                server_stats = self._request({"command": "stats", "session": self.session, "streams": self.streams})
+            except (OSError, ValueError):
+                pass
+            for index, result in enumerate(results):
+                stats = server_stats.get(str(index), {})
+                result["segments"] = stats.get("segments")
+                result["mss"] = stats.get("mss")
+                result["bytes_delivered"] = counters[index][0]
+        return ThroughputClient._summarize(direction, counters, results, start, end, warmup_bytes, warmup_at, samples)
+
+    @staticmethod
+    def _summarize(direction: str, counters: List[List[int]], results: List[Dict[str, Any]], start: float,
+                   end: float, warmup_bytes: Optional[List[int]], warmup_at: float,
+                   samples: List[Dict[str, Any]]) -> Dict[str, Any]:
+        if warmup_bytes is None or end - warmup_at <= 0.1:
+            warmup_bytes, warmup_at = [0] * len(counters), start
+
+        window = end - warmup_at
+        streams = []
+        for index, result in enumerate(results):
+            delivered = result.get("bytes_delivered")
+            if delivered is None:
+                delivered = counters[index][0]
+            segments = result.get("segments")
+            retransmitted = segments * result["mss"] if segments is not None and result.get("mss") else None
+            streams.append({
+                "stream": index,
+                "bytes": delivered,
+                "goodput_mbps": round(max(delivered - warmup_bytes[index], 0) * 8 / window / 1_000_000, 2),
+                "retransmits": segments,
+                "retransmitted_bytes": retransmitted,
+                "error": result.get("error")
+            })
+
+        rates = [stream["goodput_mbps"] for stream in streams]
+        fairness = (sum(rates) ** 2) / (len(rates) * sum(rate * rate for rate in rates)) if any(rates) else None
+        known = [stream for stream in streams if stream["retransmitted_bytes"] is not None]
+        retransmitted = sum(stream["retransmitted_bytes"] for stream in known) if known else None
+        delivered = sum(stream["bytes"] for stream in streams)
+        return {
+            "direction": direction,
+            "goodput_mbps": round(sum(rates), 2),
+            "bytes_total": delivered,
+            "measured_seconds": round(window, 3),
+            "fairness_index": round(fairness, 4) if fairness is not None else None,
+            "retransmits": sum(stream["retransmits"] for stream in known) if known else None,
+            "retransmit_percent": (
+                round(retransmitted / (delivered + retransmitted) * 100, 3)
+                if retransmitted is not None and delivered else None
+            ),
+            "errors": [stream["error"] for stream in streams if stream["error"]],
+            "per_stream": streams,
+            "timeline": samples
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="System Guardian throughput test server")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    args = parser.parse_args()
+
+    server = ThroughputServer(args.host, args.port)
+    print(f"Throughput server listening on {args.host}:{args.port}")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,8 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.routes import subscription_router, scan_router
+from app.routes import subscription_router, scan_router, jobs_router, history_router, agent_router
+from app.core.monitor_agent import get_monitor_agent
+from app.utils.task_executor import get_task_executor
 
 app = FastAPI(
     title="System Guardian API",
@@ -18,6 +20,20 @@ app.add_middleware(
 
 app.include_router(subscription_router)
 app.include_router(scan_router)
+app.include_router(jobs_router)
+app.include_router(history_router)
+app.include_router(agent_router)
+
+
+@app.on_event("startup")
+async def start_monitor_agent():
+    get_monitor_agent().start()
+
+
+@app.on_event("shutdown")
+async def shutdown_executor():
+    get_monitor_agent().stop()
+    get_task_executor().shutdown()
 
 
 @app.get("/")
@@ -65,8 +65,12 @@ class BatteryInfo(BaseModel):
     power_plugged: Optional[bool] = None
     time_left_seconds: Optional[int] = None
     capacity_max_wh: Optional[float] = None
+    capacity_design_wh: Optional[float] = None
     capacity_current_wh: Optional[float] = None
     health_percent: Optional[float] = None
+    cycle_count: Optional[int] = None
+    voltage: Optional[float] = None
+    power_draw_w: Optional[float] = None
     status: str = "Not detected"
 
 
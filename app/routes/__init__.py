@@ -1,4 +1,7 @@
 from .subscription import router as subscription_router
 from .scan import router as scan_router
+from .jobs import router as jobs_router
+from .history import router as history_router
+from .agent import router as agent_router
 
-__all__ = ['subscription_router', 'scan_router']
+__all__ = ['subscription_router', 'scan_router', 'jobs_router', 'history_router', 'agent_router']
@@ -0,0 +1,54 @@
+from fastapi import APIRouter, HTTPException, Query
+from app.core.monitor_agent import get_monitor_agent
+from typing import Dict, Any, Optional
+
+
+router = APIRouter(prefix="/api/agent", tags=["agent"])
+agent = get_monitor_agent()
+
+
+@router.get("/status")
+async def agent_status() -> Dict[str, Any]:
+    return {
+        "success": True,
+        "data": agent.get_status()
+    }
+
+
+@router.get("/samples")
+async def agent_samples(
+    since_seq: int = -1,
+    limit: Optional[int] = Query(None, ge=1, le=10000)
+) -> Dict[str, Any]:
+    samples = agent.samples(since_seq=since_seq, limit=limit)
+    return {
+        "success": True,
+        "count": len(samples),
+        "samples": samples
+    }
+
+
+@router.post("/start")
+async def start_agent(interval: float = 1.0) -> Dict[str, Any]:
+    if interval < 0.1 or interval > 60:
+        raise HTTPException(status_code=400, detail="Interval must be between 0.1 and 60 seconds")
+
+    if agent.is_running and agent.interval != interval:
+        agent.stop()
+    agent.start(interval=interval)
+
+    return {
+        "success": True,
+        "message": "تم تشغيل وكيل المراقبة / Monitoring agent started",
+        "data": agent.get_status()
+    }
+
+
+@router.post("/stop")
+async def stop_agent() -> Dict[str, Any]:
+    agent.stop()
+    return {
+        "success": True,
+        "message": "تم إيقاف وكيل المراقبة / Monitoring agent stopped",
+        "data": agent.get_status()
+    }
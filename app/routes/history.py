@@ -0,0 +1,132 @@
+from fastapi import APIRouter, HTTPException, Query
+from app.utils.database import Database
+from app.utils.task_executor import get_task_executor, TaskRejectedError
+from typing import Dict, Any, Optional
+from datetime import datetime
+
+
+router = APIRouter(prefix="/api/history", tags=["history"])
+db = Database()
+executor = get_task_executor()
+
+
+async def _list_history(**filters) -> Dict[str, Any]:
+    try:
+        result = await executor.run("default", db.list_scan_history, **filters)
+        return {
+            "success": True,
+            **result
+        }
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except TaskRejectedError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/device/{device_id}")
+async def history_by_device(
+    device_id: str,
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = None,
+    include_data: bool = False
+) -> Dict[str, Any]:
+    return await _list_history(device_id=device_id, limit=limit, cursor=cursor, include_data=include_data)
+
+
+@router.get("/subscription/{code}")
+async def history_by_subscription(
+    code: str,
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = None,
+    include_data: bool = False
+) -> Dict[str, Any]:
+    return await _list_history(subscription_code=code, limit=limit, cursor=cursor, include_data=include_data)
+
+
+@router.get("/range")
+async def history_by_range(
+    since: datetime,
+    until: Optional[datetime] = None,
+    device_id: Optional[str] = None,
+    subscription_code: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = None,
+    include_data: bool = False
+) -> Dict[str, Any]:
+    if until is not None and until <= since:
+        raise HTTPException(status_code=400, detail="'until' must be later than 'since'")
+
+    return await _list_history(
+        since=since, until=until, device_id=device_id, subscription_code=subscription_code,
+        limit=limit, cursor=cursor, include_data=include_data
+    )
+
+
+@router.get("/latest")
+async def latest_history(
+    n: int = Query(10, ge=1, le=500),
+    device_id: Optional[str] = None,
+    include_data: bool = False
+) -> Dict[str, Any]:
+    return await _list_history(device_id=device_id, limit=n, include_data=include_data)
+
+
+@router.get("/metrics/{device_id}")
+async def list_device_metrics(device_id: str) -> Dict[str, Any]:
+    try:
+        metrics = await executor.run("default", db.list_device_metrics, device_id)
+        return {
+            "success": True,
+            "device_id": device_id,
+            "count": len(metrics),
+            "metrics": metrics
+        }
+    except TaskRejectedError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/metrics/{device_id}/aggregate")
+async def aggregate_device_metric(
+    device_id: str,
+    metric: str,
+    resolution: str = Query("1h", pattern="^(raw|1m|1h|1d)$"),
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    limit: int = Query(5000, ge=1, le=50000)
+) -> Dict[str, Any]:
+    try:
+        series = await executor.run(
+            "default", db.get_metric_series, device_id, metric, resolution, since, until, limit
+        )
+        return {
+            "success": True,
+            "data": series
+        }
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except TaskRejectedError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/scan/{scan_id}")
+async def get_scan(scan_id: str) -> Dict[str, Any]:
+    try:
+        scan = await executor.run("default", db.get_scan_result, scan_id)
+    except TaskRejectedError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    if scan is None:
+        raise HTTPException(status_code=404, detail="Scan not found")
+
+    return {
+        "success": True,
+        "data": scan
+    }
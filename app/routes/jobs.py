@@ -0,0 +1,308 @@
+from fastapi import APIRouter, Header, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from app.core.cpu_test import CPUScanner
+from app.core.cpu_stress import STRESS_KERNELS
+from app.core.ram_test import RAMScanner
+from app.core.memory_integrity import PATTERNS as MEMORY_PATTERNS
+from app.core.disk_test import DiskScanner, STREAMING_MAX_TEST_SIZE_MB
+from app.core.gpu_test import GPUScanner
+from app.core.battery_test import BatteryScanner, DRAIN_SAMPLE_INTERVAL
+from app.core.network_test import NetworkScanner
+from app.core.ping_engine import PING_METHODS, MAX_PING_HOSTS
+from app.core.throughput import DEFAULT_PORT as THROUGHPUT_PORT
+from app.core.gpu_load import LOAD_GENERATOR_CHOICES
+from app.utils.job_manager import JobManager
+from app.utils.task_executor import TaskRejectedError
+from app.utils.sse import sse_event
+from typing import Dict, Any, Optional, List
+import asyncio
+
+
+router = APIRouter(prefix="/api/jobs", tags=["jobs"])
+job_manager = JobManager()
+
+
+def _check_range(name: str, value: int, low: int, high: int, unit: str = ""):
+    if value < low or value > high:
+        suffix = f" {unit}" if unit else ""
+        raise HTTPException(status_code=400, detail=f"{name} must be between {low} and {high}{suffix}")
+
+
+def _cpu_stress_params(duration: Optional[int] = None, kernel: Optional[str] = None, **_) -> Dict[str, Any]:
+    duration = 5 if duration is None else duration
+    kernel = kernel or "fp_fma"
+    _check_range("Duration", duration, 1, 60, "seconds")
+    if kernel not in STRESS_KERNELS:
+        raise HTTPException(status_code=400, detail=f"Kernel must be one of: {', '.join(STRESS_KERNELS)}")
+    return {"duration": duration, "kernel": kernel}
+
+
+def _ram_stress_params(duration: Optional[int] = None, test_size_mb: Optional[int] = None, **_) -> Dict[str, Any]:
+    duration = 5 if duration is None else duration
+    test_size_mb = 100 if test_size_mb is None else test_size_mb
+    _check_range("Duration", duration, 1, 60, "seconds")
+    _check_range("Test size", test_size_mb, 10, 1000, "MB")
+    return {"duration": duration, "test_size_mb": test_size_mb}
+
+
+def _ram_benchmark_params(threads: Optional[int] = None, working_sets_kb: Optional[List[int]] = None, **_) -> Dict[str, Any]:
+    if threads is not None:
+        _check_range("Threads", threads, 1, 64)
+    for size in working_sets_kb or []:
+        _check_range("Working set size", size, 4, 1024 * 1024, "KB")
+    return {"threads": threads, "working_sets_kb": working_sets_kb}
+
+
+def _ram_integrity_params(size_mb: Optional[int] = None, workers: Optional[int] = None,
+                          patterns: Optional[List[str]] = None, **_) -> Dict[str, Any]:
+    size_mb = 1024 if size_mb is None else size_mb
+    _check_range("Size", size_mb, 16, 65536, "MB")
+    if workers is not None:
+        _check_range("Workers", workers, 1, 64)
+    if patterns and any(pattern not in MEMORY_PATTERNS for pattern in patterns):
+        raise HTTPException(status_code=400, detail=f"Patterns must be among: {', '.join(MEMORY_PATTERNS)}")
+    return {"size_mb": size_mb, "workers": workers, "patterns": patterns}
+
+
+def _disk_speed_params(mount_point: Optional[str] = None, test_size_mb: Optional[int] = None,
+                       streaming: Optional[bool] = None, chunk_size_mb: Optional[int] = None,
+                       **_) -> Dict[str, Any]:
+    test_size_mb = 50 if test_size_mb is None else test_size_mb
+    streaming = bool(streaming)
+    chunk_size_mb = 4 if chunk_size_mb is None else chunk_size_mb
+    _check_range("Test size", test_size_mb, 10, STREAMING_MAX_TEST_SIZE_MB if streaming else 500, "MB")
+    _check_range("Chunk size", chunk_size_mb, 1, 64, "MB")
+    return {
+        "mount_point": mount_point, "test_size_mb": test_size_mb,
+        "streaming": streaming, "chunk_size_mb": chunk_size_mb
+    }
+
+
+def _disk_benchmark_params(mount_point: Optional[str] = None, file_size_mb: Optional[int] = None,
+                           queue_depth: Optional[int] = None, runtime: Optional[float] = None,
+                           direct: Optional[bool] = None, block_sizes_kb: Optional[List[int]] = None,
+                           **_) -> Dict[str, Any]:
+    file_size_mb = 256 if file_size_mb is None else file_size_mb
+    queue_depth = 4 if queue_depth is None else queue_depth
+    runtime = 1.0 if runtime is None else runtime
+    _check_range("File size", file_size_mb, 16, 16384, "MB")
+    _check_range("Queue depth", queue_depth, 1, 64)
+    _check_range("Runtime", runtime, 0.2, 30, "seconds")
+    for size in block_sizes_kb or []:
+        if size % 4:
+            raise HTTPException(status_code=400, detail="Block sizes must be multiples of 4 KB")
+        _check_range("Block size", size, 4, 65536, "KB")
+    return {
+        "mount_point": mount_point, "file_size_mb": file_size_mb, "queue_depth": queue_depth,
+        "runtime": runtime, "direct": True if direct is None else direct, "block_sizes_kb": block_sizes_kb
+    }
+
+
+def _gpu_stress_params(duration: Optional[int] = None, gpu_id: Optional[int] = None,
+                       sample_interval: Optional[float] = None, load_generator: Optional[str] = None,
+                       **_) -> Dict[str, Any]:
+    duration = 10 if duration is None else duration
+    sample_interval = 0.5 if sample_interval is None else sample_interval
+    load_generator = load_generator or "auto"
+    _check_range("Duration", duration, 1, 60, "seconds")
+    _check_range("Sample interval", sample_interval, 0.05, 5, "seconds")
+    if load_generator not in LOAD_GENERATOR_CHOICES:
+        raise HTTPException(status_code=400, detail=f"Load generator must be one of: {', '.join(LOAD_GENERATOR_CHOICES)}")
+    return {
+        "duration": duration, "gpu_id": gpu_id or 0,
+        "sample_interval": sample_interval, "load_generator": load_generator
+    }
+
+
+def _battery_drain_params(duration: Optional[int] = None, sample_interval: Optional[float] = None,
+                          **_) -> Dict[str, Any]:
+    duration = 30 if duration is None else duration
+    sample_interval = DRAIN_SAMPLE_INTERVAL if sample_interval is None else sample_interval
+    _check_range("Duration", duration, 10, 300, "seconds")
+    _check_range("Sample interval", sample_interval, 0.01, 2, "seconds")
+    return {"duration": duration, "sample_interval": sample_interval}
+
+
+def _internet_speed_params(server: Optional[str] = None, port: Optional[int] = None,
+                           streams: Optional[int] = None, duration: Optional[int] = None,
+                           **_) -> Dict[str, Any]:
+    port = THROUGHPUT_PORT if port is None else port
+    streams = 4 if streams is None else streams
+    duration = 5 if duration is None else duration
+    _check_range("Port", port, 1, 65535)
+    _check_range("Streams", streams, 1, 32)
+    _check_range("Duration", duration, 2, 30, "seconds")
+    return {"server": server, "port": port, "streams": streams, "duration": duration}
+
+
+def _network_ping_params(host: Optional[str] = None, count: Optional[int] = None,
+                         hosts: Optional[List[str]] = None, method: Optional[str] = None,
+                         port: Optional[int] = None, **_) -> Dict[str, Any]:
+    count = 20 if count is None else count
+    method = method or "auto"
+    _check_range("Count", count, 5, 100)
+    if method not in PING_METHODS:
+        raise HTTPException(status_code=400, detail=f"Method must be one of: {', '.join(PING_METHODS)}")
+    if hosts and len(hosts) > MAX_PING_HOSTS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_PING_HOSTS} hosts can be tested at once")
+    if port is not None:
+        _check_range("Port", port, 1, 65535)
+    return {"host": host or "8.8.8.8", "count": count, "hosts": hosts, "method": method, "port": port}
+
+
+JOB_TESTS = {
+    "cpu-stress": (CPUScanner.perform_stress_test, _cpu_stress_params, "stress"),
+    "ram-stress": (RAMScanner.perform_memory_stress_test, _ram_stress_params, "stress"),
+    "ram-benchmark": (RAMScanner.perform_memory_benchmark, _ram_benchmark_params, "stress"),
+    "ram-integrity": (RAMScanner.perform_memory_integrity_test, _ram_integrity_params, "stress"),
+    "disk-speed": (DiskScanner.perform_speed_test, _disk_speed_params, "stress"),
+    "disk-benchmark": (DiskScanner.perform_benchmark, _disk_benchmark_params, "stress"),
+    "gpu-stress": (GPUScanner.perform_gpu_stress_test, _gpu_stress_params, "stress"),
+    "battery-drain": (BatteryScanner.perform_battery_drain_test, _battery_drain_params, "stress"),
+    "internet-speed": (NetworkScanner.test_internet_speed, _internet_speed_params, "network"),
+    "network-ping": (NetworkScanner.perform_advanced_ping_test, _network_ping_params, "network"),
+}
+
+
+@router.post("/{test_type}")
+async def submit_job(
+    test_type: str,
+    duration: Optional[int] = None,
+    test_size_mb: Optional[int] = None,
+    mount_point: Optional[str] = None,
+    gpu_id: Optional[int] = None,
+    host: Optional[str] = None,
+    count: Optional[int] = None,
+    kernel: Optional[str] = None,
+    threads: Optional[int] = None,
+    working_sets_kb: Optional[List[int]] = Query(None),
+    size_mb: Optional[int] = None,
+    workers: Optional[int] = None,
+    patterns: Optional[List[str]] = Query(None),
+    file_size_mb: Optional[int] = None,
+    queue_depth: Optional[int] = None,
+    runtime: Optional[float] = None,
+    direct: Optional[bool] = None,
+    block_sizes_kb: Optional[List[int]] = Query(None),
+    streaming: Optional[bool] = None,
+    chunk_size_mb: Optional[int] = None,
+    hosts: Optional[List[str]] = Query(None),
+    method: Optional[str] = None,
+    port: Optional[int] = None,
+    server: Optional[str] = None,
+    streams: Optional[int] = None,
+    sample_interval: Optional[float] = None,
+    load_generator: Optional[str] = None
+) -> Dict[str, Any]:
+    try:
+        if test_type not in JOB_TESTS:
+            raise HTTPException(status_code=404, detail=f"Unknown test type: {test_type}")
+
+        func, build_params, category = JOB_TESTS[test_type]
+        params = build_params(
+            duration=duration, test_size_mb=test_size_mb, mount_point=mount_point,
+            gpu_id=gpu_id, host=host, count=count, kernel=kernel,
+            threads=threads, working_sets_kb=working_sets_kb,
+            size_mb=size_mb, workers=workers, patterns=patterns,
+            file_size_mb=file_size_mb, queue_depth=queue_depth, runtime=runtime,
+            direct=direct, block_sizes_kb=block_sizes_kb,
+            streaming=streaming, chunk_size_mb=chunk_size_mb,
+            hosts=hosts, method=method, port=port,
+            server=server, streams=streams, sample_interval=sample_interval,
+            load_generator=load_generator
+        )
+
+        job = job_manager.submit(test_type, func, params, category=category)
+
+        return {
+            "success": True,
+            "message": "تم إرسال الاختبار / Test job submitted",
+            "job_id": job.job_id,
+            "data": job.to_dict()
+        }
+    except HTTPException:
+        raise
+    except TaskRejectedError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("")
+async def list_jobs() -> Dict[str, Any]:
+    jobs = job_manager.list_jobs()
+    return {
+        "success": True,
+        "count": len(jobs),
+        "jobs": jobs
+    }
+
+
+@router.get("/{job_id}")
+async def get_job(job_id: str, include_samples: bool = False) -> Dict[str, Any]:
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    return {
+        "success": True,
+        "data": job.to_dict(include_samples=include_samples)
+    }
+
+
+@router.delete("/{job_id}")
+async def cancel_job(job_id: str) -> Dict[str, Any]:
+    job = job_manager.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    return {
+        "success": True,
+        "message": "تم طلب إلغاء الاختبار / Job cancellation requested",
+        "data": job.to_dict()
+    }
+
+
+@router.get("/{job_id}/stream")
+async def stream_job(
+    job_id: str,
+    since: Optional[int] = None,
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID")
+) -> StreamingResponse:
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    if since is None:
+        try:
+            since = int(last_event_id) + 1 if last_event_id else 0
+        except ValueError:
+            since = 0
+
+    return StreamingResponse(
+        _job_events(job, since),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+async def _job_events(job, since: int):
+    last_status = None
+    position = max(0, since)
+
+    while True:
+        finished = job.finished
+
+        for sample in job.get_samples(position):
+            position = sample["seq"] + 1
+            yield sse_event("sample", sample, sample["seq"])
+
+        if job.status != last_status:
+            last_status = job.status
+            yield sse_event("status", {"status": job.status})
+
+        if finished:
+            yield sse_event("result", job.to_dict())
+            break
+
+        await asyncio.sleep(0.25)
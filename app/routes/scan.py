@@ -1,45 +1,44 @@
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import FileResponse, StreamingResponse
 from app.core.system_scanner import SystemScanner
 from app.core.cpu_test import CPUScanner
+from app.core.cpu_stress import STRESS_KERNELS, CPUStressEngine
 from app.core.ram_test import RAMScanner
-from app.core.disk_test import DiskScanner
+from app.core.memory_integrity import PATTERNS as MEMORY_PATTERNS
+from app.core.disk_test import DiskScanner, STREAMING_MAX_TEST_SIZE_MB
+from app.core.disk_activity import get_disk_activity_sampler
 from app.core.gpu_test import GPUScanner
-from app.core.battery_test import BatteryScanner
+from app.core.gpu_telemetry import get_gpu_telemetry
+from app.core.gpu_load import LOAD_GENERATOR_CHOICES, list_load_generators
+from app.core.battery_test import BatteryScanner, DRAIN_SAMPLE_INTERVAL
 from app.core.network_test import NetworkScanner
+from app.core.ping_engine import PING_METHODS, MAX_PING_HOSTS
+from app.core.throughput import DEFAULT_PORT as THROUGHPUT_PORT
+from app.core.inventory import get_hardware_inventory
 from app.utils.pdf_generator import PDFGenerator
 from app.utils.json_exporter import JSONExporter
 from app.utils.database import Database
-from typing import Dict, Any, Optional
+from app.utils.task_executor import get_task_executor, TaskRejectedError
+from app.utils.sse import sse_event
+from typing import Dict, Any, Optional, List
+import asyncio
 import uuid
 import os
 
 
 router = APIRouter(prefix="/api/scan", tags=["scan"])
 db = Database()
+executor = get_task_executor()
 
 
 @router.post("/start")
-async def start_scan(subscription_code: str, device_id: Optional[str] = None) -> Dict[str, Any]:
+async def start_scan(subscription_code: str, device_id: Optional[str] = None,
+                     refresh_inventory: bool = False) -> Dict[str, Any]:
     try:
         if device_id is None:
             device_id = str(uuid.uuid4())
         
-        verification = db.verify_subscription(subscription_code, device_id)
-        
-        if not verification.get('valid'):
-            raise HTTPException(status_code=403, detail=verification.get('message'))
-        
-        scanner = SystemScanner()
-        scan_result = scanner.perform_full_scan(device_id)
-        
-        db.increment_scan_count(subscription_code)
-        db.save_scan_result(
-            scan_id=scan_result['scan_id'],
-            subscription_code=subscription_code,
-            device_id=device_id,
-            scan_data=scan_result
-        )
+        scan_result = await executor.run("scan", _run_scan, subscription_code, device_id, refresh_inventory)
         
         return {
             "success": True,
@@ -49,6 +48,57 @@ async def start_scan(subscription_code: str, device_id: Optional[str] = None) ->
     
     except HTTPException:
         raise
+    except TaskRejectedError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+def _run_scan(subscription_code: str, device_id: str, refresh_inventory: bool = False) -> Dict[str, Any]:
+    verification = db.verify_subscription(subscription_code, device_id, bind_device=False)
+    
+    if not verification.get('valid'):
+        raise HTTPException(status_code=403, detail=verification.get('message'))
+    
+    scanner = SystemScanner()
+    scan_result = scanner.perform_full_scan(device_id, refresh_inventory=refresh_inventory)
+    
+    commit = db.commit_scan(
+        code=subscription_code,
+        device_id=device_id,
+        scan_id=scan_result['scan_id'],
+        scan_data=scan_result
+    )
+    
+    if not commit.get('valid'):
+        raise HTTPException(status_code=403, detail=commit.get('message'))
+    
+    return scan_result
+
+
+@router.get("/inventory")
+async def get_inventory(refresh: bool = False) -> Dict[str, Any]:
+    try:
+        hardware_inventory = get_hardware_inventory()
+        if refresh:
+            await executor.run("default", hardware_inventory.invalidate)
+        inventory = await executor.run("default", hardware_inventory.probe)
+        changes = hardware_inventory.record(inventory)
+        
+        return {
+            "success": True,
+            "message": "تم حساب بصمة العتاد / Hardware fingerprint computed",
+            "data": {
+                **inventory,
+                "changes": changes,
+                "history": [
+                    {"fingerprint": entry["fingerprint"], "taken_at": entry["taken_at"]}
+                    for entry in hardware_inventory.history()
+                ]
+            }
+        }
+    except TaskRejectedError as e:
+        raise HTTPException(status_code=429, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -57,7 +107,7 @@ async def start_scan(subscription_code: str, device_id: Optional[str] = None) ->
 async def export_pdf(scan_data: Dict[str, Any]) -> Dict[str, Any]:
     try:
         pdf_gen = PDFGenerator()
-        pdf_path = pdf_gen.generate_report(scan_data)
+        pdf_path = await executor.run("default", pdf_gen.generate_report, scan_data)
         
         return {
             "success": True,
@@ -65,6 +115,8 @@ async def export_pdf(scan_data: Dict[str, Any]) -> Dict[str, Any]:
             "file_path": pdf_path,
             "file_name": os.path.basename(pdf_path)
         }
+    except TaskRejectedError as e:
+        raise HTTPException(status_code=429, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -73,7 +125,7 @@ async def export_pdf(scan_data: Dict[str, Any]) -> Dict[str, Any]:
 async def export_json(scan_data: Dict[str, Any]) -> Dict[str, Any]:
     try:
         json_exporter = JSONExporter()
-        json_path = json_exporter.export_scan_result(scan_data)
+        json_path = await executor.run("default", json_exporter.export_scan_result, scan_data)
         
         return {
             "success": True,
@@ -81,6 +133,8 @@ async def export_json(scan_data: Dict[str, Any]) -> Dict[str, Any]:
             "file_path": json_path,
             "file_name": os.path.basename(json_path)
         }
+    except TaskRejectedError as e:
+        raise HTTPException(status_code=429, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -120,18 +174,25 @@ async def download_report(file_type: str, file_name: str):
 
 
 @router.post("/test/cpu-stress")
-async def test_cpu_stress(duration: int = 5) -> Dict[str, Any]:
+async def test_cpu_stress(duration: int = 5, kernel: str = "fp_fma") -> Dict[str, Any]:
     try:
         if duration < 1 or duration > 60:
             raise HTTPException(status_code=400, detail="Duration must be between 1 and 60 seconds")
         
-        result = CPUScanner.perform_stress_test(duration)
+        if kernel not in STRESS_KERNELS:
+            raise HTTPException(status_code=400, detail=f"Kernel must be one of: {', '.join(STRESS_KERNELS)}")
+        
+        result = await executor.run("stress", CPUScanner.perform_stress_test, duration, kernel=kernel)
         
         return {
             "success": True,
             "message": "اختبار الضغط على المعالج اكتمل / CPU stress test completed",
             "data": result
         }
+    except HTTPException:
+        raise
+    except TaskRejectedError as e:
+        raise HTTPException(status_code=429, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -145,94 +206,383 @@ async def test_ram_stress(duration: int = 5, test_size_mb: int = 100) -> Dict[st
         if test_size_mb < 10 or test_size_mb > 1000:
             raise HTTPException(status_code=400, detail="Test size must be between 10 and 1000 MB")
         
-        result = RAMScanner.perform_memory_stress_test(duration, test_size_mb)
+        result = await executor.run("stress", RAMScanner.perform_memory_stress_test, duration, test_size_mb)
         
         return {
             "success": True,
             "message": "اختبار الذاكرة العشوائية اكتمل / RAM stress test completed",
             "data": result
         }
+    except HTTPException:
+        raise
+    except TaskRejectedError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/test/ram-benchmark")
+async def test_ram_benchmark(
+    threads: Optional[int] = None,
+    working_sets_kb: Optional[List[int]] = Query(None)
+) -> Dict[str, Any]:
+    try:
+        if threads is not None and (threads < 1 or threads > 64):
+            raise HTTPException(status_code=400, detail="Threads must be between 1 and 64")
+        
+        if working_sets_kb and any(size < 4 or size > 1024 * 1024 for size in working_sets_kb):
+            raise HTTPException(status_code=400, detail="Working set sizes must be between 4 KB and 1 GB")
+        
+        result = await executor.run(
+            "stress", RAMScanner.perform_memory_benchmark, working_sets_kb=working_sets_kb, threads=threads
+        )
+        
+        return {
+            "success": True,
+            "message": "اختبار سرعة الذاكرة اكتمل / Memory benchmark completed",
+            "data": result
+        }
+    except HTTPException:
+        raise
+    except TaskRejectedError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/test/ram-integrity")
+async def test_ram_integrity(
+    size_mb: int = 1024,
+    workers: Optional[int] = None,
+    patterns: Optional[List[str]] = Query(None)
+) -> Dict[str, Any]:
+    try:
+        if size_mb < 16 or size_mb > 65536:
+            raise HTTPException(status_code=400, detail="Size must be between 16 and 65536 MB")
+        
+        if workers is not None and (workers < 1 or workers > 64):
+            raise HTTPException(status_code=400, detail="Workers must be between 1 and 64")
+        
+        if patterns and any(pattern not in MEMORY_PATTERNS for pattern in patterns):
+            raise HTTPException(status_code=400, detail=f"Patterns must be among: {', '.join(MEMORY_PATTERNS)}")
+        
+        result = await executor.run(
+            "stress", RAMScanner.perform_memory_integrity_test,
+            size_mb=size_mb, patterns=patterns, workers=workers
+        )
+        
+        return {
+            "success": True,
+            "message": "اختبار سلامة الذاكرة اكتمل / Memory integrity test completed",
+            "data": result
+        }
+    except HTTPException:
+        raise
+    except TaskRejectedError as e:
+        raise HTTPException(status_code=429, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.post("/test/disk-speed")
-async def test_disk_speed(mount_point: Optional[str] = None, test_size_mb: int = 50) -> Dict[str, Any]:
+async def test_disk_speed(
+    mount_point: Optional[str] = None,
+    test_size_mb: int = 50,
+    streaming: bool = False,
+    chunk_size_mb: int = 4
+) -> Dict[str, Any]:
     try:
-        if test_size_mb < 10 or test_size_mb > 500:
-            raise HTTPException(status_code=400, detail="Test size must be between 10 and 500 MB")
+        max_size_mb = STREAMING_MAX_TEST_SIZE_MB if streaming else 500
+        if test_size_mb < 10 or test_size_mb > max_size_mb:
+            raise HTTPException(status_code=400, detail=f"Test size must be between 10 and {max_size_mb} MB")
         
-        result = DiskScanner.perform_speed_test(mount_point, test_size_mb)
+        if chunk_size_mb < 1 or chunk_size_mb > 64:
+            raise HTTPException(status_code=400, detail="Chunk size must be between 1 and 64 MB")
+        
+        result = await executor.run(
+            "stress", DiskScanner.perform_speed_test, mount_point, test_size_mb,
+            streaming=streaming, chunk_size_mb=chunk_size_mb
+        )
         
         return {
             "success": True,
             "message": "اختبار سرعة القرص اكتمل / Disk speed test completed",
             "data": result
         }
+    except HTTPException:
+        raise
+    except TaskRejectedError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/test/disk-benchmark")
+async def test_disk_benchmark(
+    mount_point: Optional[str] = None,
+    file_size_mb: int = 256,
+    queue_depth: int = 4,
+    runtime: float = 1.0,
+    direct: bool = True,
+    block_sizes_kb: Optional[List[int]] = Query(None)
+) -> Dict[str, Any]:
+    try:
+        if file_size_mb < 16 or file_size_mb > 16384:
+            raise HTTPException(status_code=400, detail="File size must be between 16 and 16384 MB")
+        
+        if queue_depth < 1 or queue_depth > 64:
+            raise HTTPException(status_code=400, detail="Queue depth must be between 1 and 64")
+        
+        if runtime < 0.2 or runtime > 30:
+            raise HTTPException(status_code=400, detail="Runtime must be between 0.2 and 30 seconds")
+        
+        if block_sizes_kb and any(size < 4 or size > 65536 or size % 4 for size in block_sizes_kb):
+            raise HTTPException(status_code=400, detail="Block sizes must be multiples of 4 KB up to 64 MB")
+        
+        result = await executor.run(
+            "stress", DiskScanner.perform_benchmark,
+            mount_point=mount_point, file_size_mb=file_size_mb, block_sizes_kb=block_sizes_kb,
+            queue_depth=queue_depth, runtime=runtime, direct=direct
+        )
+        
+        return {
+            "success": True,
+            "message": "اختبار أداء القرص اكتمل / Disk benchmark completed",
+            "data": result
+        }
+    except HTTPException:
+        raise
+    except TaskRejectedError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/gpu-telemetry")
+async def get_gpu_telemetry_readings() -> Dict[str, Any]:
+    try:
+        telemetry = await executor.run("default", get_gpu_telemetry)
+        readings = await executor.run("default", telemetry.read)
+        
+        return {
+            "success": True,
+            "data": {
+                "backend": telemetry.backend_name,
+                "count": len(readings),
+                "gpus": readings
+            }
+        }
+    except TaskRejectedError as e:
+        raise HTTPException(status_code=429, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.post("/test/gpu-stress")
-async def test_gpu_stress(duration: int = 10, gpu_id: int = 0) -> Dict[str, Any]:
+async def test_gpu_stress(
+    duration: int = 10,
+    gpu_id: int = 0,
+    sample_interval: float = 0.5,
+    load_generator: str = "auto"
+) -> Dict[str, Any]:
     try:
         if duration < 1 or duration > 60:
             raise HTTPException(status_code=400, detail="Duration must be between 1 and 60 seconds")
+        if sample_interval < 0.05 or sample_interval > 5:
+            raise HTTPException(status_code=400, detail="Sample interval must be between 0.05 and 5 seconds")
+        if load_generator not in LOAD_GENERATOR_CHOICES:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Load generator must be one of: {', '.join(LOAD_GENERATOR_CHOICES)}"
+            )
         
-        result = GPUScanner.perform_gpu_stress_test(duration, gpu_id)
+        result = await executor.run(
+            "stress", GPUScanner.perform_gpu_stress_test, duration, gpu_id,
+            sample_interval=sample_interval, load_generator=load_generator
+        )
         
         return {
             "success": True,
             "message": "اختبار كرت الشاشة اكتمل / GPU stress test completed",
             "data": result
         }
+    except HTTPException:
+        raise
+    except TaskRejectedError as e:
+        raise HTTPException(status_code=429, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.post("/test/battery-drain")
-async def test_battery_drain(duration: int = 30) -> Dict[str, Any]:
+async def test_battery_drain(duration: int = 30, sample_interval: float = DRAIN_SAMPLE_INTERVAL) -> Dict[str, Any]:
     try:
         if duration < 10 or duration > 300:
             raise HTTPException(status_code=400, detail="Duration must be between 10 and 300 seconds")
+        if sample_interval < 0.01 or sample_interval > 2:
+            raise HTTPException(status_code=400, detail="Sample interval must be between 0.01 and 2 seconds")
         
-        result = BatteryScanner.perform_battery_drain_test(duration)
+        result = await executor.run(
+            "stress", BatteryScanner.perform_battery_drain_test, duration, sample_interval=sample_interval
+        )
         
         return {
             "success": True,
             "message": "اختبار استهلاك البطارية اكتمل / Battery drain test completed",
             "data": result
         }
+    except HTTPException:
+        raise
+    except TaskRejectedError as e:
+        raise HTTPException(status_code=429, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.post("/test/internet-speed")
-async def test_internet_speed() -> Dict[str, Any]:
+async def test_internet_speed(
+    server: Optional[str] = None,
+    port: int = THROUGHPUT_PORT,
+    streams: int = 4,
+    duration: int = 5
+) -> Dict[str, Any]:
     try:
-        result = NetworkScanner.test_internet_speed()
+        if streams < 1 or streams > 32:
+            raise HTTPException(status_code=400, detail="Streams must be between 1 and 32")
+        if duration < 2 or duration > 30:
+            raise HTTPException(status_code=400, detail="Duration must be between 2 and 30 seconds")
+        if port < 1 or port > 65535:
+            raise HTTPException(status_code=400, detail="Port must be between 1 and 65535")
+        
+        result = await executor.run(
+            "network", NetworkScanner.test_internet_speed,
+            server=server, port=port, streams=streams, duration=duration
+        )
         
         return {
             "success": True,
             "message": "اختبار سرعة الإنترنت اكتمل / Internet speed test completed",
             "data": result
         }
+    except HTTPException:
+        raise
+    except TaskRejectedError as e:
+        raise HTTPException(status_code=429, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.post("/test/network-ping")
-async def test_network_ping(host: str = "8.8.8.8", count: int = 20) -> Dict[str, Any]:
+async def test_network_ping(
+    host: str = "8.8.8.8",
+    count: int = 20,
+    hosts: Optional[List[str]] = Query(None),
+    method: str = "auto",
+    port: Optional[int] = None
+) -> Dict[str, Any]:
     try:
         if count < 5 or count > 100:
             raise HTTPException(status_code=400, detail="Count must be between 5 and 100")
+        if method not in PING_METHODS:
+            raise HTTPException(status_code=400, detail=f"Method must be one of: {', '.join(PING_METHODS)}")
+        if hosts and len(hosts) > MAX_PING_HOSTS:
+            raise HTTPException(status_code=400, detail=f"At most {MAX_PING_HOSTS} hosts can be tested at once")
+        if port is not None and (port < 1 or port > 65535):
+            raise HTTPException(status_code=400, detail="Port must be between 1 and 65535")
         
-        result = NetworkScanner.perform_advanced_ping_test(host, count)
+        result = await executor.run(
+            "network", NetworkScanner.perform_advanced_ping_test, host, count,
+            hosts=hosts, method=method, port=port
+        )
         
         return {
             "success": True,
             "message": "اختبار الاتصال بالشبكة اكتمل / Network ping test completed",
             "data": result
         }
+    except HTTPException:
+        raise
+    except TaskRejectedError as e:
+        raise HTTPException(status_code=429, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/test/gpu-stress/generators")
+async def list_gpu_load_generators() -> Dict[str, Any]:
+    try:
+        generators = await executor.run("default", list_load_generators)
+        
+        return {
+            "success": True,
+            "data": generators
+        }
+    except TaskRejectedError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/test/cpu-stress/kernels")
+async def list_cpu_stress_kernels() -> Dict[str, Any]:
+    return {
+        "success": True,
+        "data": CPUStressEngine.list_kernels()
+    }
+
+
+@router.get("/disk-activity")
+async def disk_activity(window: Optional[float] = None) -> Dict[str, Any]:
+    try:
+        if window is not None and (window <= 0 or window > 10):
+            raise HTTPException(status_code=400, detail="Window must be between 0 and 10 seconds")
+        
+        result = await executor.run("default", get_disk_activity_sampler().sample, window)
+        
+        return {
+            "success": True,
+            "data": result
+        }
+    except HTTPException:
+        raise
+    except TaskRejectedError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/disk-activity/stream")
+async def stream_disk_activity(interval: float = 1.0, count: Optional[int] = None):
+    if interval < 0.5 or interval > 60:
+        raise HTTPException(status_code=400, detail="Interval must be between 0.5 and 60 seconds")
+    
+    if count is not None and count < 1:
+        raise HTTPException(status_code=400, detail="Count must be at least 1")
+    
+    return StreamingResponse(
+        _disk_activity_events(interval, count),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+async def _disk_activity_events(interval: float, count: Optional[int]):
+    sampler = get_disk_activity_sampler()
+    sent = 0
+    while count is None or sent < count:
+        try:
+            result = await executor.run("default", sampler.sample)
+            yield sse_event("activity", result, sent)
+        except TaskRejectedError as e:
+            yield sse_event("error", {"error": str(e)}, sent)
+        sent += 1
+        if count is None or sent < count:
+            await asyncio.sleep(interval)
+
+
+@router.get("/executor/stats")
+async def executor_stats() -> Dict[str, Any]:
+    return {
+        "success": True,
+        "data": executor.get_stats()
+    }
@@ -1,5 +1,11 @@
-from .database import Database
+from .database import Database, ConnectionPool
 from .pdf_generator import PDFGenerator
 from .json_exporter import JSONExporter
+from .scan_codec import ScanDataCodec
+from .metrics_store import MetricsStore
+from .task_executor import TaskExecutor, TaskRejectedError, get_task_executor
 
-__all__ = ['Database', 'PDFGenerator', 'JSONExporter']
+__all__ = [
+    'Database', 'ConnectionPool', 'PDFGenerator', 'JSONExporter', 'ScanDataCodec', 'MetricsStore',
+    'TaskExecutor', 'TaskRejectedError', 'get_task_executor'
+]
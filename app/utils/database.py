@@ -1,22 +1,139 @@
 import sqlite3
 import secrets
-from datetime import datetime, timedelta
+import base64
+import queue
+import random
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
 from typing import Optional, List, Dict, Any
 import json
 
+from .scan_codec import ScanDataCodec
+from .metrics_store import MetricsStore
+
+
+class ConnectionPool:
+    PRAGMAS = (
+        "PRAGMA journal_mode = WAL",
+        "PRAGMA synchronous = NORMAL",
+        "PRAGMA cache_size = -16000",
+        "PRAGMA temp_store = MEMORY",
+        "PRAGMA busy_timeout = 5000",
+    )
+    
+    def __init__(self, db_path: str, max_size: int = 8, timeout: float = 10.0, cached_statements: int = 256):
+        self.db_path = db_path
+        self.max_size = max_size
+        self.timeout = timeout
+        self.cached_statements = cached_statements
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+    
+    def create_connection(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.timeout,
+            check_same_thread=False,
+            cached_statements=self.cached_statements
+        )
+        conn.row_factory = sqlite3.Row
+        for pragma in self.PRAGMAS:
+            conn.execute(pragma)
+        return conn
+    
+    def acquire(self) -> sqlite3.Connection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        
+        with self._lock:
+            can_create = self._created < self.max_size
+            if can_create:
+                self._created += 1
+        
+        if can_create:
+            try:
+                return self.create_connection()
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+        
+        try:
+            return self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            raise sqlite3.OperationalError("Timed out waiting for a database connection from the pool")
+    
+    def release(self, conn: sqlite3.Connection):
+        if conn.in_transaction:
+            conn.rollback()
+        self._idle.put(conn)
+    
+    def discard(self, conn: sqlite3.Connection):
+        try:
+            conn.close()
+        finally:
+            with self._lock:
+                self._created -= 1
+    
+    def close_all(self):
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self.discard(conn)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "db_path": self.db_path,
+            "max_size": self.max_size,
+            "connections_open": self._created,
+            "connections_idle": self._idle.qsize()
+        }
+
+
+_pools: Dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_connection_pool(db_path: str, max_size: int = 8) -> ConnectionPool:
+    with _pools_lock:
+        pool = _pools.get(db_path)
+        if pool is None:
+            pool = ConnectionPool(db_path, max_size=max_size)
+            _pools[db_path] = pool
+        return pool
+
 
 class Database:
-    def __init__(self, db_path: str = "db/system_guardian.db"):
+    def __init__(self, db_path: str = "db/system_guardian.db", pool_size: int = 8,
+                 scan_codec: Optional[str] = None):
         self.db_path = db_path
+        self.scan_codec = scan_codec or ScanDataCodec.default_codec()
+        self.pool = get_connection_pool(db_path, max_size=pool_size)
         self.init_database()
     
     def get_connection(self):
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+        return self.pool.create_connection()
+    
+    @contextmanager
+    def connection(self):
+        conn = self.pool.acquire()
+        try:
+            yield conn
+        finally:
+            self.pool.release(conn)
     
     def init_database(self):
-        conn = self.get_connection()
+        with self.connection() as conn:
+            self._create_schema(conn)
+    
+    def _create_schema(self, conn: sqlite3.Connection):
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -41,12 +158,33 @@ class Database:
                 device_id TEXT,
                 scan_data TEXT,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                scan_codec TEXT,
                 FOREIGN KEY (subscription_code) REFERENCES subscriptions(code)
             )
         ''')
         
+        cursor.execute('PRAGMA table_info(scan_history)')
+        if 'scan_codec' not in [column['name'] for column in cursor.fetchall()]:
+            cursor.execute('ALTER TABLE scan_history ADD COLUMN scan_codec TEXT')
+        
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_scan_history_device_created
+            ON scan_history (device_id, created_at)
+        ''')
+        
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_scan_history_subscription_created
+            ON scan_history (subscription_code, created_at)
+        ''')
+        
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_scan_history_created
+            ON scan_history (created_at)
+        ''')
+        
+        MetricsStore.create_schema(cursor)
+        
         conn.commit()
-        conn.close()
     
     def generate_unique_code(self, length: int = 16) -> str:
         return secrets.token_urlsafe(length)[:length].upper()
@@ -56,10 +194,9 @@ class Database:
         created_at = datetime.now()
         expires_at = created_at + timedelta(days=duration_days)
         
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        try:
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            
             cursor.execute('''
                 INSERT INTO subscriptions (code, email, device_id, duration_days, created_at, expires_at)
                 VALUES (?, ?, ?, ?, ?, ?)
@@ -79,96 +216,275 @@ class Database:
                 'is_active': True,
                 'scans_count': 0
             }
-        finally:
-            conn.close()
     
-    def verify_subscription(self, code: str, device_id: Optional[str] = None) -> Dict[str, Any]:
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        try:
+    def verify_subscription(self, code: str, device_id: Optional[str] = None, bind_device: bool = True) -> Dict[str, Any]:
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            
             cursor.execute('''
                 SELECT * FROM subscriptions WHERE code = ? AND is_active = 1
             ''', (code,))
             
             row = cursor.fetchone()
             
-            if not row:
-                return {
-                    'valid': False,
-                    'message': 'الكود غير صحيح أو غير نشط / Invalid or inactive code'
-                }
-            
-            expires_at = datetime.fromisoformat(row['expires_at'])
-            
-            if datetime.now() > expires_at:
-                cursor.execute('UPDATE subscriptions SET is_active = 0 WHERE code = ?', (code,))
+            failure = self._check_subscription(cursor, row, code, device_id)
+            if failure:
                 conn.commit()
-                return {
-                    'valid': False,
-                    'message': 'انتهت صلاحية الاشتراك / Subscription expired',
-                    'expired_at': expires_at.isoformat()
-                }
-            
-            if device_id and row['device_id'] and row['device_id'] != device_id:
-                return {
-                    'valid': False,
-                    'message': 'هذا الكود مرتبط بجهاز آخر / Code is bound to another device'
-                }
-            
-            if device_id and not row['device_id']:
+                return failure
+            
+            if bind_device and device_id and not row['device_id']:
                 cursor.execute('UPDATE subscriptions SET device_id = ? WHERE code = ?', (device_id, code))
                 conn.commit()
             
+            return self._valid_subscription(row)
+    
+    def commit_scan(self, code: str, device_id: Optional[str], scan_id: str,
+                    scan_data: Dict[str, Any], max_retries: int = 5) -> Dict[str, Any]:
+        return self._with_busy_retry(
+            lambda: self._commit_scan_once(code, device_id, scan_id, scan_data),
+            max_retries
+        )
+    
+    def _commit_scan_once(self, code: str, device_id: Optional[str], scan_id: str,
+                          scan_data: Dict[str, Any]) -> Dict[str, Any]:
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('BEGIN IMMEDIATE')
+            
+            try:
+                cursor.execute('''
+                    SELECT * FROM subscriptions WHERE code = ? AND is_active = 1
+                ''', (code,))
+                row = cursor.fetchone()
+                
+                failure = self._check_subscription(cursor, row, code, device_id)
+                if failure:
+                    conn.commit()
+                    return failure
+                
+                if device_id and not row['device_id']:
+                    cursor.execute('UPDATE subscriptions SET device_id = ? WHERE code = ?', (device_id, code))
+                
+                cursor.execute('UPDATE subscriptions SET scans_count = scans_count + 1 WHERE code = ?', (code,))
+                cursor.execute('''
+                    INSERT INTO scan_history (scan_id, subscription_code, device_id, scan_data, scan_codec)
+                    VALUES (?, ?, ?, ?, ?)
+                ''', (scan_id, code, device_id, ScanDataCodec.encode(scan_data, self.scan_codec), self.scan_codec))
+                
+                MetricsStore.record(cursor, device_id, scan_id, int(time.time()),
+                                    MetricsStore.extract_metrics(scan_data))
+                
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            
+            result = self._valid_subscription(row)
+            result['subscription']['scans_count'] = row['scans_count'] + 1
+            return result
+    
+    def _check_subscription(self, cursor: sqlite3.Cursor, row: Optional[sqlite3.Row],
+                            code: str, device_id: Optional[str]) -> Optional[Dict[str, Any]]:
+        if not row:
             return {
-                'valid': True,
-                'message': 'الاشتراك صالح / Subscription is valid',
-                'subscription': {
-                    'code': row['code'],
-                    'email': row['email'],
-                    'expires_at': expires_at.isoformat(),
-                    'days_left': (expires_at - datetime.now()).days,
-                    'scans_count': row['scans_count']
-                }
+                'valid': False,
+                'message': 'الكود غير صحيح أو غير نشط / Invalid or inactive code'
             }
-        finally:
-            conn.close()
+        
+        expires_at = datetime.fromisoformat(row['expires_at'])
+        
+        if datetime.now() > expires_at:
+            cursor.execute('UPDATE subscriptions SET is_active = 0 WHERE code = ?', (code,))
+            return {
+                'valid': False,
+                'message': 'انتهت صلاحية الاشتراك / Subscription expired',
+                'expired_at': expires_at.isoformat()
+            }
+        
+        if device_id and row['device_id'] and row['device_id'] != device_id:
+            return {
+                'valid': False,
+                'message': 'هذا الكود مرتبط بجهاز آخر / Code is bound to another device'
+            }
+        
+        return None
+    
+    @staticmethod
+    def _valid_subscription(row: sqlite3.Row) -> Dict[str, Any]:
+        expires_at = datetime.fromisoformat(row['expires_at'])
+        return {
+            'valid': True,
+            'message': 'الاشتراك صالح / Subscription is valid',
+            'subscription': {
+                'code': row['code'],
+                'email': row['email'],
+                'expires_at': expires_at.isoformat(),
+                'days_left': (expires_at - datetime.now()).days,
+                'scans_count': row['scans_count']
+            }
+        }
+    
+    @staticmethod
+    def _with_busy_retry(operation, max_retries: int = 5, base_delay: float = 0.02):
+        attempt = 0
+        while True:
+            try:
+                return operation()
+            except sqlite3.OperationalError as e:
+                message = str(e).lower()
+                if attempt >= max_retries or ('locked' not in message and 'busy' not in message):
+                    raise
+                time.sleep(base_delay * (2 ** attempt) * (1 + random.random()))
+                attempt += 1
     
     def increment_scan_count(self, code: str):
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        try:
+        with self.connection() as conn:
+            cursor = conn.cursor()
             cursor.execute('UPDATE subscriptions SET scans_count = scans_count + 1 WHERE code = ?', (code,))
             conn.commit()
-        finally:
-            conn.close()
     
     def save_scan_result(self, scan_id: str, subscription_code: str, device_id: str, scan_data: Dict[str, Any]):
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        try:
+        with self.connection() as conn:
+            cursor = conn.cursor()
             cursor.execute('''
-                INSERT INTO scan_history (scan_id, subscription_code, device_id, scan_data)
-                VALUES (?, ?, ?, ?)
-            ''', (scan_id, subscription_code, device_id, json.dumps(scan_data)))
+                INSERT INTO scan_history (scan_id, subscription_code, device_id, scan_data, scan_codec)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (scan_id, subscription_code, device_id,
+                  ScanDataCodec.encode(scan_data, self.scan_codec), self.scan_codec))
+            MetricsStore.record(cursor, device_id, scan_id, int(time.time()),
+                                MetricsStore.extract_metrics(scan_data))
             conn.commit()
-        finally:
-            conn.close()
     
-    def get_all_subscriptions(self) -> List[Dict[str, Any]]:
-        conn = self.get_connection()
-        cursor = conn.cursor()
+    def get_scan_result(self, scan_id: str) -> Optional[Dict[str, Any]]:
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT id, scan_id, subscription_code, device_id, created_at, scan_data, scan_codec
+                FROM scan_history WHERE scan_id = ?
+            ''', (scan_id,))
+            row = cursor.fetchone()
+            return self._history_row(row, include_data=True) if row else None
+    
+    def list_scan_history(
+        self,
+        device_id: Optional[str] = None,
+        subscription_code: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        include_data: bool = False
+    ) -> Dict[str, Any]:
+        conditions = []
+        params: List[Any] = []
+        
+        if device_id is not None:
+            conditions.append('device_id = ?')
+            params.append(device_id)
+        
+        if subscription_code is not None:
+            conditions.append('subscription_code = ?')
+            params.append(subscription_code)
+        
+        if since is not None:
+            conditions.append('created_at >= ?')
+            params.append(self._history_timestamp(since))
+        
+        if until is not None:
+            conditions.append('created_at < ?')
+            params.append(self._history_timestamp(until))
+        
+        if cursor:
+            cursor_created_at, cursor_id = self._decode_history_cursor(cursor)
+            conditions.append('(created_at, id) < (?, ?)')
+            params.extend([cursor_created_at, cursor_id])
+        
+        columns = 'id, scan_id, subscription_code, device_id, created_at'
+        if include_data:
+            columns += ', scan_data, scan_codec'
+        
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ''
+        query = f'SELECT {columns} FROM scan_history {where} ORDER BY created_at DESC, id DESC LIMIT ?'
+        params.append(limit + 1)
+        
+        with self.connection() as conn:
+            rows = conn.execute(query, params).fetchall()
+        
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        next_cursor = None
+        if has_more and rows:
+            next_cursor = self._encode_history_cursor(rows[-1]['created_at'], rows[-1]['id'])
+        
+        return {
+            'items': [self._history_row(row, include_data) for row in rows],
+            'count': len(rows),
+            'next_cursor': next_cursor
+        }
+    
+    @staticmethod
+    def _history_row(row: sqlite3.Row, include_data: bool = False) -> Dict[str, Any]:
+        item = {
+            'scan_id': row['scan_id'],
+            'subscription_code': row['subscription_code'],
+            'device_id': row['device_id'],
+            'created_at': row['created_at']
+        }
+        if include_data:
+            item['scan_data'] = ScanDataCodec.decode(row['scan_data'], row['scan_codec']) if row['scan_data'] else None
+        return item
+    
+    @staticmethod
+    def _history_timestamp(value: datetime) -> str:
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value.strftime('%Y-%m-%d %H:%M:%S')
+    
+    @staticmethod
+    def _encode_history_cursor(created_at: str, row_id: int) -> str:
+        raw = json.dumps([created_at, row_id]).encode('utf-8')
+        return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+    
+    @staticmethod
+    def _decode_history_cursor(cursor: str) -> tuple:
         try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            created_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+            return str(created_at), int(row_id)
+        except Exception:
+            raise ValueError('Invalid history cursor')
+    
+    def get_metric_series(self, device_id: str, metric: str, resolution: str = "1h",
+                          since: Optional[datetime] = None, until: Optional[datetime] = None,
+                          limit: int = 5000) -> Dict[str, Any]:
+        with self.connection() as conn:
+            return MetricsStore.query(
+                conn, device_id, metric, resolution,
+                since=self._epoch_seconds(since) if since else None,
+                until=self._epoch_seconds(until) if until else None,
+                limit=limit
+            )
+    
+    def list_device_metrics(self, device_id: str) -> List[str]:
+        with self.connection() as conn:
+            return MetricsStore.list_metrics(conn, device_id)
+    
+    @staticmethod
+    def _epoch_seconds(value: datetime) -> int:
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return int(value.timestamp())
+    
+    def get_all_subscriptions(self) -> List[Dict[str, Any]]:
+        with self.connection() as conn:
+            cursor = conn.cursor()
             cursor.execute('SELECT * FROM subscriptions ORDER BY created_at DESC')
             rows = cursor.fetchall()
             return [dict(row) for row in rows]
-        finally:
-            conn.close()
     
     def renew_subscription(self, code: str, additional_days: int = 30) -> Dict[str, Any]:
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        try:
+        with self.connection() as conn:
+            cursor = conn.cursor()
             cursor.execute('SELECT * FROM subscriptions WHERE code = ?', (code,))
             row = cursor.fetchone()
             
@@ -196,5 +512,3 @@ class Database:
                 'message': 'تم تجديد الاشتراك بنجاح / Subscription renewed successfully',
                 'new_expires_at': new_expires.isoformat()
             }
-        finally:
-            conn.close()
@@ -0,0 +1,137 @@
+import threading
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Any, Callable, Optional, List
+
+from .task_executor import TaskExecutor, get_task_executor
+
+
+class Job:
+    def __init__(self, test_type: str, params: Dict[str, Any]):
+        self.job_id = f"JOB-{datetime.now().strftime('%Y%m%d%H%M%S')}-{uuid.uuid4().hex[:8]}"
+        self.test_type = test_type
+        self.params = params
+        self.status = "queued"
+        self.created_at = datetime.now()
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self.cancel_event = threading.Event()
+        self._samples: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("completed", "failed", "cancelled")
+
+    def add_sample(self, sample: Dict[str, Any]):
+        with self._lock:
+            self._samples.append(dict(sample, seq=len(self._samples)))
+
+    def get_samples(self, since: int = 0) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(self._samples[since:])
+
+    def to_dict(self, include_samples: bool = False) -> Dict[str, Any]:
+        with self._lock:
+            samples_count = len(self._samples)
+            latest_sample = self._samples[-1] if self._samples else None
+            samples = list(self._samples) if include_samples else None
+
+        job_info = {
+            "job_id": self.job_id,
+            "test_type": self.test_type,
+            "params": self.params,
+            "status": self.status,
+            "created_at": self.created_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "samples_count": samples_count,
+            "latest_sample": latest_sample,
+            "result": self.result,
+            "error": self.error
+        }
+
+        if include_samples:
+            job_info["samples"] = samples
+
+        return job_info
+
+
+class JobManager:
+    def __init__(self, executor: Optional[TaskExecutor] = None, max_finished_jobs: int = 200):
+        self.executor = executor or get_task_executor()
+        self.max_finished_jobs = max_finished_jobs
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, test_type: str, func: Callable[..., Dict[str, Any]],
+               params: Dict[str, Any], category: str = "stress") -> Job:
+        job = Job(test_type, params)
+
+        with self._lock:
+            self._jobs[job.job_id] = job
+            self._prune()
+
+        try:
+            self.executor.submit(category, self._run_job, job, func)
+        except Exception:
+            with self._lock:
+                self._jobs.pop(job.job_id, None)
+            raise
+
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list_jobs(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            jobs = list(self._jobs.values())
+        return [job.to_dict() for job in reversed(jobs)]
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        job = self.get(job_id)
+        if job is None:
+            return None
+
+        job.cancel_event.set()
+        if job.status == "queued":
+            job.status = "cancelled"
+            job.finished_at = datetime.now()
+        return job
+
+    def _run_job(self, job: Job, func: Callable[..., Dict[str, Any]]):
+        if job.cancel_event.is_set():
+            return
+
+        job.status = "running"
+        job.started_at = datetime.now()
+
+        try:
+            job.result = func(
+                progress_callback=job.add_sample,
+                cancel_event=job.cancel_event,
+                **job.params
+            )
+            if job.cancel_event.is_set():
+                job.status = "cancelled"
+            elif job.result and job.result.get("test_passed") is False:
+                job.status = "failed"
+                job.error = job.result.get("error")
+            else:
+                job.status = "completed"
+        except Exception as e:
+            job.status = "failed"
+            job.error = str(e)
+        finally:
+            job.finished_at = datetime.now()
+
+    def _prune(self):
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        while len(finished) > self.max_finished_jobs:
+            self._jobs.pop(finished.pop(0), None)
+
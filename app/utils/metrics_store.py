@@ -0,0 +1,180 @@
+import sqlite3
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional, Tuple
+
+
+class MetricsStore:
+    RESOLUTIONS = {
+        "1m": 60,
+        "1h": 3600,
+        "1d": 86400
+    }
+
+    @staticmethod
+    def create_schema(cursor: sqlite3.Cursor):
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS scan_metrics (
+                device_id TEXT NOT NULL,
+                metric TEXT NOT NULL,
+                ts INTEGER NOT NULL,
+                scan_id TEXT NOT NULL,
+                value REAL NOT NULL,
+                PRIMARY KEY (device_id, metric, ts, scan_id)
+            ) WITHOUT ROWID
+        ''')
+
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS scan_metrics_rollup (
+                device_id TEXT NOT NULL,
+                metric TEXT NOT NULL,
+                resolution INTEGER NOT NULL,
+                bucket INTEGER NOT NULL,
+                count INTEGER NOT NULL,
+                sum REAL NOT NULL,
+                min REAL NOT NULL,
+                max REAL NOT NULL,
+                PRIMARY KEY (device_id, metric, resolution, bucket)
+            ) WITHOUT ROWID
+        ''')
+
+    @staticmethod
+    def extract_metrics(scan_data: Dict[str, Any]) -> List[Tuple[str, float]]:
+        metrics: List[Tuple[str, Any]] = []
+
+        cpu = scan_data.get("cpu") or {}
+        metrics.append(("cpu.percent", cpu.get("cpu_percent_overall")))
+        metrics.append(("cpu.temperature_celsius", cpu.get("temperature_celsius")))
+        metrics.append(("cpu.frequency_mhz", cpu.get("frequency_current_mhz")))
+
+        ram = scan_data.get("ram") or {}
+        metrics.append(("ram.percent_used", ram.get("percent_used")))
+        metrics.append(("ram.swap_percent_used", ram.get("swap_percent_used")))
+
+        for disk in scan_data.get("disks") or []:
+            if disk.get("detected") and disk.get("mount_point"):
+                metrics.append((f"disk.percent_used:{disk['mount_point']}", disk.get("percent_used")))
+                activity = disk.get("io_activity") or {}
+                metrics.append((f"disk.busy_percent:{disk['mount_point']}", activity.get("busy_percent")))
+
+        for gpu in scan_data.get("gpu") or []:
+            if gpu.get("detected"):
+                metrics.append((f"gpu.load_percent:{gpu.get('id')}", gpu.get("gpu_load_percent")))
+                metrics.append((f"gpu.temperature_celsius:{gpu.get('id')}", gpu.get("temperature_celsius")))
+                metrics.append((f"gpu.memory_percent:{gpu.get('id')}", gpu.get("memory_percent")))
+
+        battery = scan_data.get("battery") or {}
+        if battery.get("detected"):
+            metrics.append(("battery.percent", battery.get("percent")))
+            metrics.append(("battery.health_percent", battery.get("health_percent")))
+            metrics.append(("battery.power_draw_w", battery.get("power_draw_w")))
+
+        network = scan_data.get("network") or {}
+        if network.get("detected"):
+            metrics.append(("network.ping_ms", network.get("ping_ms")))
+            metrics.append(("network.errors_in", network.get("errors_in")))
+            metrics.append(("network.errors_out", network.get("errors_out")))
+            metrics.append(("network.drops_in", network.get("drops_in")))
+            metrics.append(("network.drops_out", network.get("drops_out")))
+
+        return [
+            (name, float(value)) for name, value in metrics
+            if isinstance(value, (int, float)) and not isinstance(value, bool)
+        ]
+
+    @staticmethod
+    def record(cursor: sqlite3.Cursor, device_id: str, scan_id: str, ts: int,
+               metrics: List[Tuple[str, float]]):
+        if not metrics:
+            return
+
+        cursor.executemany('''
+            INSERT OR REPLACE INTO scan_metrics (device_id, metric, ts, scan_id, value)
+            VALUES (?, ?, ?, ?, ?)
+        ''', [(device_id, name, ts, scan_id, value) for name, value in metrics])
+
+        rollups = []
+        for resolution in MetricsStore.RESOLUTIONS.values():
+            bucket = ts - ts % resolution
+            for name, value in metrics:
+                rollups.append((device_id, name, resolution, bucket, value, value, value))
+
+        cursor.executemany('''
+            INSERT INTO scan_metrics_rollup (device_id, metric, resolution, bucket, count, sum, min, max)
+            VALUES (?, ?, ?, ?, 1, ?, ?, ?)
+            ON CONFLICT (device_id, metric, resolution, bucket) DO UPDATE SET
+                count = count + 1,
+                sum = sum + excluded.sum,
+                min = MIN(min, excluded.min),
+                max = MAX(max, excluded.max)
+        ''', rollups)
+
+    @staticmethod
+    def list_metrics(conn: sqlite3.Connection, device_id: str) -> List[str]:
+        rows = conn.execute('''
+            SELECT DISTINCT metric FROM scan_metrics_rollup
+            WHERE device_id = ? AND resolution = ?
+            ORDER BY metric
+        ''', (device_id, MetricsStore.RESOLUTIONS["1d"])).fetchall()
+        return [row[0] for row in rows]
+
+    @staticmethod
+    def query(conn: sqlite3.Connection, device_id: str, metric: str, resolution: str = "1h",
+              since: Optional[int] = None, until: Optional[int] = None, limit: int = 5000) -> Dict[str, Any]:
+        since = since if since is not None else 0
+        until = until if until is not None else 2 ** 62
+
+        if resolution == "raw":
+            rows = conn.execute('''
+                SELECT ts, value, scan_id FROM scan_metrics
+                WHERE device_id = ? AND metric = ? AND ts >= ? AND ts < ?
+                ORDER BY ts LIMIT ?
+            ''', (device_id, metric, since, until, limit)).fetchall()
+            points = [
+                {"timestamp": MetricsStore._iso(row[0]), "value": row[1], "scan_id": row[2]}
+                for row in rows
+            ]
+            values = [row[1] for row in rows]
+            summary = {
+                "count": len(values),
+                "avg": round(sum(values) / len(values), 4) if values else None,
+                "min": min(values) if values else None,
+                "max": max(values) if values else None
+            }
+        else:
+            if resolution not in MetricsStore.RESOLUTIONS:
+                raise ValueError(f"Unknown resolution: {resolution}")
+            step = MetricsStore.RESOLUTIONS[resolution]
+            rows = conn.execute('''
+                SELECT bucket, count, sum, min, max FROM scan_metrics_rollup
+                WHERE device_id = ? AND metric = ? AND resolution = ? AND bucket >= ? AND bucket < ?
+                ORDER BY bucket LIMIT ?
+            ''', (device_id, metric, step, since - since % step, until, limit)).fetchall()
+            points = [
+                {
+                    "timestamp": MetricsStore._iso(row[0]),
+                    "count": row[1],
+                    "avg": round(row[2] / row[1], 4),
+                    "min": row[3],
+                    "max": row[4]
+                }
+                for row in rows
+            ]
+            total_count = sum(row[1] for row in rows)
+            summary = {
+                "count": total_count,
+                "avg": round(sum(row[2] for row in rows) / total_count, 4) if total_count else None,
+                "min": min(row[3] for row in rows) if rows else None,
+                "max": max(row[4] for row in rows) if rows else None
+            }
+
+        return {
+            "device_id": device_id,
+            "metric": metric,
+            "resolution": resolution,
+            "summary": summary,
+            "points": points
+        }
+
+    @staticmethod
+    def _iso(ts: int) -> str:
+        return datetime.fromtimestamp(ts, tz=timezone.utc).isoformat()
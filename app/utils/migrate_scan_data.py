@@ -0,0 +1,78 @@
+import argparse
+from typing import Dict, Any, Optional
+
+from .database import Database
+from .scan_codec import ScanDataCodec
+
+
+def migrate_scan_data(db_path: str, codec: Optional[str] = None, batch_size: int = 500,
+                      dry_run: bool = False) -> Dict[str, Any]:
+    codec = codec or ScanDataCodec.default_codec()
+    db = Database(db_path, scan_codec=codec)
+
+    rows_migrated = 0
+    bytes_before = 0
+    bytes_after = 0
+    last_id = 0
+
+    while True:
+        with db.connection() as conn:
+            rows = conn.execute('''
+                SELECT id, scan_data, scan_codec FROM scan_history
+                WHERE id > ? AND scan_data IS NOT NULL AND COALESCE(scan_codec, 'json') != ?
+                ORDER BY id LIMIT ?
+            ''', (last_id, codec, batch_size)).fetchall()
+
+            if not rows:
+                break
+
+            updates = []
+            for row in rows:
+                payload = row['scan_data']
+                encoded = ScanDataCodec.encode(ScanDataCodec.decode(payload, row['scan_codec']), codec)
+                bytes_before += len(payload.encode('utf-8') if isinstance(payload, str) else payload)
+                bytes_after += len(encoded.encode('utf-8') if isinstance(encoded, str) else encoded)
+                updates.append((encoded, codec, row['id']))
+
+            if not dry_run:
+                conn.executemany('UPDATE scan_history SET scan_data = ?, scan_codec = ? WHERE id = ?', updates)
+                conn.commit()
+
+            rows_migrated += len(rows)
+            last_id = rows[-1]['id']
+
+    return {
+        "codec": codec,
+        "dry_run": dry_run,
+        "rows_migrated": rows_migrated,
+        "bytes_before": bytes_before,
+        "bytes_after": bytes_after,
+        "compression_ratio": round(bytes_before / bytes_after, 2) if bytes_after else None
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-encode stored scan_history.scan_data with another codec")
+    parser.add_argument("--db", default="db/system_guardian.db")
+    parser.add_argument("--codec", default=None, choices=ScanDataCodec.available_codecs())
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument("--vacuum", action="store_true", help="VACUUM afterwards to return freed pages to the OS")
+    args = parser.parse_args()
+
+    result = migrate_scan_data(args.db, args.codec, args.batch_size, args.dry_run)
+
+    print(f"Codec: {result['codec']}{' (dry run)' if result['dry_run'] else ''}")
+    print(f"Rows migrated: {result['rows_migrated']}")
+    print(f"Size: {result['bytes_before']} -> {result['bytes_after']} bytes "
+          f"(ratio {result['compression_ratio']})")
+
+    if args.vacuum and not args.dry_run:
+        db = Database(args.db)
+        with db.connection() as conn:
+            conn.execute('VACUUM')
+        print("Vacuum completed")
+
+
+if __name__ == "__main__":
+    main()
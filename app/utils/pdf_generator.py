@@ -246,7 +246,8 @@ class PDFGenerator:
             ['Property', 'Value', 'Status'],
             ['Charge Level', f"{battery.get('percent', 'N/A')}%", ''],
             ['Power Plugged', 'Yes' if battery.get('power_plugged') else 'No', ''],
-            ['Health', f"{battery.get('health_percent', 'N/A')}%", battery.get('status', 'Unknown')]
+            ['Health', f"{battery['health_percent']}%" if battery.get('health_percent') is not None else 'N/A',
+             battery.get('status', 'Unknown')]
         ]
         
         table = Table(data, colWidths=[2*inch, 2.5*inch, 1.5*inch])
@@ -0,0 +1,92 @@
+import json
+import zlib
+from typing import Dict, Any, Optional, Union, List
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+
+class ScanDataCodec:
+    LEGACY = "json"
+    ZLIB_LEVEL = 6
+    ZSTD_LEVEL = 6
+
+    @staticmethod
+    def available_codecs() -> List[str]:
+        codecs = ["json", "zlib-json"]
+        if ZSTD_AVAILABLE:
+            codecs.append("zstd-json")
+        if MSGPACK_AVAILABLE:
+            codecs.append("msgpack-zlib")
+        if ZSTD_AVAILABLE and MSGPACK_AVAILABLE:
+            codecs.append("msgpack-zstd")
+        return codecs
+
+    @staticmethod
+    def default_codec() -> str:
+        return "zlib-json"
+
+    @staticmethod
+    def encode(data: Dict[str, Any], codec: Optional[str] = None) -> Union[str, bytes]:
+        codec = codec or ScanDataCodec.default_codec()
+
+        if codec == "json":
+            return json.dumps(data)
+        if codec == "zlib-json":
+            return zlib.compress(ScanDataCodec._compact_json(data), ScanDataCodec.ZLIB_LEVEL)
+        if codec == "zstd-json":
+            ScanDataCodec._require(ZSTD_AVAILABLE, codec, "zstandard")
+            return zstandard.ZstdCompressor(level=ScanDataCodec.ZSTD_LEVEL).compress(
+                ScanDataCodec._compact_json(data)
+            )
+        if codec == "msgpack-zlib":
+            ScanDataCodec._require(MSGPACK_AVAILABLE, codec, "msgpack")
+            return zlib.compress(msgpack.packb(data, default=str), ScanDataCodec.ZLIB_LEVEL)
+        if codec == "msgpack-zstd":
+            ScanDataCodec._require(ZSTD_AVAILABLE and MSGPACK_AVAILABLE, codec, "zstandard msgpack")
+            return zstandard.ZstdCompressor(level=ScanDataCodec.ZSTD_LEVEL).compress(
+                msgpack.packb(data, default=str)
+            )
+
+        raise ValueError(f"Unknown scan data codec: {codec}")
+
+    @staticmethod
+    def decode(payload: Union[str, bytes, None], codec: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        if payload is None:
+            return None
+
+        codec = codec or ScanDataCodec.LEGACY
+
+        if codec == "json":
+            return json.loads(payload)
+        if codec == "zlib-json":
+            return json.loads(zlib.decompress(payload))
+        if codec == "zstd-json":
+            ScanDataCodec._require(ZSTD_AVAILABLE, codec, "zstandard")
+            return json.loads(zstandard.ZstdDecompressor().decompress(payload))
+        if codec == "msgpack-zlib":
+            ScanDataCodec._require(MSGPACK_AVAILABLE, codec, "msgpack")
+            return msgpack.unpackb(zlib.decompress(payload))
+        if codec == "msgpack-zstd":
+            ScanDataCodec._require(ZSTD_AVAILABLE and MSGPACK_AVAILABLE, codec, "zstandard msgpack")
+            return msgpack.unpackb(zstandard.ZstdDecompressor().decompress(payload))
+
+        raise ValueError(f"Unknown scan data codec: {codec}")
+
+    @staticmethod
+    def _compact_json(data: Dict[str, Any]) -> bytes:
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=str).encode("utf-8")
+
+    @staticmethod
+    def _require(available: bool, codec: str, package: str):
+        if not available:
+            raise RuntimeError(f"Codec '{codec}' needs the {package} package - Install with: pip install {package}")
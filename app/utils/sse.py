@@ -0,0 +1,10 @@
+import json
+from typing import Dict, Any, Optional
+
+
+def sse_event(event: str, data: Dict[str, Any], event_id: Optional[int] = None) -> str:
+    lines = [f"event: {event}"]
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"data: {json.dumps(data, default=str)}")
+    return "\n".join(lines) + "\n\n"
@@ -0,0 +1,84 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Callable, Optional
+
+
+class TaskRejectedError(Exception):
+    def __init__(self, category: str, limit: int):
+        self.category = category
+        self.limit = limit
+        super().__init__(
+            f"Too many concurrent '{category}' tasks (limit {limit}) - Please retry later"
+        )
+
+
+class TaskExecutor:
+    DEFAULT_LIMITS = {
+        "scan": 4,
+        "stress": 8,
+        "network": 8,
+        "default": 8
+    }
+
+    def __init__(self, max_workers: int = 16, limits: Optional[Dict[str, int]] = None):
+        self.max_workers = max_workers
+        self.limits = dict(self.DEFAULT_LIMITS)
+        if limits:
+            self.limits.update(limits)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="task")
+        self._active: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    async def run(self, category: str, func: Callable, *args, **kwargs) -> Any:
+        future = self.submit(category, func, *args, **kwargs)
+        return await asyncio.wrap_future(future)
+
+    def submit(self, category: str, func: Callable, *args, **kwargs):
+        self._admit(category)
+        try:
+            future = self._executor.submit(func, *args, **kwargs)
+        except Exception:
+            self._release(category)
+            raise
+        future.add_done_callback(lambda _: self._release(category))
+        return future
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            active = dict(self._active)
+        return {
+            "max_workers": self.max_workers,
+            "limits": dict(self.limits),
+            "active": active,
+            "active_total": sum(active.values())
+        }
+
+    def shutdown(self, wait: bool = False):
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _admit(self, category: str):
+        limit = self.limits.get(category, self.limits["default"])
+        with self._lock:
+            active = self._active.get(category, 0)
+            if active >= limit:
+                raise TaskRejectedError(category, limit)
+            if sum(self._active.values()) >= self.max_workers:
+                raise TaskRejectedError("total", self.max_workers)
+            self._active[category] = active + 1
+
+    def _release(self, category: str):
+        with self._lock:
+            self._active[category] = max(0, self._active.get(category, 0) - 1)
+
+
+_default_executor: Optional[TaskExecutor] = None
+_default_executor_lock = threading.Lock()
+
+
+def get_task_executor() -> TaskExecutor:
+    global _default_executor
+    with _default_executor_lock:
+        if _default_executor is None:
+            _default_executor = TaskExecutor()
+        return _default_executor
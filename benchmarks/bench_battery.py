@@ -0,0 +1,139 @@
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.battery_sysfs import SysfsBattery, set_sysfs_battery_root
+from app.core.battery_test import BatteryScanner
+
+
+ENERGY_FULL_UWH = 45_000_000
+ENERGY_DESIGN_UWH = 57_000_000
+VOLTAGE_UV = 11_400_000
+
+
+def write(path: str, value: str):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    mode = "r+" if os.path.exists(path) else "w"
+    with open(path, mode) as f:
+        f.seek(0)
+        f.write(value + "\n")
+        f.truncate()
+
+
+def write_battery(battery: str, energy_now: float, power: float):
+    values = {
+        "status": "Discharging",
+        "present": "1",
+        "technology": "Li-ion",
+        "cycle_count": "412",
+        "voltage_min_design": str(VOLTAGE_UV),
+        "voltage_now": str(VOLTAGE_UV),
+        "power_now": str(int(power)),
+        "energy_full_design": str(ENERGY_DESIGN_UWH),
+        "energy_full": str(ENERGY_FULL_UWH),
+        "energy_now": str(int(energy_now)),
+        "capacity": str(int(energy_now / ENERGY_FULL_UWH * 100)),
+        "model_name": "5B10W13930",
+        "manufacturer": "SMP",
+        "serial_number": "1234"
+    }
+    for name, value in values.items():
+        write(os.path.join(battery, name), value)
+    write(os.path.join(battery, "uevent"),
+          "\n".join(f"POWER_SUPPLY_{name.upper()}={value}" for name, value in values.items()))
+
+
+def build_fixture(root: str, watts: float) -> str:
+    battery = os.path.join(root, "BAT0")
+    write(os.path.join(battery, "type"), "Battery")
+    write(os.path.join(battery, "scope"), "System")
+    write_battery(battery, ENERGY_FULL_UWH * 0.805, watts * 1e6)
+    write(os.path.join(root, "AC", "type"), "Mains")
+    write(os.path.join(root, "AC", "online"), "0")
+    return battery
+
+
+def simulate_discharge(battery: str, watts: float, noise: float, update_interval: float, stop: threading.Event):
+    energy = ENERGY_FULL_UWH * 0.805
+    last = time.perf_counter()
+    while not stop.wait(update_interval):
+        now = time.perf_counter()
+        energy -= watts * 1e6 * (now - last) / 3600
+        last = now
+        write_battery(battery, energy, (watts + random.uniform(-noise, noise)) * 1e6)
+
+
+def percent_polling(battery: str, duration: float, interval: float = 2.0) -> float:
+    start = time.perf_counter()
+    initial = int(open(os.path.join(battery, "capacity")).read())
+    final = initial
+    while time.perf_counter() - start < duration:
+        time.sleep(interval)
+        final = int(open(os.path.join(battery, "capacity")).read())
+    drained_wh = (initial - final) / 100 * ENERGY_FULL_UWH / 1e6
+    return drained_wh / ((time.perf_counter() - start) / 3600)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Battery drain: 1% capacity polling vs sysfs power_now sampling")
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--watts", type=float, default=12.0)
+    parser.add_argument("--noise", type=float, default=1.5)
+    parser.add_argument("--update-interval", type=float, default=0.25)
+    parser.add_argument("--repeats", type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        battery = build_fixture(root, args.watts)
+        sysfs = SysfsBattery(root)
+
+        start = time.perf_counter()
+        for _ in range(args.repeats):
+            sysfs.read()
+        uevent_ms = (time.perf_counter() - start) * 1000 / args.repeats
+        os.remove(os.path.join(battery, "uevent"))
+        start = time.perf_counter()
+        for _ in range(args.repeats):
+            reading = sysfs.read()
+        files_ms = (time.perf_counter() - start) * 1000 / args.repeats
+        write_battery(battery, ENERGY_FULL_UWH * 0.805, args.watts * 1e6)
+        print(f"read: uevent {uevent_ms:.3f} ms, per-file {files_ms:.3f} ms  "
+              f"health={reading['health_percent']}% cycles={reading['cycle_count']} voltage={reading['voltage_now_v']} V")
+
+        with sysfs.power_sampler() as sampler:
+            start = time.perf_counter()
+            for _ in range(args.repeats):
+                sampler.read_watts()
+            print(f"power_now sample (pread on open fd): {(time.perf_counter() - start) * 1e6 / args.repeats:.1f} us")
+
+        stop = threading.Event()
+        writer = threading.Thread(target=simulate_discharge,
+                                  args=(battery, args.watts, args.noise, args.update_interval, stop), daemon=True)
+        writer.start()
+        try:
+            polled = percent_polling(battery, args.duration)
+            set_sysfs_battery_root(root)
+            info = BatteryScanner.get_battery_info()
+            result = BatteryScanner.perform_battery_drain_test(int(args.duration), sample_interval=0.05)
+        finally:
+            stop.set()
+            writer.join()
+
+    print(f"true draw {args.watts:.2f} W over {args.duration:.0f} s")
+    print(f"  1% polling every 2 s: {polled:6.2f} W ({abs(polled - args.watts) / args.watts * 100:5.1f}% error)")
+    print(f"  power_now at 20 Hz:   {result['average_power_w']:6.2f} W "
+          f"({abs(result['average_power_w'] - args.watts) / args.watts * 100:5.1f}% error, "
+          f"{result['samples_collected']} samples, {result['sensor_updates']} sensor updates, "
+          f"stdev {result['power_stdev_w']} W)")
+    print(f"  scan: health={info['health_percent']}% capacity={info['capacity_max_wh']}/{info['capacity_design_wh']} Wh "
+          f"time_left={info['time_left_formatted']}")
+
+
+if __name__ == "__main__":
+    main()
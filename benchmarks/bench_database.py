@@ -0,0 +1,132 @@
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.database import Database
+
+
+SAMPLE_SCAN = {
+    "cpu": {"cpu_percent_overall": 12.5, "cpu_percent_per_core": [10.0] * 16},
+    "ram": {"percent_used": 48.2},
+    "disks": [{"device": f"/dev/sda{i}", "percent_used": 40.0} for i in range(8)],
+    "overall_health": "Good"
+}
+
+
+class LegacyDatabase:
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def verify_subscription(self, code: str, device_id: str):
+        conn = self._connect()
+        try:
+            conn.execute('SELECT * FROM subscriptions WHERE code = ? AND is_active = 1', (code,)).fetchone()
+        finally:
+            conn.close()
+
+    def increment_scan_count(self, code: str):
+        conn = self._connect()
+        try:
+            conn.execute('UPDATE subscriptions SET scans_count = scans_count + 1 WHERE code = ?', (code,))
+            conn.commit()
+        finally:
+            conn.close()
+
+    def save_scan_result(self, scan_id: str, subscription_code: str, device_id: str, scan_data):
+        conn = self._connect()
+        try:
+            conn.execute('''
+                INSERT INTO scan_history (scan_id, subscription_code, device_id, scan_data)
+                VALUES (?, ?, ?, ?)
+            ''', (scan_id, subscription_code, device_id, json.dumps(scan_data)))
+            conn.commit()
+        finally:
+            conn.close()
+
+
+def three_call_step(db, code: str, device_id: str):
+    db.verify_subscription(code, device_id)
+    db.increment_scan_count(code)
+    db.save_scan_result(f"SCAN-{uuid.uuid4().hex}", code, device_id, SAMPLE_SCAN)
+
+
+def single_transaction_step(db, code: str, device_id: str):
+    db.commit_scan(code, device_id, f"SCAN-{uuid.uuid4().hex}", SAMPLE_SCAN)
+
+
+def run_writers(step, db, code: str, device_id: str, writers: int, iterations: int) -> dict:
+    errors = []
+
+    def worker():
+        for _ in range(iterations):
+            try:
+                step(db, code, device_id)
+            except sqlite3.OperationalError as e:
+                errors.append(str(e))
+
+    threads = [threading.Thread(target=worker) for _ in range(writers)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    completed = writers * iterations - len(errors)
+    return {
+        "seconds": elapsed,
+        "scans_per_second": completed / elapsed if elapsed else 0,
+        "errors": len(errors)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="verify + save throughput under concurrent writers")
+    parser.add_argument("--writers", type=int, default=8)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_path = os.path.join(tmp, "legacy.db")
+        legacy_setup = Database(legacy_path)
+        legacy_code = legacy_setup.create_subscription("bench@example.com")["code"]
+        legacy_setup.pool.close_all()
+        with sqlite3.connect(legacy_path) as conn:
+            conn.execute("PRAGMA journal_mode = DELETE")
+        legacy = run_writers(three_call_step, LegacyDatabase(legacy_path), legacy_code, "bench-device",
+                             args.writers, args.iterations)
+
+        pooled_db = Database(os.path.join(tmp, "pooled.db"))
+        pooled_code = pooled_db.create_subscription("bench@example.com")["code"]
+        pooled = run_writers(three_call_step, pooled_db, pooled_code, "bench-device",
+                             args.writers, args.iterations)
+
+        single_db = Database(os.path.join(tmp, "single.db"))
+        single_code = single_db.create_subscription("bench@example.com")["code"]
+        single = run_writers(single_transaction_step, single_db, single_code, "bench-device",
+                             args.writers, args.iterations)
+        scans_count = single_db.verify_subscription(single_code)["subscription"]["scans_count"]
+
+    print(f"writers={args.writers} iterations/writer={args.iterations}")
+    for name, result in (("connect-per-call", legacy), ("pooled WAL", pooled),
+                         ("commit_scan", single)):
+        print(f"{name:<18} {result['scans_per_second']:9.1f} scans/s  "
+              f"{result['seconds']:7.2f} s  errors={result['errors']}")
+    print(f"commit_scan scans_count={scans_count} (expected {args.writers * args.iterations})")
+
+
+if __name__ == "__main__":
+    main()
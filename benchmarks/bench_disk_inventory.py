@@ -0,0 +1,72 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.disk_topology import DiskTopology
+
+
+def build_fake_sys_block(root: str, disks: int, partitions_per_disk: int):
+    for d in range(disks):
+        name = f"sd{chr(ord('a') + d % 26)}{d // 26 or ''}"
+        disk_path = os.path.join(root, name)
+        os.makedirs(os.path.join(disk_path, "queue"))
+        with open(os.path.join(disk_path, "dev"), "w") as f:
+            f.write(f"8:{d * 16}")
+        with open(os.path.join(disk_path, "queue", "rotational"), "w") as f:
+            f.write("0")
+        for p in range(1, partitions_per_disk + 1):
+            part_path = os.path.join(disk_path, f"{name}{p}")
+            os.makedirs(part_path)
+            open(os.path.join(part_path, "partition"), "w").close()
+            with open(os.path.join(part_path, "dev"), "w") as f:
+                f.write(f"259:{d * 1000 + p}")
+
+
+def nested_match(partitions, counters):
+    matched = {}
+    for device_name in partitions:
+        for disk_name in counters:
+            if device_name in disk_name or disk_name in device_name:
+                matched[device_name] = disk_name
+                break
+    return matched
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Disk inventory lookup: nested substring scan vs /sys/block index")
+    parser.add_argument("--disks", type=int, default=40)
+    parser.add_argument("--partitions", type=int, default=12)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        build_fake_sys_block(root, args.disks, args.partitions)
+        topology = DiskTopology(sys_block=root)
+
+        start = time.perf_counter()
+        devices = topology.devices()
+        build_ms = (time.perf_counter() - start) * 1000
+
+        names = [name for name, entry in devices.items() if entry["parent"]]
+        counters = {name: None for name in devices}
+
+        start = time.perf_counter()
+        nested = nested_match(names, counters)
+        nested_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        indexed = {name: name for name in names if topology.resolve(name) and name in counters}
+        indexed_ms = (time.perf_counter() - start) * 1000
+
+        wrong = sum(1 for name in names if nested.get(name) != name)
+        print(f"devices: {len(devices)}  partitions: {len(names)}")
+        print(f"topology build:    {build_ms:8.2f} ms (cached afterwards, builds={topology.builds})")
+        print(f"nested substring:  {nested_ms:8.2f} ms, {wrong} partitions matched to the wrong counter")
+        print(f"indexed lookup:    {indexed_ms:8.2f} ms, {len(indexed)} exact matches")
+
+
+if __name__ == "__main__":
+    main()
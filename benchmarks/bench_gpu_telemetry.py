@@ -0,0 +1,38 @@
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.gpu_telemetry import GPUTelemetrySession, FakeGPUBackend, GPUTIL_AVAILABLE
+
+
+def per_call_ms(func, calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        func()
+    return (time.perf_counter() - start) / calls * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GPU telemetry: GPUtil per-call nvidia-smi vs persistent session")
+    parser.add_argument("--calls", type=int, default=50)
+    args = parser.parse_args()
+
+    if GPUTIL_AVAILABLE:
+        import GPUtil
+        print(f"GPUtil.getGPUs():          {per_call_ms(GPUtil.getGPUs, args.calls):8.3f} ms per sample")
+
+    session = GPUTelemetrySession()
+    if session.available:
+        print(f"session ({session.backend_name}):{'':<10}{per_call_ms(session.read, args.calls):8.3f} ms per sample")
+    else:
+        print("no NVML/GPUtil device found; persistent session skipped")
+
+    fake = GPUTelemetrySession(FakeGPUBackend(count=2))
+    print(f"session (fake, 2 GPUs):    {per_call_ms(fake.read, args.calls):8.3f} ms per sample")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+import argparse
+import os
+import socket
+import sys
+import threading
+import time
+
+import requests
+import uvicorn
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.main import app
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _percentile(values, percent):
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round((percent / 100) * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _measure_health(base_url: str, seconds: float) -> list:
+    latencies = []
+    session = requests.Session()
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        start = time.perf_counter()
+        session.get(f"{base_url}/health", timeout=30)
+        latencies.append((time.perf_counter() - start) * 1000)
+        time.sleep(0.01)
+    return latencies
+
+
+def _summary(name: str, latencies: list):
+    print(f"{name:<22} samples={len(latencies):<5} "
+          f"p50={_percentile(latencies, 50):8.2f} ms  "
+          f"p99={_percentile(latencies, 99):8.2f} ms  "
+          f"max={max(latencies):8.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="/health latency while stress tests run")
+    parser.add_argument("--stress-tests", type=int, default=8)
+    parser.add_argument("--duration", type=int, default=5)
+    args = parser.parse_args()
+
+    port = _free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+
+    baseline = _measure_health(base_url, 2.0)
+
+    statuses = []
+
+    def run_stress():
+        response = requests.post(f"{base_url}/api/scan/test/cpu-stress",
+                                 params={"duration": args.duration}, timeout=args.duration + 60)
+        statuses.append(response.status_code)
+
+    workers = [threading.Thread(target=run_stress) for _ in range(args.stress_tests)]
+    for worker in workers:
+        worker.start()
+    time.sleep(0.5)
+
+    under_load = _measure_health(base_url, max(1.0, args.duration - 1.0))
+
+    for worker in workers:
+        worker.join()
+
+    server.should_exit = True
+
+    _summary("/health baseline", baseline)
+    _summary(f"/health + {args.stress_tests} stress", under_load)
+    print(f"stress test status codes: {sorted(statuses)}")
+
+
+if __name__ == "__main__":
+    main()
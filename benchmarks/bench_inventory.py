@@ -0,0 +1,77 @@
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core import inventory as inventory_module
+from app.core.cpu_test import CPUScanner
+from app.core.disk_test import DiskScanner
+from app.core.disk_topology import get_disk_topology
+from app.core.inventory import HardwareInventory, extract_static
+
+
+def timed(func, repeats: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        func()
+    return (time.perf_counter() - start) * 1000 / repeats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Hardware inventory: full rediscovery vs fingerprint-keyed static cache")
+    parser.add_argument("--repeats", type=int, default=200)
+    args = parser.parse_args()
+
+    hardware_inventory = HardwareInventory()
+    topology = get_disk_topology()
+    CPUScanner.get_cpu_info()
+    DiskScanner.get_disks_info()
+
+    probe_ms = timed(hardware_inventory.probe, args.repeats)
+    inventory = hardware_inventory.probe()
+    print(f"probe + fingerprint:  {probe_ms:7.3f} ms  fingerprint={inventory['fingerprint']}")
+
+    cpu_static = extract_static("cpu", CPUScanner.get_cpu_info())
+    full = timed(CPUScanner.get_cpu_info, args.repeats)
+    cached = timed(lambda: CPUScanner.get_cpu_info(static=cpu_static), args.repeats)
+    print(f"cpu collector:        {full:7.3f} ms full, {cached:7.3f} ms with cached static")
+
+    def rediscover():
+        topology.invalidate()
+        return DiskScanner.get_disks_info()
+
+    disk_static = extract_static("disks", DiskScanner.get_disks_info())
+
+    def cached_disks():
+        topology.invalidate()
+        return DiskScanner.get_disks_info(static=disk_static)
+
+    full = timed(rediscover, args.repeats)
+    cached = timed(cached_disks, args.repeats)
+    print(f"disks collector:      {full:7.3f} ms rediscovering topology, {cached:7.3f} ms with cached static")
+
+    hardware_inventory.record(inventory)
+    original = inventory_module.PROBES["disks"]
+
+    def swapped_disk():
+        facts = original()
+        for fact in facts:
+            if fact["kind"] == "disk":
+                fact["serial"] = "REPLACED-" + str(fact["serial"])
+                break
+        return facts
+
+    inventory_module.PROBES["disks"] = swapped_disk
+    try:
+        changes = hardware_inventory.record(hardware_inventory.probe())
+    finally:
+        inventory_module.PROBES["disks"] = original
+    print(f"simulated disk swap:  changed={changes['changed']} components={list(changes['components'])}")
+    for name, change in changes["components"].items():
+        print(f"  {name}: +{change['added']} -{change['removed']}")
+
+
+if __name__ == "__main__":
+    main()
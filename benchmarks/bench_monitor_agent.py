@@ -0,0 +1,57 @@
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.monitor_agent import MonitorAgent, get_monitor_agent
+from app.core.cpu_test import CPUScanner
+
+
+def measure(interval: float, seconds: float) -> dict:
+    agent = MonitorAgent(interval=interval)
+    process_cpu_start = time.process_time()
+    agent.start()
+    time.sleep(seconds)
+    status = agent.get_status()
+    agent.stop()
+    process_cpu = time.process_time() - process_cpu_start
+    return {
+        "interval": interval,
+        "samples": status["samples_total"],
+        "agent_overhead_percent": status["overhead_percent_of_core"],
+        "process_overhead_percent": process_cpu / seconds * 100,
+        "last_sample_ms": status["last_sample_ms"]
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CPU overhead of the monitoring agent")
+    parser.add_argument("--seconds", type=float, default=20)
+    parser.add_argument("--budget", type=float, default=0.5, help="Allowed %% of one core at 1 s interval")
+    args = parser.parse_args()
+
+    print(f"{'interval':>8} {'samples':>8} {'agent %core':>12} {'process %core':>14} {'sample ms':>10}")
+    results = []
+    for interval in (1.0, 0.5, 0.1):
+        r = measure(interval, args.seconds)
+        results.append(r)
+        print(f"{r['interval']:>8.1f} {r['samples']:>8} {r['agent_overhead_percent']:>12.4f} "
+              f"{r['process_overhead_percent']:>14.4f} {r['last_sample_ms']:>10.3f}")
+
+    agent = get_monitor_agent()
+    agent.start(interval=1.0)
+    time.sleep(1.2)
+    start = time.perf_counter()
+    CPUScanner.get_cpu_info()
+    print(f"get_cpu_info with agent running: {(time.perf_counter() - start) * 1000:.1f} ms")
+    agent.stop()
+
+    one_second = results[0]["agent_overhead_percent"]
+    verdict = "PASS" if one_second is not None and one_second < args.budget else "FAIL"
+    print(f"budget {args.budget}% of one core at 1 s interval: {verdict} ({one_second}%)")
+
+
+if __name__ == "__main__":
+    main()
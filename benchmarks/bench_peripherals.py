@@ -0,0 +1,101 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.peripherals_sysfs import SysfsPeripherals
+from app.core.peripherals_test import PeripheralsScanner
+
+
+def write(path: str, value: str):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(value + "\n")
+
+
+def build_fake_tree(root: str, usb_devices: int):
+    sys_root = os.path.join(root, "sys")
+    proc_root = os.path.join(root, "proc")
+    usb = os.path.join(sys_root, "bus", "usb", "devices")
+    write(os.path.join(usb, "usb1", "idVendor"), "1d6b")
+    write(os.path.join(usb, "usb1", "idProduct"), "0002")
+    write(os.path.join(usb, "usb1", "bDeviceClass"), "09")
+    write(os.path.join(usb, "usb1", "product"), "xHCI Host Controller")
+    for index in range(usb_devices):
+        name = f"1-{index + 1}"
+        protocol = "01" if index == 0 else "02" if index == 1 else "00"
+        write(os.path.join(usb, name, "idVendor"), "046d")
+        write(os.path.join(usb, name, "idProduct"), f"{0xc500 + index:04x}")
+        write(os.path.join(usb, name, "bDeviceClass"), "00")
+        write(os.path.join(usb, name, "busnum"), "1")
+        write(os.path.join(usb, name, "devnum"), str(index + 2))
+        write(os.path.join(usb, name, "speed"), "12")
+        write(os.path.join(usb, name, "manufacturer"), "Logitech")
+        write(os.path.join(usb, name, "product"), f"Device {index}")
+        write(os.path.join(usb, f"{name}:1.0", "bInterfaceClass"), "03")
+        write(os.path.join(usb, f"{name}:1.0", "bInterfaceProtocol"), protocol)
+
+    drm = os.path.join(sys_root, "class", "drm")
+    write(os.path.join(drm, "card0-HDMI-A-1", "status"), "connected")
+    write(os.path.join(drm, "card0-HDMI-A-1", "modes"), "2560x1440\n1920x1080")
+    write(os.path.join(drm, "card0-DP-1", "status"), "disconnected")
+    write(os.path.join(sys_root, "class", "video4linux", "video0", "name"), "HD Webcam C615")
+    write(os.path.join(sys_root, "class", "video4linux", "video0", "index"), "0")
+    write(os.path.join(sys_root, "class", "video4linux", "video1", "name"), "HD Webcam C615")
+    write(os.path.join(sys_root, "class", "video4linux", "video1", "index"), "1")
+    write(os.path.join(proc_root, "asound", "cards"),
+          " 0 [PCH            ]: HDA-Intel - HDA Intel PCH\n"
+          "                      HDA Intel PCH at 0xf7f10000 irq 32")
+    return sys_root, proc_root
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Peripherals discovery: serial subprocess timeouts vs sysfs + cache")
+    parser.add_argument("--usb-devices", type=int, default=12)
+    parser.add_argument("--hang-seconds", type=float, default=0.5)
+    parser.add_argument("--repeats", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        sys_root, proc_root = build_fake_tree(root, args.usb_devices)
+        discovery = SysfsPeripherals(sys_root=sys_root, proc_root=proc_root)
+
+        start = time.perf_counter()
+        snapshot = discovery.snapshot()
+        build_ms = (time.perf_counter() - start) * 1000
+
+        discovery.check_interval = 0
+        start = time.perf_counter()
+        for _ in range(args.repeats):
+            discovery.snapshot()
+        revalidate_ms = (time.perf_counter() - start) * 1000 / args.repeats
+
+        usb = snapshot["usb"]
+        print(f"sysfs build:        {build_ms:7.2f} ms  usb={len(usb)} "
+              f"keyboards={sum(d['is_keyboard'] for d in usb)} mice={sum(d['is_mouse'] for d in usb)} "
+              f"displays={snapshot['displays']} webcams={len(snapshot['webcams'])} audio={len(snapshot['audio'])}")
+        print(f"signature recheck:  {revalidate_ms:7.3f} ms per scan (builds={discovery.builds})")
+
+    def hanging():
+        time.sleep(args.hang_seconds)
+        return []
+
+    fallbacks = {name: hanging for name in ("usb", "audio", "displays")}
+    start = time.perf_counter()
+    for func in fallbacks.values():
+        func()
+    serial = time.perf_counter() - start
+    start = time.perf_counter()
+    PeripheralsScanner._run_fallbacks(fallbacks, use_cache=False)
+    parallel = time.perf_counter() - start
+    start = time.perf_counter()
+    PeripheralsScanner._run_fallbacks(fallbacks)
+    cached = time.perf_counter() - start
+    print(f"3 hanging fallbacks: serial {serial:.2f} s, parallel {parallel:.2f} s, cached {cached * 1000:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+import argparse
+import os
+import socket
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.network_test import NetworkScanner
+from app.core.ping_engine import PingEngine, UDPEchoServer
+
+
+def serial_subprocess(host: str, count: int):
+    rtts = []
+    start = time.perf_counter()
+    for _ in range(count):
+        rtts.append(NetworkScanner._system_ping(host, 1))
+        time.sleep(0.2)
+    return time.perf_counter() - start, rtts
+
+
+def report(name: str, elapsed: float, result):
+    print(f"{name:<26} {elapsed:7.2f} s  recv={result['packets_received']}/{result['packets_sent']} "
+          f"avg={result['avg_ms']} p99={result['p99_ms']} jitter={result['jitter_ms']} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ping engine: serial subprocess ping vs asyncio probes")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--count", type=int, default=20)
+    parser.add_argument("--interval", type=float, default=0.02)
+    parser.add_argument("--skip-subprocess", action="store_true")
+    args = parser.parse_args()
+
+    if not args.skip_subprocess:
+        elapsed, rtts = serial_subprocess(args.host, args.count)
+        received = [rtt for rtt in rtts if rtt is not None]
+        print(f"{'serial subprocess ping':<26} {elapsed:7.2f} s  recv={len(received)}/{args.count}")
+
+    engine = PingEngine(timeout=1.0, interval=args.interval)
+    if PingEngine.icmp_socket_type() is not None:
+        start = time.perf_counter()
+        result = engine.run([args.host], args.count, "icmp")[args.host]
+        report("async icmp", time.perf_counter() - start, result)
+
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(128)
+    engine.tcp_port = listener.getsockname()[1]
+    start = time.perf_counter()
+    result = engine.run(["127.0.0.1"], args.count, "tcp")["127.0.0.1"]
+    report("async tcp (local listener)", time.perf_counter() - start, result)
+    listener.close()
+
+    with UDPEchoServer() as server:
+        engine.udp_port = server.port
+        hosts = ["127.0.0.1", "localhost"]
+        start = time.perf_counter()
+        results = engine.run(hosts, args.count, "udp")
+        elapsed = time.perf_counter() - start
+        for host in hosts:
+            report(f"async udp echo {host}", elapsed, results[host])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.scan_codec import ScanDataCodec
+
+
+def synthetic_scan(cores: int = 64, sensors: int = 24, interfaces: int = 12, disks: int = 16) -> dict:
+    return {
+        "scan_id": "SCAN-20250101120000-abcdef12",
+        "timestamp": "2025-01-01T12:00:00.000000",
+        "device_id": "0b5c7f7e-8d1e-4c1e-9f3a-2f6c1d4e5a6b",
+        "cpu": {
+            "detected": True,
+            "model": "x86_64",
+            "cores_physical": cores // 2,
+            "cores_logical": cores,
+            "cpu_percent_overall": 23.4,
+            "cpu_percent_per_core": [round((i * 7.3) % 100, 2) for i in range(cores)],
+            "temperature_sensors": [
+                {"label": f"Core {i}", "current": 40.0 + i % 20, "high": 90.0, "critical": 100.0}
+                for i in range(sensors)
+            ],
+            "cpu_times": {"user": 123456.78, "system": 23456.78, "idle": 9876543.21},
+            "status": "Good",
+            "health_score": 100
+        },
+        "disks": [
+            {
+                "detected": True, "device": f"/dev/nvme{i}n1p1", "device_name": f"nvme{i}n1p1",
+                "mount_point": f"/mnt/data{i}", "type": "NVMe SSD", "file_system": "ext4",
+                "total_gb": 1863.02, "used_gb": 912.4, "free_gb": 950.62, "percent_used": 48.97,
+                "io_stats": {"read_count": 123456 * i, "write_count": 654321 * i,
+                             "read_bytes": 12.3, "write_bytes": 45.6},
+                "status": "Good", "health_score": 100
+            }
+            for i in range(disks)
+        ],
+        "network": {
+            "all_interfaces": [
+                {
+                    "name": f"eth{i}", "is_up": True, "speed_mbps": 10000, "mtu": 1500,
+                    "addresses": [
+                        {"type": "IPv4", "address": f"10.0.{i}.15", "netmask": "255.255.255.0"},
+                        {"type": "IPv6", "address": f"fe80::a00:27ff:fe4e:{i:04x}", "netmask": "ffff:ffff:ffff:ffff::"},
+                        {"type": "MAC", "address": f"08:00:27:4e:66:{i:02x}"}
+                    ]
+                }
+                for i in range(interfaces)
+            ]
+        },
+        "peripherals": {
+            "usb_devices": [f"Bus 00{i % 4} Device 0{i:02d}: ID 8087:0{i:03d} Intel Corp. USB Hub" for i in range(20)]
+        },
+        "overall_health": "Good",
+        "recommendations": ["النظام يعمل بشكل جيد - System is running well"]
+    }
+
+
+def bench_codec(codec: str, scan: dict, iterations: int) -> dict:
+    payload = ScanDataCodec.encode(scan, codec)
+    raw_size = len(json.dumps(scan).encode("utf-8"))
+    size = len(payload.encode("utf-8") if isinstance(payload, str) else payload)
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        ScanDataCodec.encode(scan, codec)
+    encode_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        ScanDataCodec.decode(payload, codec)
+    decode_seconds = time.perf_counter() - start
+
+    return {
+        "size": size,
+        "ratio": raw_size / size,
+        "encode_mb_s": raw_size * iterations / encode_seconds / 1e6,
+        "decode_mb_s": raw_size * iterations / decode_seconds / 1e6,
+        "encode_us": encode_seconds / iterations * 1e6,
+        "decode_us": decode_seconds / iterations * 1e6
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Size and throughput of scan_data codecs")
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+
+    scan = synthetic_scan()
+    print(f"scan JSON size: {len(json.dumps(scan))} bytes, codecs: {', '.join(ScanDataCodec.available_codecs())}")
+    print(f"{'codec':<14} {'bytes':>8} {'ratio':>6} {'enc MB/s':>9} {'dec MB/s':>9} {'enc us':>8} {'dec us':>8}")
+    for codec in ScanDataCodec.available_codecs():
+        r = bench_codec(codec, scan, args.iterations)
+        print(f"{codec:<14} {r['size']:>8} {r['ratio']:>6.2f} {r['encode_mb_s']:>9.1f} "
+              f"{r['decode_mb_s']:>9.1f} {r['encode_us']:>8.1f} {r['decode_us']:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
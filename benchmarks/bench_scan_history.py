@@ -0,0 +1,94 @@
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.database import Database
+
+
+def populate(db: Database, rows: int, devices: int, subscriptions: int):
+    start = datetime(2025, 1, 1)
+    step_seconds = (365 * 24 * 3600) / rows
+    rng = random.Random(42)
+    batch = []
+
+    with db.connection() as conn:
+        for i in range(rows):
+            created_at = start + timedelta(seconds=i * step_seconds)
+            batch.append((
+                f"SCAN-{i:08d}",
+                f"SUB{rng.randrange(subscriptions):05d}",
+                f"device-{rng.randrange(devices):05d}",
+                '{"overall_health": "Good"}',
+                created_at.strftime('%Y-%m-%d %H:%M:%S')
+            ))
+            if len(batch) >= 50000:
+                conn.executemany('''
+                    INSERT INTO scan_history (scan_id, subscription_code, device_id, scan_data, created_at)
+                    VALUES (?, ?, ?, ?, ?)
+                ''', batch)
+                batch.clear()
+        if batch:
+            conn.executemany('''
+                INSERT INTO scan_history (scan_id, subscription_code, device_id, scan_data, created_at)
+                VALUES (?, ?, ?, ?, ?)
+            ''', batch)
+        conn.commit()
+        conn.execute('ANALYZE')
+
+
+def timed(name: str, func, repeat: int = 50):
+    durations = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        durations.append((time.perf_counter() - start) * 1000)
+    durations.sort()
+    print(f"{name:<34} median={durations[len(durations) // 2]:7.3f} ms  "
+          f"max={durations[-1]:7.3f} ms  rows={result['count']}")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="scan_history lookups over synthetic rows")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--devices", type=int, default=5000)
+    parser.add_argument("--subscriptions", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(os.path.join(tmp, "history.db"))
+
+        start = time.perf_counter()
+        populate(db, args.rows, args.devices, args.subscriptions)
+        print(f"inserted {args.rows} rows in {time.perf_counter() - start:.1f} s")
+
+        with db.connection() as conn:
+            plan = conn.execute('''
+                EXPLAIN QUERY PLAN SELECT id FROM scan_history
+                WHERE device_id = ? AND (created_at, id) < (?, ?)
+                ORDER BY created_at DESC, id DESC LIMIT 51
+            ''', ("device-00001", "2025-06-01 00:00:00", 10)).fetchall()
+            print("device page plan:", "; ".join(row[3] for row in plan))
+
+        timed("latest 50", lambda: db.list_scan_history(limit=50))
+        timed("device first page", lambda: db.list_scan_history(device_id="device-00042", limit=50))
+        first = db.list_scan_history(device_id="device-00042", limit=50)
+        timed("device next page (cursor)",
+              lambda: db.list_scan_history(device_id="device-00042", limit=50, cursor=first["next_cursor"]))
+        timed("subscription first page", lambda: db.list_scan_history(subscription_code="SUB00007", limit=50))
+        timed("time range (1 day)", lambda: db.list_scan_history(
+            since=datetime(2025, 6, 1), until=datetime(2025, 6, 2), limit=100))
+        timed("device + time range", lambda: db.list_scan_history(
+            device_id="device-00042", since=datetime(2025, 3, 1), until=datetime(2025, 9, 1), limit=50))
+        timed("scan by id", lambda: {"count": 1 if db.get_scan_result("SCAN-00500000") else 0})
+
+
+if __name__ == "__main__":
+    main()
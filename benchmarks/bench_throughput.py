@@ -0,0 +1,84 @@
+import argparse
+import os
+import socket
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.throughput import ThroughputServer, ThroughputClient, _payload_file, _send_for, _receive_all
+
+
+def copy_send(sock: socket.socket, deadline: float, counter):
+    payload = os.urandom(16 * 1024 * 1024)
+    offset = 0
+    while time.monotonic() < deadline:
+        chunk = payload[offset:offset + 64 * 1024]
+        sock.sendall(chunk)
+        counter[0] += len(chunk)
+        offset = (offset + len(chunk)) % len(payload)
+
+
+def copy_receive(sock: socket.socket, counter):
+    while True:
+        data = sock.recv(64 * 1024)
+        if not data:
+            break
+        counter[0] += len(data)
+
+
+def single_stream(duration: float, zero_copy: bool):
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(1)
+    received = [0]
+
+    def receiver():
+        conn, _ = listener.accept()
+        if zero_copy:
+            _receive_all(conn, received)
+        else:
+            copy_receive(conn, received)
+        conn.close()
+
+    thread = threading.Thread(target=receiver)
+    thread.start()
+    sock = socket.create_connection(listener.getsockname())
+    sent = [0]
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    if zero_copy:
+        with _payload_file() as payload:
+            _send_for(sock, payload, time.monotonic() + duration, sent)
+    else:
+        copy_send(sock, time.monotonic() + duration, sent)
+    sock.close()
+    thread.join()
+    listener.close()
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+    return received[0] * 8 / wall / 1e9, cpu / (received[0] / 1e9)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Throughput test: copying buffers vs sendfile/recv_into")
+    parser.add_argument("--duration", type=float, default=3.0)
+    parser.add_argument("--streams", type=int, default=4)
+    args = parser.parse_args()
+
+    for name, zero_copy in (("copying send/recv", False), ("sendfile + recv_into", True)):
+        gbps, cpu_per_gb = single_stream(args.duration, zero_copy)
+        print(f"{name:<22} {gbps:6.2f} Gbit/s  {cpu_per_gb:6.3f} CPU-s per GB")
+
+    with ThroughputServer("127.0.0.1", 0) as server:
+        client = ThroughputClient("127.0.0.1", server.port, streams=args.streams, duration=args.duration,
+                                  warmup=args.duration / 4)
+        result = client.run()
+        for phase in ("download", "upload"):
+            data = result[phase]
+            print(f"{phase:<9} {data['goodput_mbps'] / 1000:6.2f} Gbit/s over {args.streams} streams, "
+                  f"fairness={data['fairness_index']} retransmits={data['retransmits']}")
+
+
+if __name__ == "__main__":
+    main()
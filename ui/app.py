@@ -1,4 +1,4 @@
-from flask import Flask, render_template, request, jsonify, send_file
+from flask import Flask, render_template, request, jsonify, send_file, Response, stream_with_context
 import requests
 import uuid
 import os
@@ -54,7 +54,10 @@ def start_scan():
         
         response = requests.post(
             f"{API_BASE_URL}/api/scan/start",
-            params={'subscription_code': subscription_code, 'device_id': device_id}
+            params={
+                'subscription_code': subscription_code, 'device_id': device_id,
+                'refresh_inventory': data.get('refresh_inventory', False)
+            }
         )
         return jsonify(response.json())
     except Exception as e:
@@ -134,9 +137,10 @@ def test_cpu_stress():
     try:
         data = request.json or {}
         duration = data.get('duration', 5)
+        kernel = data.get('kernel', 'fp_fma')
         response = requests.post(
             f"{API_BASE_URL}/api/scan/test/cpu-stress",
-            params={'duration': duration}
+            params={'duration': duration, 'kernel': kernel}
         )
         return jsonify(response.json())
     except Exception as e:
@@ -158,15 +162,81 @@ def test_ram_stress():
         return jsonify({"success": False, "error": str(e)}), 500
 
 
+@app.route('/api/test/ram-benchmark', methods=['POST'])
+def test_ram_benchmark():
+    try:
+        data = request.json or {}
+        params = {}
+        if data.get('threads') is not None:
+            params['threads'] = data['threads']
+        if data.get('working_sets_kb'):
+            params['working_sets_kb'] = data['working_sets_kb']
+        response = requests.post(
+            f"{API_BASE_URL}/api/scan/test/ram-benchmark",
+            params=params
+        )
+        return jsonify(response.json())
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)}), 500
+
+
+@app.route('/api/test/ram-integrity', methods=['POST'])
+def test_ram_integrity():
+    try:
+        data = request.json or {}
+        params = {'size_mb': data.get('size_mb', 1024)}
+        if data.get('workers') is not None:
+            params['workers'] = data['workers']
+        if data.get('patterns'):
+            params['patterns'] = data['patterns']
+        response = requests.post(
+            f"{API_BASE_URL}/api/scan/test/ram-integrity",
+            params=params
+        )
+        return jsonify(response.json())
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)}), 500
+
+
 @app.route('/api/test/disk-speed', methods=['POST'])
 def test_disk_speed():
     try:
         data = request.json or {}
         mount_point = data.get('mount_point', None)
         test_size_mb = data.get('test_size_mb', 50)
+        streaming = data.get('streaming', False)
+        chunk_size_mb = data.get('chunk_size_mb', 4)
         response = requests.post(
             f"{API_BASE_URL}/api/scan/test/disk-speed",
-            params={'mount_point': mount_point, 'test_size_mb': test_size_mb}
+            params={
+                'mount_point': mount_point,
+                'test_size_mb': test_size_mb,
+                'streaming': streaming,
+                'chunk_size_mb': chunk_size_mb
+            }
+        )
+        return jsonify(response.json())
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)}), 500
+
+
+@app.route('/api/test/disk-benchmark', methods=['POST'])
+def test_disk_benchmark():
+    try:
+        data = request.json or {}
+        params = {
+            'file_size_mb': data.get('file_size_mb', 256),
+            'queue_depth': data.get('queue_depth', 4),
+            'runtime': data.get('runtime', 1.0),
+            'direct': data.get('direct', True)
+        }
+        if data.get('mount_point'):
+            params['mount_point'] = data['mount_point']
+        if data.get('block_sizes_kb'):
+            params['block_sizes_kb'] = data['block_sizes_kb']
+        response = requests.post(
+            f"{API_BASE_URL}/api/scan/test/disk-benchmark",
+            params=params
         )
         return jsonify(response.json())
     except Exception as e:
@@ -179,23 +249,50 @@ def test_gpu_stress():
         data = request.json or {}
         duration = data.get('duration', 10)
         gpu_id = data.get('gpu_id', 0)
+        sample_interval = data.get('sample_interval', 0.5)
+        load_generator = data.get('load_generator', 'auto')
         response = requests.post(
             f"{API_BASE_URL}/api/scan/test/gpu-stress",
-            params={'duration': duration, 'gpu_id': gpu_id}
+            params={
+                'duration': duration, 'gpu_id': gpu_id,
+                'sample_interval': sample_interval, 'load_generator': load_generator
+            }
         )
         return jsonify(response.json())
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
 
+@app.route('/api/gpu-telemetry', methods=['GET'])
+def gpu_telemetry():
+    try:
+        response = requests.get(f"{API_BASE_URL}/api/scan/gpu-telemetry")
+        return jsonify(response.json()), response.status_code
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)}), 500
+
+
+@app.route('/api/inventory', methods=['GET'])
+def hardware_inventory():
+    try:
+        response = requests.get(
+            f"{API_BASE_URL}/api/scan/inventory",
+            params={'refresh': request.args.get('refresh', 'false')}
+        )
+        return jsonify(response.json()), response.status_code
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)}), 500
+
+
 @app.route('/api/test/battery-drain', methods=['POST'])
 def test_battery_drain():
     try:
         data = request.json or {}
         duration = data.get('duration', 30)
+        sample_interval = data.get('sample_interval', 0.05)
         response = requests.post(
             f"{API_BASE_URL}/api/scan/test/battery-drain",
-            params={'duration': duration}
+            params={'duration': duration, 'sample_interval': sample_interval}
         )
         return jsonify(response.json())
     except Exception as e:
@@ -205,7 +302,9 @@ def test_battery_drain():
 @app.route('/api/test/internet-speed', methods=['POST'])
 def test_internet_speed():
     try:
-        response = requests.post(f"{API_BASE_URL}/api/scan/test/internet-speed")
+        data = request.json or {}
+        params = {key: data[key] for key in ('server', 'port', 'streams', 'duration') if data.get(key)}
+        response = requests.post(f"{API_BASE_URL}/api/scan/test/internet-speed", params=params)
         return jsonify(response.json())
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
@@ -217,14 +316,111 @@ def test_network_ping():
         data = request.json or {}
         host = data.get('host', '8.8.8.8')
         count = data.get('count', 20)
+        params = {'host': host, 'count': count, 'method': data.get('method', 'auto')}
+        if data.get('hosts'):
+            params['hosts'] = data['hosts']
+        if data.get('port'):
+            params['port'] = data['port']
         response = requests.post(
             f"{API_BASE_URL}/api/scan/test/network-ping",
-            params={'host': host, 'count': count}
+            params=params
         )
         return jsonify(response.json())
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
 
+@app.route('/api/jobs/<test_type>', methods=['POST'])
+def submit_job(test_type):
+    try:
+        data = request.json or {}
+        response = requests.post(
+            f"{API_BASE_URL}/api/jobs/{test_type}",
+            params=data
+        )
+        return jsonify(response.json()), response.status_code
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)}), 500
+
+
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    try:
+        response = requests.get(
+            f"{API_BASE_URL}/api/jobs/{job_id}",
+            params={'include_samples': request.args.get('include_samples', 'false')}
+        )
+        return jsonify(response.json()), response.status_code
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)}), 500
+
+
+@app.route('/api/jobs/<job_id>', methods=['DELETE'])
+def cancel_job(job_id):
+    try:
+        response = requests.delete(f"{API_BASE_URL}/api/jobs/{job_id}")
+        return jsonify(response.json()), response.status_code
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)}), 500
+
+
+@app.route('/api/disk-activity', methods=['GET'])
+def disk_activity():
+    try:
+        params = {}
+        if request.args.get('window'):
+            params['window'] = request.args.get('window')
+        response = requests.get(f"{API_BASE_URL}/api/scan/disk-activity", params=params)
+        return jsonify(response.json()), response.status_code
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)}), 500
+
+
+@app.route('/api/disk-activity/stream', methods=['GET'])
+def stream_disk_activity():
+    try:
+        params = {'interval': request.args.get('interval', 1.0)}
+        if request.args.get('count'):
+            params['count'] = request.args.get('count')
+        response = requests.get(
+            f"{API_BASE_URL}/api/scan/disk-activity/stream",
+            params=params,
+            stream=True
+        )
+        
+        if response.status_code != 200:
+            return jsonify(response.json()), response.status_code
+        
+        return Response(
+            stream_with_context(response.iter_content(chunk_size=None)),
+            mimetype='text/event-stream',
+            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+        )
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)}), 500
+
+
+@app.route('/api/jobs/<job_id>/stream', methods=['GET'])
+def stream_job(job_id):
+    try:
+        response = requests.get(
+            f"{API_BASE_URL}/api/jobs/{job_id}/stream",
+            params={key: request.args[key] for key in ('since',) if key in request.args},
+            headers={key: request.headers[key] for key in ('Last-Event-ID',) if key in request.headers},
+            stream=True
+        )
+        
+        if response.status_code != 200:
+            return jsonify(response.json()), response.status_code
+        
+        return Response(
+            stream_with_context(response.iter_content(chunk_size=None)),
+            mimetype='text/event-stream',
+            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+        )
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)}), 500
+
+
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=5000, debug=True)